@@ -0,0 +1,261 @@
+#!/usr/bin/env python3
+"""
+Claude Code Response Cache
+Stores parsed Claude Code results on disk keyed by document content, so
+re-scans of an identical PDF skip the CLI call entirely; SemanticCache
+extends this to near-identical scans
+"""
+
+import functools
+import hashlib
+import itertools
+import json
+import math
+import os
+import tempfile
+import threading
+import warnings
+import zlib
+from pathlib import Path
+
+
+def file_sha256(path):
+    """SHA-256 hex digest of a file's contents"""
+    with open(path, 'rb') as fh:
+        if hasattr(hashlib, 'file_digest'):
+            return hashlib.file_digest(fh, 'sha256').hexdigest()
+        digest = hashlib.sha256()
+        for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+            digest.update(chunk)
+        return digest.hexdigest()
+
+
+def cache_key(file_path, prompt_path):
+    """Key for a document/prompt pair; changes when either file changes"""
+    return hashlib.sha256(
+        f"{file_sha256(file_path)}:{file_sha256(prompt_path)}".encode()
+    ).hexdigest()
+
+
+def load(cache_dir, namespace, key):
+    """Cached result for key, or None on a miss or unreadable entry"""
+    try:
+        with open(Path(cache_dir) / namespace / f"{key}.json", 'r') as f:
+            result = json.load(f)
+    except (OSError, ValueError):
+        return None
+    return result if isinstance(result, dict) else None
+
+
+# Per-call fields kept out of cache entries: the full prompt and raw reply
+# are large, and a cache hit must not log them as if Claude had been called
+_UNCACHED_FIELDS = frozenset(['_prompt', '_response'])
+
+
+def cacheable(result):
+    """Copy of a Claude result without its per-call prompt/response fields"""
+    return {k: v for k, v in result.items() if k not in _UNCACHED_FIELDS}
+
+
+def store(cache_dir, namespace, key, result):
+    """Write result atomically; cache failures never break processing"""
+    folder = Path(cache_dir) / namespace
+    try:
+        folder.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=folder, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(result, f)
+            os.replace(tmp_path, folder / f"{key}.json")
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except (OSError, TypeError, ValueError) as e:
+        print(f"Warning: Could not write response cache entry: {e}")
+
+
+def cached(namespace, prompt_attr):
+    """
+    Cache a DocumentClassifier ``method(self, file_path, corrections=None, **kwargs)``
+
+    Lookups are keyed by the SHA-256 of the document and of the prompt file
+    named by ``prompt_attr``. Caching is skipped when ``self.cache_dir`` is
+    None or corrections are given (re-processing must reach Claude), and
+    only real Claude responses (those carrying ``_response``) are stored,
+    never the fallback dicts returned on errors. Entries omit ``_prompt``
+    and ``_response``; hits are returned with ``_cache_hit`` set.
+    """
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, file_path, corrections=None, **kwargs):
+            cache_dir = getattr(self, 'cache_dir', None)
+            prompt_path = getattr(self, prompt_attr)
+
+            if cache_dir is None or corrections:
+                return method(self, file_path, corrections=corrections, **kwargs)
+
+            try:
+                key = cache_key(file_path, prompt_path)
+            except OSError:
+                # Missing document/prompt: let the method raise its own error
+                return method(self, file_path, corrections=corrections, **kwargs)
+
+            result = load(cache_dir, namespace, key)
+            if result is not None:
+                print(f"✓ Using cached {namespace} result for {Path(file_path).name}")
+                result['_cache_hit'] = True
+                return result
+
+            result = method(self, file_path, corrections=corrections, **kwargs)
+            if isinstance(result, dict) and '_response' in result:
+                store(cache_dir, namespace, key, cacheable(result))
+            return result
+
+        return wrapper
+    return decorator
+
+
+def pdf_text(path, max_pages=None):
+    """Text layer of a PDF (optionally only its first pages) via PyPDF2, or '' when unavailable"""
+    try:
+        with warnings.catch_warnings():
+            # PyPDF2 3.x warns on import that it is deprecated
+            warnings.simplefilter('ignore', DeprecationWarning)
+            from PyPDF2 import PdfReader
+    except ImportError:
+        return ''
+    try:
+        reader = PdfReader(str(path))
+        pages = itertools.islice(reader.pages, max_pages)
+        return "\n".join(page.extract_text() or '' for page in pages)
+    except Exception:
+        return ''
+
+
+def trigram_vector(text, dims=4096):
+    """
+    Unit-length sparse vector of hashed character trigrams
+
+    Normalizes case and whitespace first, so re-scans with minor OCR noise
+    land close together. Returns None for text too short to compare.
+    """
+    text = ' '.join(text.lower().split())
+    if len(text) < 3:
+        return None
+
+    counts = {}
+    for i in range(len(text) - 2):
+        bucket = str(zlib.crc32(text[i:i + 3].encode()) % dims)
+        counts[bucket] = counts.get(bucket, 0) + 1
+
+    norm = math.sqrt(sum(c * c for c in counts.values()))
+    return {k: c / norm for k, c in counts.items()}
+
+
+def cosine(a, b):
+    """Cosine similarity of two unit-length sparse vectors"""
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(k, 0.0) for k, v in a.items())
+
+
+class SemanticCache:
+    """
+    Near-duplicate result cache for documents whose text differs only by
+    scan noise
+
+    Entries are (vector, classification) pairs appended to ``index.jsonl``
+    in cache_dir; a lookup returns a copy of the classification of the most
+    similar entry at or above ``threshold``. Only the fields in
+    ``RESULT_FIELDS`` are kept, so a hit never carries another document's
+    prompt, response or metadata. ``embed`` maps a PDF path to a
+    unit-length sparse vector (dict) or None, and defaults to PyPDF2 text
+    trigrams.
+    """
+
+    RESULT_FIELDS = ('category', 'confidence', 'is_cps_related', 'reasoning')
+
+    # Classifications below this confidence (the classifier prompt's own
+    # clarification cutoff) are never reused
+    MIN_CONFIDENCE = 0.7
+
+    def __init__(self, cache_dir, threshold=0.95, embed=None, max_entries=1000):
+        self.index_path = Path(cache_dir) / 'index.jsonl'
+        self.threshold = threshold
+        self.embed = embed or (lambda path: trigram_vector(pdf_text(path)))
+        self.max_entries = max_entries
+        self._entries = None  # Loaded from disk on first use
+        self._lock = threading.Lock()  # Classifications may run on a thread pool
+
+    def _load(self):
+        with self._lock:
+            if self._entries is None:
+                self._entries = []
+                try:
+                    with open(self.index_path, 'r') as f:
+                        for line in f:
+                            try:
+                                self._entries.append(json.loads(line))
+                            except ValueError:
+                                continue  # Torn final line from an interrupted append
+                except OSError:
+                    pass
+                del self._entries[:-self.max_entries]
+            return self._entries
+
+    def lookup(self, vector):
+        """Copy of the best cached classification for vector, or None below the threshold"""
+        if not vector:
+            return None
+
+        best, best_score = None, self.threshold
+        for entry in list(self._load()):
+            score = cosine(vector, entry['vector'])
+            if score >= best_score:
+                best, best_score = entry['result'], score
+        if best is None:
+            return None
+        return {**best, '_cache_hit': True}
+
+    def add(self, vector, result):
+        """
+        Remember the classification fields of result for vector
+
+        Results that need clarification or fall below MIN_CONFIDENCE are
+        skipped, so a near-duplicate never inherits an unsettled category
+        and still reaches the clarification path. New entries are appended to the index; it is only rewritten, keeping
+        the newest three quarters of max_entries, once it grows past max_entries.
+        """
+        if not vector:
+            return
+        if result.get('needs_clarification') or (result.get('confidence') or 0) < self.MIN_CONFIDENCE:
+            return
+
+        entry = {
+            'vector': vector,
+            'result': {k: result[k] for k in self.RESULT_FIELDS if k in result}
+        }
+        entries = self._load()
+        with self._lock:
+            entries.append(entry)
+            try:
+                self.index_path.parent.mkdir(parents=True, exist_ok=True)
+                if len(entries) > self.max_entries:
+                    del entries[:-(self.max_entries * 3 // 4 or 1)]
+                    self._rewrite(entries)
+                else:
+                    with open(self.index_path, 'a') as f:
+                        f.write(json.dumps(entry) + '\n')
+            except OSError as e:
+                print(f"Warning: Could not write semantic cache index: {e}")
+
+    def _rewrite(self, entries):
+        """Replace the index file atomically with entries"""
+        fd, tmp_path = tempfile.mkstemp(dir=self.index_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.writelines(json.dumps(entry) + '\n' for entry in entries)
+            os.replace(tmp_path, self.index_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Fast-Path Classifier
+Keyword scoring over a document's first page and filename that settles
+clear-cut documents (an electric bill, a DMV renewal) without calling
+Claude Code
+"""
+
+import os
+import re
+from pathlib import Path
+
+from _cache import pdf_text
+
+# Distinctive keywords per classifier category (see prompts/classifier.md).
+# A document scores one point per distinct keyword found.
+CATEGORY_SIGNALS = {
+    'CPS-MEDICAL': ('pediatric', 'pediatrics', 'well child', 'immunization record'),
+    'CPS-EXPENSE': ('school supplies', 'field trip', 'summer camp', 'tuition'),
+    'CPS-SCHOOLWORK': ('report card', 'homework', 'worksheet', 'teacher', 'grade level'),
+    'CPS-CUSTODY': ('custody', 'visitation', 'parenting time', 'exchange schedule'),
+    'CPS-COMMUNICATION': ('co-parent', 'ourfamilywizard', 'talkingparents'),
+    'CPS-LEGAL': ('parenting plan', 'custody order', 'family court', 'guardian ad litem'),
+    'PERSONAL-EXPENSE': ('restaurant', 'grocery', 'dining', 'purchase', 'order total'),
+    'RECEIPT': ('receipt', 'subtotal', 'change due', 'thank you for shopping'),
+    'INVOICE': ('invoice', 'invoice number', 'net 30', 'remit to', 'bill to'),
+    'TAX-DOCUMENT': ('internal revenue service', 'w-2', '1099', 'form 1040', 'tax year'),
+    'BANK-STATEMENT': ('checking account', 'savings account', 'beginning balance',
+                       'ending balance', 'deposits'),
+    'INVESTMENT': ('brokerage', 'portfolio', 'dividends', '401k', 'ira', 'shares'),
+    'PERSONAL-MEDICAL': ('patient', 'provider', 'date of service', 'diagnosis',
+                         'office visit', 'lab work', 'medical bill', 'copay'),
+    'PRESCRIPTION': ('prescription', 'pharmacy', 'rx', 'refills', 'dosage'),
+    'INSURANCE': ('life insurance', 'disability insurance', 'health insurance',
+                  'explanation of benefits', 'policyholder'),
+    'MORTGAGE': ('mortgage', 'escrow', 'principal', 'loan number'),
+    'UTILITY': ('kwh', 'electric', 'water', 'sewer', 'gas service', 'internet',
+                'meter', 'billing date', 'amount due', 'utility'),
+    'LEASE': ('lease', 'landlord', 'tenant', 'security deposit', 'rent'),
+    'HOME-MAINTENANCE': ('plumbing', 'hvac', 'roofing', 'pest control', 'handyman'),
+    'PROPERTY-TAX': ('property tax', 'tax assessor', 'assessed value', 'parcel'),
+    'AUTO-INSURANCE': ('auto insurance', 'vehicle', 'policy number', 'collision',
+                       'comprehensive', 'premium', 'declarations'),
+    'AUTO-MAINTENANCE': ('oil change', 'tire rotation', 'brake', 'mileage',
+                         'vin', 'service advisor'),
+    'AUTO-REGISTRATION': ('registration', 'dmv', 'motor vehicles', 'license plate',
+                          'title', 'emissions'),
+    'CONTRACT': ('agreement', 'hereby', 'party', 'parties', 'terms and conditions'),
+    'LEGAL-DOCUMENT': ('notary', 'affidavit', 'attorney', 'power of attorney'),
+    'TRAVEL-BOOKING': ('itinerary', 'confirmation number', 'check-in', 'boarding',
+                       'reservation'),
+    'TRAVEL-RECEIPT': ('folio', 'room charge', 'baggage fee', 'airfare'),
+    'GENERAL': (),
+    'REFERENCE': ('user manual', 'user guide', 'table of contents', 'warranty'),
+}
+
+# Category order for score vectors
+CATEGORIES = tuple(CATEGORY_SIGNALS)
+
+# Keyword -> indices of the categories it signals (the category x keyword
+# matrix, stored by column)
+_KEYWORD_CATEGORIES = {}
+for index, keywords in enumerate(CATEGORY_SIGNALS.values()):
+    for keyword in keywords:
+        _KEYWORD_CATEGORIES.setdefault(keyword.lower(), []).append(index)
+del index, keywords, keyword
+
+# Every keyword in one alternation, longest first, inside a lookahead so a
+# single scan reports keywords that overlap ("custody" / "custody order")
+_SIGNAL_PATTERN = re.compile(
+    r'(?=\b(' + '|'.join(
+        re.escape(keyword) for keyword in sorted(_KEYWORD_CATEGORIES, key=len, reverse=True)
+    ) + r')\b)',
+    re.I
+)
+
+# Whether a document is about the children can't be settled by keywords
+_CHILD_NAMES = re.compile(r'\b(?:jacob|morgan)\b', re.I)
+
+# Decision thresholds: enough keywords, and a clear lead over the runner-up
+MIN_SCORE = 3
+MIN_MARGIN = 2
+
+# Skip first pages with more text than this (not a typical scanned bill)
+MAX_TEXT_CHARS = 1024 * 1024
+
+
+def first_page_text(file_path):
+    """Text layer of a PDF's first page via PyPDF2, or '' when unavailable"""
+    return pdf_text(file_path, max_pages=1)
+
+
+def score_vector(text):
+    """Distinct signal keywords found in text, per category in CATEGORIES order"""
+    scores = [0] * len(CATEGORIES)
+    for keyword in {match.lower() for match in _SIGNAL_PATTERN.findall(text)}:
+        for index in _KEYWORD_CATEGORIES[keyword]:
+            scores[index] += 1
+    return scores
+
+
+def score_categories(text):
+    """Number of distinct signal keywords per category found in text"""
+    return dict(zip(CATEGORIES, score_vector(text)))
+
+
+def fast_classify(file_path, text=None):
+    """
+    Classify a document from keywords alone when the answer is clear-cut
+
+    Args:
+        file_path: Path to the PDF document
+        text: Optional pre-extracted first-page text
+
+    Returns:
+        dict: Classification in the classifier's output format, or None when
+            the document should go to Claude Code
+    """
+    if text is None:
+        text = first_page_text(file_path)
+    if not text or len(text) > MAX_TEXT_CHARS:
+        return None
+
+    # Filename words count too ("ConEdison_electric_bill.pdf")
+    text = f"{Path(file_path).stem.replace('_', ' ')}\n{text}"
+
+    if _CHILD_NAMES.search(text):
+        return None
+
+    scores = score_vector(text)
+    top = max(range(len(scores)), key=scores.__getitem__)
+    category, best = CATEGORIES[top], scores[top]
+    runner_up = max(score for index, score in enumerate(scores) if index != top)
+
+    if best < MIN_SCORE or best - runner_up < MIN_MARGIN or category.startswith('CPS-'):
+        return None
+
+    return {
+        'category': category,
+        'confidence': 0.95,
+        'is_cps_related': False,
+        'metadata': {
+            'child': None,
+            'date': None,
+            'title': Path(file_path).stem
+        },
+        'needs_clarification': False,
+        'clarification_question': None,
+        'reasoning': f"Fast-path keyword match ({best} signals, next best {runner_up})"
+    }
+
+
+if __name__ == '__main__':
+    import sys
+
+    for path in sys.argv[1:]:
+        result = fast_classify(path)
+        print(f"{os.path.basename(path)}: {result['category'] if result else 'needs Claude Code'}")
@@ -76,6 +76,11 @@ class BasicMemoryNoteCreator:
         self.utility_template_path = self.personal_template_dir / "Template-Utility.md"
         self.auto_template_path = self.personal_template_dir / "Template-Auto.md"
 
+    @staticmethod
+    def _sanitize_filename(text):
+        """Strip characters that are unsafe in filenames and hyphenate spaces"""
+        return re.sub(r'[^\w\s-]', '', text).strip().replace(' ', '-')
+
     def create_medical_note(self, metadata):
         """
         Create a medical note from template
@@ -346,7 +351,7 @@ class BasicMemoryNoteCreator:
         vendor = metadata.get('vendor', 'Expense')
 
         # Sanitize filename
-        vendor_clean = re.sub(r'[^\w\s-]', '', vendor).strip().replace(' ', '-')
+        vendor_clean = self._sanitize_filename(vendor)
         filename = f"{date_str}_{child}_{vendor_clean}_Expense.md"
 
         # Create note
@@ -444,8 +449,8 @@ tags: [medical, personal]
 """
 
         # Generate filename: YYYY-MM-DD-{provider}-{type}.md
-        provider_clean = re.sub(r'[^\\w\\s-]', '', provider).strip().replace(' ', '-')
-        type_clean = re.sub(r'[^\\w\\s-]', '', visit_type).strip().replace(' ', '-')
+        provider_clean = self._sanitize_filename(provider)
+        type_clean = self._sanitize_filename(visit_type)
         base_filename = f"{date_val}-{provider_clean}-{type_clean}.md"
 
         # Save to Personal/Medical/
@@ -534,7 +539,7 @@ tags: [expense, personal, {category}]
 """
 
         # Generate filename: YYYY-MM-DD-{vendor}.md
-        vendor_clean = re.sub(r'[^\\w\\s-]', '', vendor).strip().replace(' ', '-')
+        vendor_clean = self._sanitize_filename(vendor)
         base_filename = f"{date_val}-{vendor_clean}.md"
 
         # Save to Personal/Expenses/{category}/
@@ -627,7 +632,7 @@ tags: [utility, {utility_type}]
 {metadata.get('notes', '')}
 """
 
-        provider_clean = re.sub(r'[^\\w\\s-]', '', provider).strip().replace(' ', '-')
+        provider_clean = self._sanitize_filename(provider)
         base_filename = f"{date_val}-{provider_clean}-{utility_type}.md"
 
         utility_folder = self.personal_path / "Utilities" / utility_type
@@ -766,8 +771,8 @@ tags: [auto, {auto_type}]"""
 {metadata.get('notes', '')}
 """
 
-        provider_clean = re.sub(r'[^\w\s-]', '', provider).strip().replace(' ', '-')
-        type_clean = re.sub(r'[^\w\s-]', '', auto_type).strip().replace(' ', '-')
+        provider_clean = self._sanitize_filename(provider)
+        type_clean = self._sanitize_filename(auto_type)
         base_filename = f"{date_val}-{provider_clean}-{type_clean}.md"
 
         # Use Auto/ instead of Automotive/
@@ -4,17 +4,173 @@ Document Classifier
 Uses Claude Code CLI to classify and extract metadata from documents
 """
 
+import codecs
 import json
+import selectors
+import signal
 import subprocess
+import time
 import tempfile
 import os
+import re
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
 
+from _cache import SemanticCache, cached
+from _fast_classify import fast_classify
+
+try:
+    # C-backed parser for Claude Code responses
+    import orjson
+
+    def _loads(text):
+        return orjson.loads(text)
+except ImportError:
+    def _loads(text):
+        return json.loads(text)
+
+
+@lru_cache(maxsize=None)
+def _read_prompt(path, mtime_ns):
+    """Prompt file contents, cached until the file's mtime changes"""
+    with open(path, 'r') as f:
+        return f.read()
+
+
+def _load_prompt(prompt_path):
+    """Read a prompt file, reusing the cached text in long-running processes"""
+    path = os.fspath(prompt_path)
+    return _read_prompt(path, os.stat(path).st_mtime_ns)
+
+
+# Characters that change the scanner's state; everything else is skipped
+# by a C-level regex search rather than a Python loop step
+_JSON_STRUCTURE = re.compile(r'["\\\\{}\[\]]')
+
+
+def _scan_json(text, opener):
+    """
+    First parseable JSON value in text starting with opener ('{' or '[')
+
+    Tracks nesting depth outside of strings (honoring backslash escapes),
+    jumping from one quote/bracket/backslash to the next, and parses the
+    span once depth returns to zero. Prose braces that don't parse are
+    skipped. Returns None when no candidate parses.
+    """
+    stream = _JsonStream(opener)
+    stream.feed(text)
+    return stream.value
+
+
+class _JsonStream:
+    """
+    Incremental _scan_json for output that arrives in chunks
+
+    feed() resumes scanning where the previous chunk stopped and returns
+    True once a complete, parseable JSON value has been seen; the value is
+    then in ``self.value``.
+    """
+
+    def __init__(self, opener='{'):
+        self.opener = opener
+        self.value = None
+        self._chunks = []
+        self._text = ''
+        self._pos = 0
+        self._start = -1
+        self._depth = 0
+        self._in_string = False
+
+    @property
+    def text(self):
+        if self._chunks:
+            self._text += ''.join(self._chunks)
+            self._chunks = []
+        return self._text
+
+    def feed(self, chunk):
+        self._chunks.append(chunk)
+        if self.value is not None:
+            return True
+
+        text = self.text
+        i = self._pos
+        while True:
+            if self._start == -1:
+                i = text.find(self.opener, i)
+                if i == -1:
+                    self._pos = len(text)
+                    return False
+                self._start = i
+                self._depth = 0
+                self._in_string = False
+
+            match = _JSON_STRUCTURE.search(text, i)
+            if match is None:
+                # May point past the end when a chunk ends in a backslash
+                self._pos = max(i, len(text))
+                return False
+
+            i = match.start()
+            ch = text[i]
+            if self._in_string:
+                if ch == '\\':
+                    # Skip the escaped character
+                    i += 2
+                    continue
+                if ch == '"':
+                    self._in_string = False
+            elif ch == '"':
+                self._in_string = True
+            elif ch == '{' or ch == '[':
+                self._depth += 1
+            elif ch == '}' or ch == ']':
+                self._depth -= 1
+                if self._depth == 0:
+                    try:
+                        self.value = _loads(text[self._start:i + 1])
+                        self._pos = i + 1
+                        return True
+                    except ValueError:
+                        # Not JSON after all; retry from the next opener
+                        i = self._start + 1
+                        self._start = -1
+                        continue
+            i += 1
+
+
+def _find_json(text, opener):
+    """Parse JSON from the first ``` fence if present, else from the raw text"""
+    _, fence, rest = text.partition('```')
+    if fence:
+        body = rest.partition('```')[0]
+        if body.startswith('json'):
+            body = body[4:]
+        data = _scan_json(body, opener)
+        if data is not None:
+            return data
+
+    return _scan_json(text, opener)
+
+
 class DocumentClassifier:
     """Classify documents using Claude Code CLI"""
 
-    def __init__(self, prompts_dir=None, db_path=None):
+    # extract_batch kind -> (prompt attribute, single-document method)
+    EXTRACT_KINDS = {
+        'medical': ('medical_prompt', 'extract_medical_metadata'),
+        'expense': ('expense_prompt', 'extract_expense_metadata'),
+        'schoolwork': ('schoolwork_prompt', 'extract_schoolwork_metadata'),
+        'personal-medical': ('personal_medical_prompt', 'extract_personal_medical_metadata'),
+        'personal-expense': ('personal_expense_prompt', 'extract_personal_expense_metadata'),
+        'utility': ('utility_prompt', 'extract_utility_metadata'),
+        'auto': ('auto_prompt', 'extract_auto_metadata'),
+    }
+
+    def __init__(self, prompts_dir=None, db_path=None, batch_size=5, cache_dir=None,
+                 semantic_threshold=None, stream=False, fast_path=None):
         # Auto-detect container vs host environment
         if prompts_dir is None:
             if Path('/app/prompts').exists():
@@ -31,6 +187,29 @@ class DocumentClassifier:
         self.prompts_dir = Path(prompts_dir)
         self.db_path = Path(db_path)
 
+        # Max documents sent to Claude Code in one batch call
+        self.batch_size = max(1, int(batch_size))
+
+        # Settle clear-cut documents from first-page keywords without Claude
+        if fast_path is None:
+            fast_path = os.getenv('SCANPROC_FAST_CLASSIFY', '').lower() in ('1', 'true', 'yes')
+        self.fast_path = fast_path
+
+        # Read Claude Code output as it arrives and stop the CLI as soon as
+        # a complete JSON object has been printed (POSIX only)
+        self.stream = stream and os.name == 'posix'
+
+        # On-disk response cache keyed by document content (disabled if unset)
+        if cache_dir is None:
+            cache_dir = os.getenv('SCANPROC_CACHE_DIR') or None
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        # Optional near-duplicate tier for classification (needs cache_dir);
+        # near-identical scans reuse a stored result above this cosine score
+        self.semantic_cache = None
+        if self.cache_dir is not None and semantic_threshold is not None:
+            self.semantic_cache = SemanticCache(self.cache_dir / 'semantic', semantic_threshold)
+
         if not self.prompts_dir.exists():
             raise ValueError(f"Prompts directory does not exist: {self.prompts_dir}")
 
@@ -47,6 +226,12 @@ class DocumentClassifier:
         self.utility_prompt = self.prompts_dir / "utility.md"
         self.auto_prompt = self.prompts_dir / "auto.md"
 
+        # Read every prompt once up front; later calls get the text from
+        # _load_prompt's in-memory cache, which only re-reads a file after
+        # it has been edited
+        for prompt_path in self.prompts_dir.glob('*.md'):
+            _load_prompt(prompt_path)
+
     def _call_claude_code(self, file_path, prompt_path, timeout=300, corrections=None):
         """
         Call Claude Code CLI with a file and prompt
@@ -61,8 +246,7 @@ class DocumentClassifier:
             dict: Parsed JSON response from Claude Code
         """
         # Read the prompt
-        with open(prompt_path, 'r') as f:
-            prompt_text = f.read()
+        prompt_text = _load_prompt(prompt_path)
 
         print(f"Calling Claude Code...")
         print(f"  File: {file_path}")
@@ -70,11 +254,8 @@ class DocumentClassifier:
         if corrections:
             print(f"  With corrections: {corrections.get('reason', 'yes')}")
 
-        # Create temp file for prompt (auto-cleanup with context manager)
-        tmp_fd, tmp_path = tempfile.mkstemp(suffix='.txt', prefix='claude_prompt_')
-
         try:
-            # Write prompt to temp file with file path included
+            # Full prompt with file path included
             full_prompt = f"{prompt_text}\n\nPlease analyze this PDF file: {file_path}"
 
             # Append corrections/guidance if provided
@@ -82,28 +263,7 @@ class DocumentClassifier:
                 full_prompt += f"\n\n## USER CORRECTIONS / GUIDANCE:\n{corrections['notes']}"
                 full_prompt += f"\n\nPlease take these corrections into account when analyzing the document."
 
-            with os.fdopen(tmp_fd, 'w') as tmp_file:
-                tmp_file.write(full_prompt)
-
-            # Build command: cat prompt.txt | claude --print --add-dir /path/to/scan-processor
-            scan_dir = str(Path(file_path).parent.parent)
-            cmd = f'cat {tmp_path} | claude --print --add-dir {scan_dir}'
-
-            # Auto-detect working directory
-            if Path('/app').exists():
-                work_dir = '/app'
-            else:
-                work_dir = '/home/jodfie'
-
-            # Execute the command
-            result = subprocess.run(
-                cmd,
-                shell=True,
-                capture_output=True,
-                text=True,
-                timeout=timeout,
-                cwd=work_dir
-            )
+            result = self._run_claude(full_prompt, [file_path], timeout, stop_at='{')
 
             if result.returncode != 0:
                 print(f"Claude Code error (exit code {result.returncode}):")
@@ -115,17 +275,14 @@ class DocumentClassifier:
 
             print(f"✓ Claude Code response received ({len(response_text)} chars)")
 
-            # Try to find JSON in the response
-            json_text = self._extract_json(response_text)
+            # Find and parse the JSON in the response
+            data = self._extract_json(response_text)
 
-            if not json_text:
+            if data is None:
                 print(f"WARNING: Could not extract JSON from response")
                 print(f"Response preview: {response_text[:500]}")
                 raise ValueError("No JSON found in Claude Code response")
 
-            # Parse the JSON
-            data = json.loads(json_text)
-
             # Log the interaction to database
             self._log_claude_interaction(
                 filename=Path(file_path).name,
@@ -167,6 +324,53 @@ class DocumentClassifier:
                 error_message=str(e)
             )
             raise
+
+    def _run_claude(self, full_prompt, file_paths, timeout, stop_at=None):
+        """
+        Pipe a prompt into the Claude Code CLI
+
+        Args:
+            full_prompt: Complete prompt text
+            file_paths: Documents referenced by the prompt (their scan
+                directories are added with --add-dir)
+            timeout: Timeout in seconds
+            stop_at: With streaming enabled, '{' or '[' to stop the CLI once
+                a complete JSON value of that kind has been printed
+
+        Returns:
+            subprocess.CompletedProcess: Result of the CLI call
+        """
+        # Create temp file for prompt (auto-cleanup with context manager)
+        tmp_fd, tmp_path = tempfile.mkstemp(suffix='.txt', prefix='claude_prompt_')
+
+        try:
+            with os.fdopen(tmp_fd, 'w') as tmp_file:
+                tmp_file.write(full_prompt)
+
+            # Build command: cat prompt.txt | claude --print --add-dir /path/to/scan-processor
+            scan_dirs = list(dict.fromkeys(str(Path(p).parent.parent) for p in file_paths))
+            cmd = f'cat {tmp_path} | claude --print --add-dir {" ".join(scan_dirs)}'
+
+            # Auto-detect working directory
+            if Path('/app').exists():
+                work_dir = '/app'
+            else:
+                work_dir = '/home/jodfie'
+            if not Path(work_dir).is_dir():
+                work_dir = None
+
+            if self.stream:
+                return self._run_claude_streaming(cmd, timeout, work_dir, stop_at)
+
+            # Execute the command
+            return subprocess.run(
+                cmd,
+                shell=True,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+                cwd=work_dir
+            )
         finally:
             # ALWAYS clean up temp file, even on error
             if os.path.exists(tmp_path):
@@ -175,35 +379,167 @@ class DocumentClassifier:
                 except OSError as e:
                     print(f"Warning: Could not delete temp file {tmp_path}: {e}")
 
-    def _extract_json(self, text):
-        """Extract JSON from markdown code blocks or raw text"""
-        import re
+    @staticmethod
+    def _run_claude_streaming(cmd, timeout, work_dir, stop_at=None):
+        """
+        Run the CLI command, reading stdout incrementally
 
-        # Try to find JSON in markdown code block
-        # Pattern: ```json\n{...}\n```
-        json_block_pattern = r'```(?:json)?\s*\n?(\{.*?\})\s*\n?```'
-        match = re.search(json_block_pattern, text, re.DOTALL)
+        Stops the whole process group once ``stop_at`` JSON has been printed,
+        instead of waiting for the CLI to finish and buffering its output.
 
-        if match:
-            return match.group(1)
+        Returns:
+            subprocess.CompletedProcess: stdout up to the JSON value; the
+                return code is 0 when stopped early
 
-        # Try to find raw JSON object
-        # Pattern: {...}
-        json_pattern = r'(\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\})'
-        match = re.search(json_pattern, text, re.DOTALL)
+        Raises:
+            subprocess.TimeoutExpired: No complete output within timeout
+        """
+        proc = subprocess.Popen(
+            cmd,
+            shell=True,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            cwd=work_dir,
+            start_new_session=True
+        )
+        deadline = time.monotonic() + timeout
+        stream = _JsonStream(stop_at or '{')
+        decoders = {
+            proc.stdout: codecs.getincrementaldecoder('utf-8')(errors='replace'),
+            proc.stderr: codecs.getincrementaldecoder('utf-8')(errors='replace'),
+        }
+        stderr = []
+        found = False
+
+        def stop():
+            try:
+                os.killpg(proc.pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+            proc.wait()
+
+        with selectors.DefaultSelector() as selector:
+            selector.register(proc.stdout, selectors.EVENT_READ)
+            selector.register(proc.stderr, selectors.EVENT_READ)
+
+            try:
+                while selector.get_map() and not found:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        stop()
+                        raise subprocess.TimeoutExpired(cmd, timeout)
+
+                    for key, _ in selector.select(remaining):
+                        data = os.read(key.fd, 4096)
+                        if not data:
+                            selector.unregister(key.fileobj)
+                            continue
+                        text = decoders[key.fileobj].decode(data)
+                        if key.fileobj is proc.stderr:
+                            stderr.append(text)
+                        elif stream.feed(text) and stop_at:
+                            found = True
+            finally:
+                proc.stdout.close()
+                proc.stderr.close()
+
+        if found:
+            stop()
+            returncode = 0
+        else:
+            try:
+                returncode = proc.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                stop()
+                raise
+
+        return subprocess.CompletedProcess(cmd, returncode, stream.text, ''.join(stderr))
+
+    def _call_claude_code_batch(self, file_paths, prompt_path, timeout=600):
+        """
+        Call Claude Code CLI once for several documents
+
+        Args:
+            file_paths: List of PDF document paths
+            prompt_path: Path to the prompt file
+            timeout: Timeout in seconds for the whole batch
+
+        Returns:
+            list: One parsed result dict per document, in input order
+
+        Raises:
+            RuntimeError/ValueError: If the call fails or the response is not
+                a JSON array with one object per document
+        """
+        prompt_text = _load_prompt(prompt_path)
+
+        print(f"Calling Claude Code for {len(file_paths)} documents...")
+        print(f"  Prompt: {prompt_path.name}")
+
+        file_list = "\n".join(f"{i}. {p}" for i, p in enumerate(file_paths, 1))
+        full_prompt = (
+            f"{prompt_text}\n\nPlease analyze each of these PDF files:\n{file_list}"
+            f"\n\nReturn a JSON array containing one JSON object per file, "
+            f"in the same order as listed above."
+        )
+
+        result = self._run_claude(full_prompt, file_paths, timeout)
+
+        if result.returncode != 0:
+            print(f"Claude Code error (exit code {result.returncode}):")
+            print(f"STDERR: {result.stderr}")
+            raise RuntimeError(f"Claude Code failed: {result.stderr}")
+
+        response_text = result.stdout.strip()
 
-        if match:
-            return match.group(1)
+        print(f"✓ Claude Code response received ({len(response_text)} chars)")
 
-        return None
+        data = self._extract_json_array(response_text)
+        if data is None:
+            raise ValueError("No JSON array found in Claude Code response")
 
-    def classify_document(self, file_path, corrections=None):
+        if (not isinstance(data, list) or len(data) != len(file_paths)
+                or not all(isinstance(item, dict) for item in data)):
+            raise ValueError(
+                f"Expected a JSON array of {len(file_paths)} objects in Claude Code response"
+            )
+
+        prompt_type = self._get_prompt_type(prompt_path)
+        for file_path, item in zip(file_paths, data):
+            self._log_claude_interaction(
+                filename=Path(file_path).name,
+                prompt_type=prompt_type,
+                prompt_file=prompt_path.name,
+                prompt_content=prompt_text,
+                response_content=response_text,
+                confidence=item.get('confidence'),
+                success=True
+            )
+
+            # Include prompt and response for history logging
+            item['_prompt'] = full_prompt
+            item['_response'] = response_text
+
+        return data
+
+    def _extract_json_array(self, text):
+        """Extract and parse a JSON array from markdown code blocks or raw text"""
+        return _find_json(text, '[')
+
+    def _extract_json(self, text):
+        """Extract and parse a JSON object from markdown code blocks or raw text"""
+        return _find_json(text, '{')
+
+    @cached('classify', 'classifier_prompt')
+    def classify_document(self, file_path, corrections=None, timeout=300):
         """
         Classify a document and extract basic metadata
 
         Args:
             file_path: Path to the PDF document
             corrections: Optional dict with user corrections/guidance
+            timeout: Seconds the Claude Code call may run before it is killed
+                and subprocess.TimeoutExpired is raised
 
         Returns:
             dict: Classification result with category, metadata, and confidence
@@ -216,15 +552,38 @@ class DocumentClassifier:
         if not self.classifier_prompt.exists():
             raise FileNotFoundError(f"Classifier prompt not found: {self.classifier_prompt}")
 
+        # Keyword fast path (corrections always go to Claude)
+        if self.fast_path and not corrections:
+            fast_result = fast_classify(file_path)
+            if fast_result is not None:
+                print(f"✓ Fast-path classification: {fast_result['category']}")
+                return fast_result
+
+        # Near-duplicate lookup
+        vector = None
+        if self.semantic_cache is not None and not corrections:
+            vector = self.semantic_cache.embed(file_path)
+            cached_result = self.semantic_cache.lookup(vector)
+            if cached_result is not None:
+                print(f"✓ Using near-duplicate classification: {cached_result.get('category', 'UNKNOWN')}")
+                return cached_result
+
         try:
             # Call Claude Code with the classifier prompt and corrections
-            result = self._call_claude_code(file_path, self.classifier_prompt, corrections=corrections)
+            result = self._call_claude_code(file_path, self.classifier_prompt, timeout=timeout,
+                                            corrections=corrections)
 
             print(f"✓ Classification result: {result.get('category', 'UNKNOWN')}")
             print(f"  Confidence: {result.get('confidence', 0):.2%}")
 
+            if vector is not None:
+                self.semantic_cache.add(vector, result)
+
             return result
 
+        except subprocess.TimeoutExpired:
+            # Callers decide how to handle a document Claude couldn't finish
+            raise
         except Exception as e:
             print(f"ERROR: Failed to classify document: {e}")
             return {
@@ -235,6 +594,7 @@ class DocumentClassifier:
                 'clarification_question': 'Failed to classify with Claude Code. Please review manually.'
             }
 
+    @cached('medical', 'medical_prompt')
     def extract_medical_metadata(self, file_path, corrections=None):
         """Extract detailed medical metadata"""
         file_path = Path(file_path)
@@ -271,6 +631,7 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract medical metadata: {str(e)}'
             }
 
+    @cached('expense', 'expense_prompt')
     def extract_expense_metadata(self, file_path, corrections=None):
         """Extract detailed expense metadata"""
         file_path = Path(file_path)
@@ -307,6 +668,7 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract expense metadata: {str(e)}'
             }
 
+    @cached('schoolwork', 'schoolwork_prompt')
     def extract_schoolwork_metadata(self, file_path, corrections=None):
         """Extract schoolwork metadata"""
         file_path = Path(file_path)
@@ -341,6 +703,7 @@ class DocumentClassifier:
             }
 
 
+    @cached('personal-medical', 'personal_medical_prompt')
     def extract_personal_medical_metadata(self, file_path, corrections=None):
         """Extract personal (adult) medical metadata"""
         file_path = Path(file_path)
@@ -377,6 +740,7 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract personal medical metadata: {str(e)}'
             }
 
+    @cached('personal-expense', 'personal_expense_prompt')
     def extract_personal_expense_metadata(self, file_path, corrections=None):
         """Extract personal expense metadata"""
         file_path = Path(file_path)
@@ -411,6 +775,7 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract personal expense metadata: {str(e)}'
             }
 
+    @cached('utility', 'utility_prompt')
     def extract_utility_metadata(self, file_path, corrections=None):
         """Extract utility bill metadata"""
         file_path = Path(file_path)
@@ -448,6 +813,7 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract utility metadata: {str(e)}'
             }
 
+    @cached('auto', 'auto_prompt')
     def extract_auto_metadata(self, file_path, corrections=None):
         """Extract automotive document metadata"""
         file_path = Path(file_path)
@@ -485,6 +851,132 @@ class DocumentClassifier:
                 'clarification_question': f'Failed to extract auto metadata: {str(e)}'
             }
 
+    def classify_documents(self, file_paths, continue_on_error=True):
+        """
+        Classify several documents with one Claude Code call per batch
+
+        Documents are sent in chunks of ``self.batch_size``. If a batch call
+        fails or returns a malformed array, its documents are classified one
+        at a time instead.
+
+        Args:
+            file_paths: List of PDF document paths
+            continue_on_error: Return an error dict for a failing document
+                instead of raising
+
+        Returns:
+            list: Classification results aligned with file_paths
+        """
+        return self._process_batches(
+            file_paths, self.classifier_prompt, self.classify_document, continue_on_error
+        )
+
+    def extract_batch(self, file_paths, kind, continue_on_error=True):
+        """
+        Extract metadata for several documents of the same kind
+
+        Args:
+            file_paths: List of PDF document paths
+            kind: Key of EXTRACT_KINDS (e.g. 'utility', 'personal-medical')
+            continue_on_error: Return an error dict for a failing document
+                instead of raising
+
+        Returns:
+            list: Metadata results aligned with file_paths
+        """
+        if kind not in self.EXTRACT_KINDS:
+            raise ValueError(f"Unknown extraction kind: {kind}")
+
+        prompt_attr, method_name = self.EXTRACT_KINDS[kind]
+        return self._process_batches(
+            file_paths, getattr(self, prompt_attr), getattr(self, method_name), continue_on_error
+        )
+
+    def process_directory(self, dir_path, workers=8, progress_callback=None, continue_on_error=True):
+        """
+        Classify every PDF under a directory concurrently
+
+        Each document gets its own classify_document call on a thread pool;
+        the threads mostly wait on the Claude Code subprocess, so throughput
+        scales with workers.
+
+        Args:
+            dir_path: Directory searched recursively for *.pdf
+            workers: Maximum concurrent classifications
+            progress_callback: Optional callable(done, total), called as each
+                document finishes
+            continue_on_error: Return an error dict for a failing document
+                instead of raising
+
+        Returns:
+            list: (path, result) tuples in sorted path order
+        """
+        pdf_paths = sorted(Path(dir_path).glob('**/*.pdf'))
+        total = len(pdf_paths)
+        results = [None] * total
+
+        if not pdf_paths:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, total))) as executor:
+            futures = {executor.submit(self.classify_document, path): i
+                       for i, path in enumerate(pdf_paths)}
+
+            for done, future in enumerate(as_completed(futures), 1):
+                i = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    if not continue_on_error:
+                        for pending in futures:
+                            pending.cancel()
+                        raise
+                    print(f"ERROR: Failed to classify {pdf_paths[i]}: {e}")
+                    result = {
+                        'category': 'GENERAL',
+                        'confidence': 0.0,
+                        'error': str(e),
+                        'needs_clarification': True,
+                        'clarification_question': f'Failed to classify document: {str(e)}'
+                    }
+
+                results[i] = (pdf_paths[i], result)
+
+                if progress_callback:
+                    progress_callback(done, total)
+
+        return results
+
+    def _process_batches(self, file_paths, prompt_path, single, continue_on_error):
+        """Run file_paths through batch calls, falling back to single calls"""
+        file_paths = [Path(p) for p in file_paths]
+        results = []
+
+        for start in range(0, len(file_paths), self.batch_size):
+            chunk = file_paths[start:start + self.batch_size]
+
+            if len(chunk) > 1 and prompt_path.exists() and all(p.exists() for p in chunk):
+                try:
+                    results.extend(self._call_claude_code_batch(chunk, prompt_path))
+                    continue
+                except Exception as e:
+                    print(f"WARNING: Batch call failed, processing individually: {e}")
+
+            for file_path in chunk:
+                try:
+                    results.append(single(file_path))
+                except Exception as e:
+                    if not continue_on_error:
+                        raise
+                    print(f"ERROR: Failed to process {file_path}: {e}")
+                    results.append({
+                        'error': str(e),
+                        'needs_clarification': True,
+                        'clarification_question': f'Failed to process document: {str(e)}'
+                    })
+
+        return results
+
     def _get_prompt_type(self, prompt_path):
         """Determine prompt type from path"""
         prompt_name = prompt_path.stem.lower()
@@ -12,6 +12,7 @@ Usage:
 """
 
 import argparse
+import io
 from pathlib import Path
 from datetime import datetime, timedelta
 import random
@@ -23,15 +24,56 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.styles import getSampleStyleSheet
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 
-fake = Faker()
+# Only load the providers the generators call (Faker loads ~25 by default)
+_FAKER_PROVIDERS = [
+    'faker.providers.address',
+    'faker.providers.barcode',
+    'faker.providers.company',
+    'faker.providers.date_time',
+    'faker.providers.job',
+    'faker.providers.lorem',
+    'faker.providers.person',
+    'faker.providers.python',
+]
+
+fake = Faker(locale='en_US', providers=_FAKER_PROVIDERS)
+
+_PAGESIZE = letter
+_PAGE_W, _PAGE_H = letter
 
 
 class SampleDocumentGenerator:
     """Generate realistic PDF samples for different document categories"""
 
+    # Generator methods run for --category, keyed by CLI category name
+    _CATEGORY_GENERATORS: dict[str, tuple[str, ...]] = {
+        'personal-medical': ('generate_personal_medical_bills',),
+        'personal-expense': ('generate_restaurant_receipts',),
+        'utility': ('generate_electric_bills',),
+        'auto-insurance': ('generate_insurance_policies',),
+        'auto-maintenance': ('generate_oil_change_receipts',),
+        'auto-registration': ('generate_registration_renewals',),
+    }
+
     def __init__(self, output_dir: Path):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self._prewarm()
+
+    @staticmethod
+    def _prewarm():
+        """Load font metrics and Faker providers up front with a throwaway in-memory PDF"""
+        c = canvas.Canvas(io.BytesIO(), pagesize=_PAGESIZE)
+        for font in ("Helvetica", "Helvetica-Bold"):
+            for size in (10, 11, 12, 14, 16):
+                c.setFont(font, size)
+                c.drawString(1*inch, 1*inch, "warm-up")
+        fake.name()
+        fake.address()
+        fake.company()
+        fake.bothify(text='??-####')
+        fake.date_between(start_date='-1m', end_date='today')
+        c.save()
 
     def generate_all(self):
         """Generate all sample documents"""
@@ -73,6 +115,16 @@ class SampleDocumentGenerator:
 
         print(f"\n✅ Generated 48 sample documents in {self.output_dir}")
 
+    @staticmethod
+    def _draw_lines(c, x, y, lines, font="Helvetica", size=10, leading=0.2*inch):
+        """Draw consecutive lines in one text object, returning the y of the last line"""
+        text = c.beginText(x, y)
+        text.setFont(font, size, leading)
+        for line in lines:
+            text.textLine(line)
+        c.drawText(text)
+        return y - leading * (len(lines) - 1)
+
     # ========== Personal Medical ==========
 
     def generate_personal_medical_bills(self, count: int):
@@ -84,28 +136,27 @@ class SampleDocumentGenerator:
             filename = f"medical-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, fake.company())
+            c.drawString(1*inch, _PAGE_H - 1*inch, fake.company())
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "MEDICAL BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "MEDICAL BILL")
 
             # Patient info
             c.setFont("Helvetica", 10)
             date = fake.date_between(start_date='-6m', end_date='today')
-            c.drawString(1*inch, height - 2.5*inch, f"Patient: {fake.name()}")
-            c.drawString(1*inch, height - 2.7*inch, f"Date of Service: {date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Provider: Dr. {fake.last_name()}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Patient: {fake.name()}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Date of Service: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Provider: Dr. {fake.last_name()}")
 
             # Services
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Services:")
             y -= 0.3*inch
@@ -140,28 +191,27 @@ class SampleDocumentGenerator:
             filename = f"lab-results-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1*inch, f"{fake.company()} Laboratory")
+            c.drawString(1*inch, _PAGE_H - 1*inch, f"{fake.company()} Laboratory")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "LABORATORY RESULTS")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "LABORATORY RESULTS")
 
             # Patient info
             c.setFont("Helvetica", 10)
             date = fake.date_between(start_date='-3m', end_date='today')
-            c.drawString(1*inch, height - 2.5*inch, f"Patient: {fake.name()}")
-            c.drawString(1*inch, height - 2.7*inch, f"Test Date: {date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Ordering Physician: Dr. {fake.last_name()}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Patient: {fake.name()}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Test Date: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Ordering Physician: Dr. {fake.last_name()}")
 
             # Test results
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Test Results:")
             y -= 0.3*inch
@@ -190,28 +240,27 @@ class SampleDocumentGenerator:
             filename = f"doctor-visit-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1*inch, f"Dr. {fake.last_name()} - {fake.job()[:20]}")
+            c.drawString(1*inch, _PAGE_H - 1*inch, f"Dr. {fake.last_name()} - {fake.job()[:20]}")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "VISIT SUMMARY")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "VISIT SUMMARY")
 
             # Visit info
             c.setFont("Helvetica", 10)
             date = fake.date_between(start_date='-2m', end_date='today')
-            c.drawString(1*inch, height - 2.5*inch, f"Patient: {fake.name()}")
-            c.drawString(1*inch, height - 2.7*inch, f"Visit Date: {date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Reason: {random.choice(['Annual checkup', 'Follow-up', 'Consultation'])}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Patient: {fake.name()}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Visit Date: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Reason: {random.choice(['Annual checkup', 'Follow-up', 'Consultation'])}")
 
             # Notes
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Notes:")
             y -= 0.3*inch
@@ -232,27 +281,26 @@ class SampleDocumentGenerator:
             filename = f"prescription-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1*inch, f"Dr. {fake.last_name()}")
+            c.drawString(1*inch, _PAGE_H - 1*inch, f"Dr. {fake.last_name()}")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "PRESCRIPTION")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "PRESCRIPTION")
 
             # Patient info
             c.setFont("Helvetica", 10)
             date = fake.date_between(start_date='-1m', end_date='today')
-            c.drawString(1*inch, height - 2.5*inch, f"Patient: {fake.name()}")
-            c.drawString(1*inch, height - 2.7*inch, f"Date: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Patient: {fake.name()}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Date: {date.strftime('%Y-%m-%d')}")
 
             # Medication
-            y = height - 3.3*inch
+            y = _PAGE_H - 3.3*inch
             c.setFont("Helvetica-Bold", 11)
             c.drawString(1*inch, y, "Medication:")
             y -= 0.3*inch
@@ -281,23 +329,22 @@ class SampleDocumentGenerator:
             filename = f"restaurant-receipt-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             restaurant = random.choice(restaurants)
             c.setFont("Helvetica-Bold", 16)
-            c.drawCentredString(width/2, height - 1*inch, restaurant)
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1*inch, restaurant)
             c.setFont("Helvetica", 10)
-            c.drawCentredString(width/2, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Receipt details
             date = fake.date_between(start_date='-1m', end_date='today')
             time = fake.time()
-            c.drawCentredString(width/2, height - 1.6*inch, f"{date.strftime('%Y-%m-%d')} {time}")
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1.6*inch, f"{date.strftime('%Y-%m-%d')} {time}")
 
             # Items
-            y = height - 2.2*inch
+            y = _PAGE_H - 2.2*inch
             items = [
                 (fake.word().capitalize() + " Plate", fake.pydecimal(left_digits=2, right_digits=2, positive=True)),
                 (fake.word().capitalize() + " Special", fake.pydecimal(left_digits=2, right_digits=2, positive=True)),
@@ -337,24 +384,23 @@ class SampleDocumentGenerator:
             filename = f"amazon-invoice-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 18)
-            c.drawString(1*inch, height - 1*inch, "amazon")
+            c.drawString(1*inch, _PAGE_H - 1*inch, "amazon")
 
             # Order info
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1.5*inch, "Order Confirmation")
+            c.drawString(1*inch, _PAGE_H - 1.5*inch, "Order Confirmation")
 
             c.setFont("Helvetica", 10)
             date = fake.date_between(start_date='-2m', end_date='today')
-            c.drawString(1*inch, height - 2*inch, f"Order Date: {date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.2*inch, f"Order #: {fake.ean13()}")
+            c.drawString(1*inch, _PAGE_H - 2*inch, f"Order Date: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.2*inch, f"Order #: {fake.ean13()}")
 
             # Items
-            y = height - 2.8*inch
+            y = _PAGE_H - 2.8*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Items:")
             y -= 0.3*inch
@@ -391,22 +437,21 @@ class SampleDocumentGenerator:
             filename = f"store-receipt-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             store = random.choice(stores)
             c.setFont("Helvetica-Bold", 16)
-            c.drawCentredString(width/2, height - 1*inch, store)
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1*inch, store)
             c.setFont("Helvetica", 10)
-            c.drawCentredString(width/2, height - 1.3*inch, fake.street_address())
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1.3*inch, fake.street_address())
 
             date = fake.date_between(start_date='-1m', end_date='today')
             time = fake.time()
-            c.drawCentredString(width/2, height - 1.6*inch, f"{date.strftime('%Y-%m-%d')} {time}")
+            c.drawCentredString(_PAGE_W/2, _PAGE_H - 1.6*inch, f"{date.strftime('%Y-%m-%d')} {time}")
 
             # Items
-            y = height - 2.2*inch
+            y = _PAGE_H - 2.2*inch
             items = [
                 (fake.word().capitalize() + " Item", fake.pydecimal(left_digits=2, right_digits=2, positive=True)),
                 (fake.word().capitalize() + " Product", fake.pydecimal(left_digits=2, right_digits=2, positive=True)),
@@ -439,27 +484,26 @@ class SampleDocumentGenerator:
             filename = f"service-invoice-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             service = random.choice(services)
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1*inch, f"{fake.company()} - {service}")
+            c.drawString(1*inch, _PAGE_H - 1*inch, f"{fake.company()} - {service}")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Invoice details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "INVOICE")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "INVOICE")
 
             date = fake.date_between(start_date='-1m', end_date='today')
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.4*inch, f"Date: {date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.6*inch, f"Invoice #: INV-{fake.random_number(digits=5)}")
+            c.drawString(1*inch, _PAGE_H - 2.4*inch, f"Date: {date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.6*inch, f"Invoice #: INV-{fake.random_number(digits=5)}")
 
             # Services
-            y = height - 3.2*inch
+            y = _PAGE_H - 3.2*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Services Provided:")
             y -= 0.3*inch
@@ -491,35 +535,34 @@ class SampleDocumentGenerator:
             filename = f"electric-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             company = random.choice(companies)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, company)
+            c.drawString(1*inch, _PAGE_H - 1*inch, company)
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Bill details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "ELECTRIC BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "ELECTRIC BILL")
 
             billing_date = fake.date_between(start_date='-1m', end_date='today')
             due_date = billing_date + timedelta(days=21)
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Account #: {fake.random_number(digits=10)}")
-            c.drawString(1*inch, height - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 3.1*inch, f"Service Address: {fake.address().replace(chr(10), ', ')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Account #: {fake.random_number(digits=10)}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 3.1*inch, f"Service Address: {fake.address().replace(chr(10), ', ')}")
 
             # Usage
             kwh = random.randint(500, 1500)
             rate = 0.12
             amount = kwh * rate
 
-            y = height - 3.7*inch
+            y = _PAGE_H - 3.7*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Usage Summary:")
             y -= 0.3*inch
@@ -546,33 +589,32 @@ class SampleDocumentGenerator:
             filename = f"water-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, "City Water & Sewer")
+            c.drawString(1*inch, _PAGE_H - 1*inch, "City Water & Sewer")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Bill details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "WATER/SEWER BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "WATER/SEWER BILL")
 
             billing_date = fake.date_between(start_date='-1m', end_date='today')
             due_date = billing_date + timedelta(days=21)
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Account #: {fake.random_number(digits=8)}")
-            c.drawString(1*inch, height - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Account #: {fake.random_number(digits=8)}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
 
             # Charges
             water_charge = fake.pydecimal(left_digits=2, right_digits=2, positive=True)
             sewer_charge = fake.pydecimal(left_digits=2, right_digits=2, positive=True)
             total = float(water_charge) + float(sewer_charge)
 
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Charges:")
             y -= 0.3*inch
@@ -601,33 +643,32 @@ class SampleDocumentGenerator:
             filename = f"gas-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, "Metro Gas Company")
+            c.drawString(1*inch, _PAGE_H - 1*inch, "Metro Gas Company")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Bill details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "NATURAL GAS BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "NATURAL GAS BILL")
 
             billing_date = fake.date_between(start_date='-1m', end_date='today')
             due_date = billing_date + timedelta(days=21)
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Account #: {fake.random_number(digits=9)}")
-            c.drawString(1*inch, height - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Account #: {fake.random_number(digits=9)}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
 
             # Usage
             therms = random.randint(20, 150)
             rate = 1.05
             amount = therms * rate
 
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Usage:")
             y -= 0.3*inch
@@ -656,34 +697,33 @@ class SampleDocumentGenerator:
             filename = f"internet-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             provider = random.choice(providers)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, provider)
+            c.drawString(1*inch, _PAGE_H - 1*inch, provider)
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Bill details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "INTERNET SERVICE BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "INTERNET SERVICE BILL")
 
             billing_date = fake.date_between(start_date='-1m', end_date='today')
             due_date = billing_date + timedelta(days=21)
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Account #: {fake.random_number(digits=12)}")
-            c.drawString(1*inch, height - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Account #: {fake.random_number(digits=12)}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
 
             # Service
             speeds = ["100 Mbps", "200 Mbps", "500 Mbps", "1 Gbps"]
             speed = random.choice(speeds)
             monthly_charge = random.uniform(50, 120)
 
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Service:")
             y -= 0.3*inch
@@ -711,34 +751,33 @@ class SampleDocumentGenerator:
             filename = f"phone-bill-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             provider = random.choice(providers)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, provider)
+            c.drawString(1*inch, _PAGE_H - 1*inch, provider)
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Bill details
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "WIRELESS BILL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "WIRELESS BILL")
 
             billing_date = fake.date_between(start_date='-1m', end_date='today')
             due_date = billing_date + timedelta(days=21)
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Account #: {fake.random_number(digits=10)}")
-            c.drawString(1*inch, height - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.5*inch, f"Account #: {fake.random_number(digits=10)}")
+            c.drawString(1*inch, _PAGE_H - 2.7*inch, f"Billing Date: {billing_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.9*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
 
             # Charges
             line_charge = random.uniform(40, 80)
             data_charge = random.uniform(20, 50)
             total = line_charge + data_charge
 
-            y = height - 3.5*inch
+            y = _PAGE_H - 3.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Charges:")
             y -= 0.3*inch
@@ -771,56 +810,54 @@ class SampleDocumentGenerator:
             filename = f"insurance-policy-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             company = random.choice(companies)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, company)
+            c.drawString(1*inch, _PAGE_H - 1*inch, company)
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.address().replace('\n', ', '))
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.address().replace('\n', ', '))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "AUTO INSURANCE POLICY")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "AUTO INSURANCE POLICY")
 
             # Policy details
             policy_date = fake.date_between(start_date='-1y', end_date='today')
             expiration_date = policy_date + timedelta(days=365)
 
-            c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Policy #: {fake.bothify(text='POL-########')}")
-            c.drawString(1*inch, height - 2.7*inch, f"Policy Holder: {fake.name()}")
-            c.drawString(1*inch, height - 2.9*inch, f"Effective Date: {policy_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 3.1*inch, f"Expiration Date: {expiration_date.strftime('%Y-%m-%d')}")
+            self._draw_lines(c, 1*inch, _PAGE_H - 2.5*inch, [
+                f"Policy #: {fake.bothify(text='POL-########')}",
+                f"Policy Holder: {fake.name()}",
+                f"Effective Date: {policy_date.strftime('%Y-%m-%d')}",
+                f"Expiration Date: {expiration_date.strftime('%Y-%m-%d')}",
+            ])
 
             # Vehicle info
-            y = height - 3.7*inch
+            y = _PAGE_H - 3.7*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle:")
             y -= 0.3*inch
-            c.setFont("Helvetica", 10)
             year = random.randint(2015, 2024)
             make = random.choice(["Honda", "Toyota", "Ford", "Chevrolet"])
             model = random.choice(["Accord", "Camry", "F-150", "Malibu"])
-            c.drawString(1.2*inch, y, f"{year} {make} {model}")
-            y -= 0.2*inch
-            c.drawString(1.2*inch, y, f"VIN: {fake.bothify(text='#??########?????')}")
+            y = self._draw_lines(c, 1.2*inch, y, [
+                f"{year} {make} {model}",
+                f"VIN: {fake.bothify(text='#??########?????')}",
+            ])
 
             # Coverage
             y -= 0.5*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Coverage:")
             y -= 0.3*inch
-            c.setFont("Helvetica", 10)
-            c.drawString(1.2*inch, y, "Bodily Injury: $250,000/$500,000")
-            y -= 0.2*inch
-            c.drawString(1.2*inch, y, "Property Damage: $100,000")
-            y -= 0.2*inch
-            c.drawString(1.2*inch, y, "Collision: $500 deductible")
-            y -= 0.2*inch
-            c.drawString(1.2*inch, y, "Comprehensive: $500 deductible")
+            y = self._draw_lines(c, 1.2*inch, y, [
+                "Bodily Injury: $250,000/$500,000",
+                "Property Damage: $100,000",
+                "Collision: $500 deductible",
+                "Comprehensive: $500 deductible",
+            ])
 
             # Premium
             y -= 0.5*inch
@@ -843,28 +880,27 @@ class SampleDocumentGenerator:
             filename = f"declaration-page-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             company = random.choice(companies)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, company)
+            c.drawString(1*inch, _PAGE_H - 1*inch, company)
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1.5*inch, "DECLARATION PAGE")
+            c.drawString(1*inch, _PAGE_H - 1.5*inch, "DECLARATION PAGE")
 
             # Policy info
             policy_date = fake.date_between(start_date='-6m', end_date='today')
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2*inch, f"Policy #: {fake.bothify(text='DEC-########')}")
-            c.drawString(1*inch, height - 2.2*inch, f"Policy Date: {policy_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.4*inch, f"Insured: {fake.name()}")
+            c.drawString(1*inch, _PAGE_H - 2*inch, f"Policy #: {fake.bothify(text='DEC-########')}")
+            c.drawString(1*inch, _PAGE_H - 2.2*inch, f"Policy Date: {policy_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.4*inch, f"Insured: {fake.name()}")
 
             # Vehicle
-            y = height - 3*inch
+            y = _PAGE_H - 3*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Insured Vehicle:")
             y -= 0.3*inch
@@ -901,27 +937,26 @@ class SampleDocumentGenerator:
             filename = f"premium-notice-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, random.choice(["State Farm", "Geico"]))
+            c.drawString(1*inch, _PAGE_H - 1*inch, random.choice(["State Farm", "Geico"]))
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 1.5*inch, "PREMIUM PAYMENT NOTICE")
+            c.drawString(1*inch, _PAGE_H - 1.5*inch, "PREMIUM PAYMENT NOTICE")
 
             # Notice details
             due_date = fake.date_between(start_date='today', end_date='+1m')
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2*inch, f"Policy #: {fake.bothify(text='PREM-########')}")
-            c.drawString(1*inch, height - 2.2*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2*inch, f"Policy #: {fake.bothify(text='PREM-########')}")
+            c.drawString(1*inch, _PAGE_H - 2.2*inch, f"Due Date: {due_date.strftime('%Y-%m-%d')}")
 
             # Amount
             premium = random.uniform(100, 300)
-            y = height - 2.8*inch
+            y = _PAGE_H - 2.8*inch
             c.setFont("Helvetica-Bold", 12)
             c.drawString(1*inch, y, "Premium Due:")
             c.drawString(5*inch, y, f"${premium:.2f}")
@@ -942,27 +977,26 @@ class SampleDocumentGenerator:
             filename = f"oil-change-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             shop = random.choice(shops)
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, shop)
+            c.drawString(1*inch, _PAGE_H - 1*inch, shop)
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.street_address())
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.street_address())
 
             # Receipt details
             service_date = fake.date_between(start_date='-3m', end_date='today')
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "SERVICE RECEIPT")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "SERVICE RECEIPT")
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.6*inch, f"Invoice #: {fake.random_number(digits=6)}")
+            c.drawString(1*inch, _PAGE_H - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.6*inch, f"Invoice #: {fake.random_number(digits=6)}")
 
             # Vehicle
-            y = height - 3.2*inch
+            y = _PAGE_H - 3.2*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle:")
             y -= 0.3*inch
@@ -1009,26 +1043,25 @@ class SampleDocumentGenerator:
             filename = f"tire-service-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, random.choice(["Discount Tire", "Firestone", "Goodyear"]))
+            c.drawString(1*inch, _PAGE_H - 1*inch, random.choice(["Discount Tire", "Firestone", "Goodyear"]))
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.street_address())
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.street_address())
 
             # Receipt details
             service_date = fake.date_between(start_date='-6m', end_date='today')
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "TIRE SERVICE RECEIPT")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "TIRE SERVICE RECEIPT")
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.6*inch, f"Invoice #: TIRE-{fake.random_number(digits=5)}")
+            c.drawString(1*inch, _PAGE_H - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.6*inch, f"Invoice #: TIRE-{fake.random_number(digits=5)}")
 
             # Vehicle
-            y = height - 3.2*inch
+            y = _PAGE_H - 3.2*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle:")
             y -= 0.3*inch
@@ -1070,26 +1103,25 @@ class SampleDocumentGenerator:
             filename = f"general-service-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, f"{fake.last_name()}'s Auto Repair")
+            c.drawString(1*inch, _PAGE_H - 1*inch, f"{fake.last_name()}'s Auto Repair")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.street_address())
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.street_address())
 
             # Receipt details
             service_date = fake.date_between(start_date='-4m', end_date='today')
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "SERVICE INVOICE")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "SERVICE INVOICE")
 
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.6*inch, f"Invoice #: SVC-{fake.random_number(digits=5)}")
+            c.drawString(1*inch, _PAGE_H - 2.4*inch, f"Date: {service_date.strftime('%Y-%m-%d')}")
+            c.drawString(1*inch, _PAGE_H - 2.6*inch, f"Invoice #: SVC-{fake.random_number(digits=5)}")
 
             # Vehicle
-            y = height - 3.2*inch
+            y = _PAGE_H - 3.2*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle:")
             y -= 0.3*inch
@@ -1136,31 +1168,31 @@ class SampleDocumentGenerator:
             filename = f"registration-renewal-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, "Department of Motor Vehicles")
+            c.drawString(1*inch, _PAGE_H - 1*inch, "Department of Motor Vehicles")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.state())
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.state())
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "VEHICLE REGISTRATION RENEWAL")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "VEHICLE REGISTRATION RENEWAL")
 
             # Registration details
             renewal_date = fake.date_between(start_date='-2m', end_date='today')
             expiration_date = renewal_date + timedelta(days=365)
 
-            c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Registration #: {fake.bothify(text='??#######')}")
-            c.drawString(1*inch, height - 2.7*inch, f"Renewal Date: {renewal_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Expires: {expiration_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 3.1*inch, f"Owner: {fake.name()}")
+            self._draw_lines(c, 1*inch, _PAGE_H - 2.5*inch, [
+                f"Registration #: {fake.bothify(text='??#######')}",
+                f"Renewal Date: {renewal_date.strftime('%Y-%m-%d')}",
+                f"Expires: {expiration_date.strftime('%Y-%m-%d')}",
+                f"Owner: {fake.name()}",
+            ])
 
             # Vehicle
-            y = height - 3.7*inch
+            y = _PAGE_H - 3.7*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle Information:")
             y -= 0.3*inch
@@ -1194,31 +1226,31 @@ class SampleDocumentGenerator:
             filename = f"inspection-certificate-{i+1:02d}.pdf"
             filepath = category_dir / filename
 
-            c = canvas.Canvas(str(filepath), pagesize=letter)
-            width, height = letter
+            c = canvas.Canvas(str(filepath), pagesize=_PAGESIZE)
 
             # Header
             c.setFont("Helvetica-Bold", 16)
-            c.drawString(1*inch, height - 1*inch, "Official Vehicle Inspection")
+            c.drawString(1*inch, _PAGE_H - 1*inch, "Official Vehicle Inspection")
             c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 1.3*inch, fake.state())
+            c.drawString(1*inch, _PAGE_H - 1.3*inch, fake.state())
 
             # Title
             c.setFont("Helvetica-Bold", 14)
-            c.drawString(1*inch, height - 2*inch, "SAFETY INSPECTION CERTIFICATE")
+            c.drawString(1*inch, _PAGE_H - 2*inch, "SAFETY INSPECTION CERTIFICATE")
 
             # Inspection details
             inspection_date = fake.date_between(start_date='-3m', end_date='today')
             expiration_date = inspection_date + timedelta(days=365)
 
-            c.setFont("Helvetica", 10)
-            c.drawString(1*inch, height - 2.5*inch, f"Certificate #: {fake.bothify(text='INSP-########')}")
-            c.drawString(1*inch, height - 2.7*inch, f"Inspection Date: {inspection_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 2.9*inch, f"Valid Until: {expiration_date.strftime('%Y-%m-%d')}")
-            c.drawString(1*inch, height - 3.1*inch, f"Station: {fake.company()}")
+            self._draw_lines(c, 1*inch, _PAGE_H - 2.5*inch, [
+                f"Certificate #: {fake.bothify(text='INSP-########')}",
+                f"Inspection Date: {inspection_date.strftime('%Y-%m-%d')}",
+                f"Valid Until: {expiration_date.strftime('%Y-%m-%d')}",
+                f"Station: {fake.company()}",
+            ])
 
             # Vehicle
-            y = height - 3.7*inch
+            y = _PAGE_H - 3.7*inch
             c.setFont("Helvetica-Bold", 10)
             c.drawString(1*inch, y, "Vehicle:")
             y -= 0.3*inch
@@ -1256,33 +1288,13 @@ def main():
     if args.all:
         generator.generate_all()
     elif args.category:
-        category_method_map = {
-            'personal-medical': [
-                lambda: generator.generate_personal_medical_bills(args.count),
-            ],
-            'personal-expense': [
-                lambda: generator.generate_restaurant_receipts(args.count),
-            ],
-            'utility': [
-                lambda: generator.generate_electric_bills(args.count),
-            ],
-            'auto-insurance': [
-                lambda: generator.generate_insurance_policies(args.count),
-            ],
-            'auto-maintenance': [
-                lambda: generator.generate_oil_change_receipts(args.count),
-            ],
-            'auto-registration': [
-                lambda: generator.generate_registration_renewals(args.count),
-            ],
-        }
-
-        if args.category in category_method_map:
-            for method in category_method_map[args.category]:
-                method()
+        category_generators = SampleDocumentGenerator._CATEGORY_GENERATORS
+        if args.category in category_generators:
+            for method_name in category_generators[args.category]:
+                getattr(generator, method_name)(args.count)
         else:
             print(f"Unknown category: {args.category}")
-            print(f"Available categories: {', '.join(category_method_map.keys())}")
+            print(f"Available categories: {', '.join(category_generators.keys())}")
     else:
         print("Please specify --all or --category")
         parser.print_help()
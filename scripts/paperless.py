@@ -5,10 +5,194 @@ Handles document upload and metadata management
 """
 
 import os
+import gzip
+import hashlib
+import logging
+import threading
+import time
+import types
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
 import requests
-from pathlib import Path
+from requests.adapters import HTTPAdapter
+from requests_toolbelt.multipart.encoder import MultipartEncoder
+from urllib3.exceptions import ProtocolError, ReadTimeoutError
+from urllib3.util.retry import Retry
 import json
 
+try:
+    # C-backed parser for the large name-index pages
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
+
+logger = logging.getLogger(__name__)
+
+# Applied to any session request that doesn't pass its own timeout
+DEFAULT_TIMEOUT = 30
+
+# How long a resolved tag/document type/correspondent ID is reused (seconds)
+NAME_CACHE_TTL = 3600
+
+_BANNER = "=" * 60
+
+_DRY_RUN_UPLOAD_TEMPLATE = (
+    "\n%s\n🔧 PAPERLESS DRY RUN - Would upload with:\n%s\n"
+    "  File: %s\n  Title: %s\n  Tags: %s\n  Document Type: %s\n"
+    "  Correspondent: %s\n  Created Date: %s\n  URL: %s/api/documents/post_document/\n%s\n"
+)
+
+_DRY_RUN_UPDATE_TEMPLATE = (
+    "\n%s\n🔧 PAPERLESS DRY RUN - Would update document:\n%s\n"
+    "  Document ID: %s\n  Title: %s\n  Tags: %s\n  Document Type: %s\n"
+    "  Correspondent: %s\n  Created Date: %s\n  URL: %s/api/documents/%s/\n%s\n"
+)
+
+_DRY_RUN_UPLOAD_RESULT = types.MappingProxyType({
+    'success': True,
+    'document_id': 'DRY_RUN_12345',
+    'task_id': 'DRY_RUN_TASK',
+    'message': '✓ DRY RUN: Would upload to Paperless (no actual upload performed)',
+    'dry_run': True
+})
+
+# How long a file checksum -> existing document ID match is reused (seconds)
+CHECKSUM_CACHE_TTL = 600
+
+# Upper bound on cached name -> ID entries per client
+NAME_CACHE_MAX_ENTRIES = 10000
+
+# Files at least this large are streamed from disk instead of read into memory
+STREAM_UPLOAD_MIN_BYTES = 8 * 1024 * 1024
+
+# JSON request bodies smaller than this are never worth compressing
+GZIP_MIN_BYTES = 1024
+
+
+class _TimeoutHTTPAdapter(HTTPAdapter):
+    """HTTPAdapter that fills in a default timeout"""
+
+    def __init__(self, *args, timeout=DEFAULT_TIMEOUT, **kwargs):
+        self.timeout = timeout
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, **kwargs):
+        if kwargs.get('timeout') is None:
+            kwargs['timeout'] = self.timeout
+        return super().send(request, **kwargs)
+
+
+class _Retry(Retry):
+    """
+    Retry policy that replays POSTs only when the server refused the body
+
+    A 5xx on an upload or create can arrive after Paperless already stored
+    it, so replaying would duplicate the document or name. The same goes for
+    a read error or read timeout: the body was sent, only the reply was
+    lost. 429 and 503 mean the request was turned away (and carry
+    Retry-After), so those are safe. Connection errors happen before the
+    body is sent and are still retried.
+    """
+
+    POST_STATUS_FORCELIST = frozenset([429, 503])
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        if method.upper() == 'POST' and status_code not in self.POST_STATUS_FORCELIST:
+            return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(self, method=None, url=None, response=None, error=None, _pool=None,
+                  _stacktrace=None):
+        if (method and method.upper() == 'POST'
+                and isinstance(error, (ReadTimeoutError, ProtocolError))):
+            raise error.with_traceback(_stacktrace)
+        return super().increment(method, url, response, error, _pool, _stacktrace)
+
+
+class _RewindableMultipart:
+    """
+    Streaming multipart body that urllib3 can rewind when retrying a request
+
+    MultipartEncoder can only be read once, so a retried upload would otherwise
+    resend an exhausted body. seek(0) rewinds any file fields and starts a fresh
+    encoder with the same boundary.
+    """
+
+    def __init__(self, fields):
+        self.fields = fields
+        self._starts = [
+            (value[1], value[1].tell())
+            for _, value in fields
+            if isinstance(value, tuple) and hasattr(value[1], 'seek')
+        ]
+        self._encoder = MultipartEncoder(fields=fields)
+        self.content_type = self._encoder.content_type
+        self.len = self._encoder.len
+        self._pos = 0
+
+    def read(self, size=-1):
+        chunk = self._encoder.read(size)
+        self._pos += len(chunk)
+        return chunk
+
+    def tell(self):
+        return self._pos
+
+    def seek(self, pos):
+        if pos != 0:
+            raise OSError("multipart body can only be rewound to the start")
+        for fh, start in self._starts:
+            fh.seek(start)
+        self._encoder = MultipartEncoder(fields=self.fields, boundary=self._encoder.boundary_value)
+        self._pos = 0
+
+
+class _TTLCache:
+    """Thread-safe LRU map whose entries expire at a monotonic deadline"""
+
+    def __init__(self, maxsize=NAME_CACHE_MAX_ENTRIES):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return the live value for key, or None if absent or expired"""
+        with self._lock:
+            entry = self._data.get(key)
+            # Expired entries stay until evicted so a 304 revalidation can revive them
+            if entry is None or entry[1] <= time.monotonic():
+                return None
+            self._data.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, expires_at):
+        """Store value until expires_at, evicting the least recently used entry if full"""
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def extend(self, predicate, expires_at):
+        """Push back the expiry of every entry whose key matches predicate; returns how many"""
+        count = 0
+        with self._lock:
+            for key, (value, _) in self._data.items():
+                if predicate(key):
+                    self._data[key] = (value, expires_at)
+                    count += 1
+        return count
+
+    def discard_value(self, value):
+        """Drop every entry that maps to value"""
+        with self._lock:
+            for key in [key for key, entry in self._data.items() if entry[0] == value]:
+                del self._data[key]
+
+    def __len__(self):
+        return len(self._data)
+
+
 class PaperlessClient:
     """Client for Paperless-NGX API"""
 
@@ -16,6 +200,8 @@ class PaperlessClient:
         self.dry_run = dry_run
         self.base_url = os.getenv('PAPERLESS_URL', 'https://paperless.redleif.dev')
         self.api_token = os.getenv('PAPERLESS_API_TOKEN')
+        # Only enable when the server (or its proxy) decodes gzip request bodies
+        self.gzip_requests = os.getenv('PAPERLESS_GZIP_REQUESTS', '').lower() in ('1', 'true', 'yes')
 
         if not self.dry_run and not self.api_token:
             raise ValueError("PAPERLESS_API_TOKEN environment variable not set")
@@ -24,6 +210,67 @@ class PaperlessClient:
             'Authorization': f'Token {self.api_token}'
         } if self.api_token else {}
 
+        # One keep-alive session for every API call instead of a new
+        # TCP/TLS connection per request
+        self.session = requests.Session()
+        self.session.headers.update(self.headers)
+        # Ride out proxy 5xx and 429s with jittered exponential backoff,
+        # honouring any Retry-After the server sends (POSTs: 429/503 only)
+        adapter = _TimeoutHTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=_Retry(
+                total=5,
+                backoff_factor=0.5,
+                backoff_jitter=0.3,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(['GET', 'POST', 'PATCH']),
+                respect_retry_after_header=True
+            )
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
+        # (endpoint, casefolded name) -> id, shared by resolver threads
+        self._name_cache = _TTLCache()
+        # endpoint -> expiry of its prefetched name index
+        self._indexed = {}
+        # endpoint -> ETag of the last name index load
+        self._etags = {}
+        # endpoint -> number of names in the last name index load
+        self._index_sizes = {}
+        # file checksum -> document_id of a copy already in Paperless
+        # (positive matches only, dropped when the document 404s)
+        self._checksum_ids = _TTLCache()
+        # (endpoint, casefolded name) -> Future of a resolve already under way
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        # Runs the independent tag/type/correspondent lookups side by side;
+        # started on first use and shut down by close()
+        self._resolver_pool = None
+        self._resolver_lock = threading.Lock()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Shut down the resolver threads and the HTTP session"""
+        with self._resolver_lock:
+            pool, self._resolver_pool = self._resolver_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+        self.session.close()
+
+    def _resolvers(self):
+        """Thread pool for metadata lookups, created on first use"""
+        with self._resolver_lock:
+            if self._resolver_pool is None:
+                self._resolver_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix='paperless-resolve')
+            return self._resolver_pool
+
     def upload_document(self, file_path, title=None, tags=None, document_type=None,
                        correspondent=None, created_date=None, custom_fields=None):
         """
@@ -41,42 +288,58 @@ class PaperlessClient:
         Returns:
             dict: Response containing document_id if successful
         """
-        file_path = Path(file_path)
-
-        if not file_path.exists():
-            raise FileNotFoundError(f"File not found: {file_path}")
+        file_path = os.fspath(file_path)
+        try:
+            st = os.stat(file_path)
+        except FileNotFoundError:
+            raise FileNotFoundError(f"File not found: {file_path}") from None
+        name = os.path.basename(file_path)
+        stem = os.path.splitext(name)[0]
 
         # DRY RUN MODE
         if self.dry_run:
-            print("\n" + "="*60)
-            print("🔧 PAPERLESS DRY RUN - Would upload with:")
-            print("="*60)
-            print(f"  File: {file_path.name}")
-            print(f"  Title: {title or file_path.stem}")
-            print(f"  Tags: {tags or 'None'}")
-            print(f"  Document Type: {document_type or 'None'}")
-            print(f"  Correspondent: {correspondent or 'None'}")
-            print(f"  Created Date: {created_date or 'None'}")
-            print(f"  URL: {self.base_url}/api/documents/post_document/")
-            print("="*60 + "\n")
+            logger.info(
+                _DRY_RUN_UPLOAD_TEMPLATE, _BANNER, _BANNER,
+                name, title or stem, tags or 'None',
+                document_type or 'None', correspondent or 'None', created_date or 'None',
+                self.base_url, _BANNER
+            )
 
-            return {
+            return dict(_DRY_RUN_UPLOAD_RESULT)
+
+        # Small scans are read once, then hashed and uploaded from memory
+        content = None
+        if st.st_size < STREAM_UPLOAD_MIN_BYTES:
+            with open(file_path, 'rb') as fh:
+                content = fh.read()
+
+        # Skip the upload entirely when Paperless already holds this exact file
+        existing_id = self._find_existing_document(file_path, content)
+        if existing_id is not None:
+            logger.info("✓ Document already in Paperless (ID: %s), skipping upload", existing_id)
+            result = {
                 'success': True,
-                'document_id': 'DRY_RUN_12345',
-                'task_id': 'DRY_RUN_TASK',
-                'message': '✓ DRY RUN: Would upload to Paperless (no actual upload performed)',
-                'dry_run': True
+                'document_id': existing_id,
+                'duplicate': True,
+                'message': 'Document already exists in Paperless'
             }
+            # Re-processing (e.g. with corrections) still updates the metadata
+            if title or tags or document_type or correspondent or created_date:
+                update = self.update_document(
+                    existing_id, title=title, tags=tags, document_type=document_type,
+                    correspondent=correspondent, created_date=created_date
+                )
+                result['success'] = update['success']
+                if not update['success']:
+                    result['error'] = update.get('error')
+                else:
+                    result['message'] = 'Document already exists in Paperless; metadata updated'
+            return result
 
         # Prepare upload URL
         url = f"{self.base_url}/api/documents/post_document/"
 
-        # Prepare files
-        files = {
-            'document': (file_path.name, open(file_path, 'rb'), 'application/pdf')
-        }
-
-        # Prepare data as list of tuples to allow multiple values for same key
+        # Prepare form fields as list of tuples to allow multiple values for same key
         data = []
 
         if title:
@@ -85,33 +348,41 @@ class PaperlessClient:
         if created_date:
             data.append(('created', created_date))
 
+        # Resolve tags, document type and correspondent concurrently
+        pool = self._resolvers() if tags or document_type or correspondent else None
+        f_tags = pool.submit(self._resolve_tags, tags) if tags else None
+        f_type = pool.submit(self._resolve_document_type, document_type) if document_type else None
+        f_corr = pool.submit(self._resolve_correspondent, correspondent) if correspondent else None
+
         # Handle tags - send as multiple form fields
-        if tags:
-            tag_ids = self._resolve_tags(tags)
-            for tag_id in tag_ids:
+        if f_tags:
+            for tag_id in f_tags.result():
                 # Send each tag ID as a separate form field
                 data.append(('tags', str(tag_id)))
 
         # Handle document type
-        if document_type:
-            type_id = self._resolve_document_type(document_type)
+        if f_type:
+            type_id = f_type.result()
             if type_id:
                 data.append(('document_type', str(type_id)))
 
         # Handle correspondent
-        if correspondent:
-            corr_id = self._resolve_correspondent(correspondent)
+        if f_corr:
+            corr_id = f_corr.result()
             if corr_id:
                 data.append(('correspondent', str(corr_id)))
 
         try:
-            response = requests.post(
-                url,
-                headers=self.headers,
-                files=files,
-                data=data,
-                timeout=60
-            )
+            if content is not None:
+                response = self._post_multipart(url, data, (name, content, 'application/pdf'))
+            else:
+                with open(file_path, 'rb') as fh:
+                    if hasattr(os, 'posix_fadvise'):
+                        # Hint the kernel to read ahead for the sequential upload
+                        os.posix_fadvise(fh.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+                    # Stream large scans rather than buffering them in memory
+                    response = self._post_multipart(url, data, (name, fh, 'application/pdf'))
 
             response.raise_for_status()
 
@@ -119,7 +390,7 @@ class PaperlessClient:
             # The UUID is the task ID
             task_id = response.text.strip().strip('"')
 
-            print(f"✓ Paperless upload initiated (task ID: {task_id})")
+            logger.info("✓ Paperless upload initiated (task ID: %s)", task_id)
 
             return {
                 'success': True,
@@ -128,62 +399,358 @@ class PaperlessClient:
             }
 
         except requests.exceptions.RequestException as e:
-            print(f"ERROR: Failed to upload to Paperless: {e}")
+            logger.error("ERROR: Failed to upload to Paperless: %s", e)
             return {
                 'success': False,
                 'error': str(e)
             }
-        finally:
-            # Close file
-            if 'document' in files:
-                files['document'][1].close()
+
+    def _post_multipart(self, url, data, document):
+        """POST form fields plus the document as one multipart body"""
+        body = _RewindableMultipart(data + [('document', document)])
+        return self.session.post(
+            url,
+            data=body,
+            headers={'Content-Type': body.content_type},
+            timeout=60
+        )
+
+    @staticmethod
+    def _file_checksum(file_path, content=None):
+        """MD5 of the file, matching the checksum Paperless stores for originals"""
+        if content is not None:
+            return hashlib.md5(content).hexdigest()
+        with open(file_path, 'rb') as fh:
+            if hasattr(hashlib, 'file_digest'):
+                return hashlib.file_digest(fh, 'md5').hexdigest()
+            digest = hashlib.md5()
+            for chunk in iter(lambda: fh.read(1024 * 1024), b''):
+                digest.update(chunk)
+            return digest.hexdigest()
+
+    def _find_existing_document(self, file_path, content=None):
+        """Return the ID of a Paperless document with identical content, if any"""
+        checksum = self._file_checksum(file_path, content)
+        document_id = self._checksum_ids.get(checksum)
+        if document_id is not None:
+            return document_id
+
+        try:
+            response = self.session.get(
+                f"{self.base_url}/api/documents/",
+                params={'checksum__iexact': checksum, 'page_size': 1}
+            )
+            response.raise_for_status()
+            results = _json_loads(response.content).get('results', [])
+        except (requests.exceptions.RequestException, ValueError) as e:
+            # Dedup is best-effort; fall back to a normal upload
+            logger.warning("WARNING: Duplicate check failed, uploading anyway: %s", e)
+            return None
+
+        if not results:
+            return None
+
+        self._checksum_ids.put(checksum, results[0]['id'], time.monotonic() + CHECKSUM_CACHE_TTL)
+        return results[0]['id']
+
+    def upload_many(self, file_paths, metadata_list=None, max_workers=8):
+        """
+        Upload several documents concurrently over the shared session
+
+        Args:
+            file_paths: Paths to the PDF files
+            metadata_list: Optional list of upload_document keyword dicts, one per file
+            max_workers: Maximum number of uploads in flight
+
+        Returns:
+            list: One upload_document result per file, in input order. Exceptions
+                  are returned as failure dicts instead of aborting the batch.
+        """
+        if metadata_list is None:
+            metadata_list = [{}] * len(file_paths)
+
+        def upload(file_path, metadata):
+            try:
+                return self.upload_document(file_path, **metadata)
+            except Exception as e:
+                logger.error("ERROR: Failed to upload %s to Paperless: %s", file_path, e)
+                return {
+                    'success': False,
+                    'error': str(e)
+                }
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(upload, file_paths, metadata_list))
+
+    def ingest(self, file_path, custom_fields=None, **metadata):
+        """
+        Upload a document with all of its metadata in as few requests as possible
+
+        Title, created date, tags, document type and correspondent all travel in
+        the upload POST. Custom field values can't be set by post_document, so
+        when given they are PATCHed once the consumer task has produced the
+        document.
+
+        Args:
+            file_path: Path to the PDF file
+            custom_fields: Dictionary of custom field ID -> value
+            **metadata: Any other upload_document keyword arguments
+
+        Returns:
+            dict: upload_document result, plus the document_id when custom
+                  fields were applied
+        """
+        result = self.upload_document(file_path, **metadata)
+        if not custom_fields or not result.get('success') or result.get('dry_run'):
+            return result
+
+        document_id = result.get('document_id') or self.wait_for_document(result['task_id'])
+        if document_id is None:
+            return {
+                **result,
+                'success': False,
+                'error': f"Upload task {result['task_id']} produced no document; custom fields not set"
+            }
+
+        update = self.update_document(document_id, custom_fields=custom_fields)
+        return {**result, **update, 'document_id': document_id}
+
+    def wait_for_document(self, task_id, timeout=60, interval=1.0):
+        """
+        Poll a consumer task until it finishes
+
+        Args:
+            task_id: Task ID returned by upload_document
+            timeout: Seconds to wait before giving up
+            interval: Seconds between polls
+
+        Returns:
+            int: ID of the created document, or None if the task failed or timed out
+        """
+        deadline = time.monotonic() + timeout
+        url = f"{self.base_url}/api/tasks/"
+
+        while True:
+            try:
+                response = self.session.get(url, params={'task_id': task_id}, timeout=10)
+                response.raise_for_status()
+                tasks = _json_loads(response.content)
+            except (requests.exceptions.RequestException, ValueError) as e:
+                logger.warning("WARNING: Failed to poll Paperless task %s: %s", task_id, e)
+                tasks = []
+
+            task = tasks[0] if tasks else {}
+            if task.get('status') == 'SUCCESS':
+                related = task.get('related_document')
+                return int(related) if related is not None else None
+            if task.get('status') in ('FAILURE', 'REVOKED'):
+                logger.error("ERROR: Paperless task %s failed: %s", task_id, task.get('result'))
+                return None
+
+            if time.monotonic() + interval > deadline:
+                logger.warning("WARNING: Timed out waiting for Paperless task %s", task_id)
+                return None
+            time.sleep(interval)
 
     def _resolve_tags(self, tags):
-        """Convert tag names to IDs, creating tags if they don't exist"""
-        tag_ids = []
+        """
+        Convert tag names to IDs, creating tags if they don't exist
 
+        Distinct names are answered from the prefetched tag index in one pass;
+        only names it lacks are looked up/created, concurrently when there are several.
+        """
+        names = {}
         for tag in tags:
-            if isinstance(tag, int):
-                tag_ids.append(tag)
-            else:
-                # Look up or create tag
-                tag_id = self._get_or_create_tag(tag)
-                if tag_id:
-                    tag_ids.append(tag_id)
+            if not isinstance(tag, int):
+                names.setdefault(tag.casefold(), tag)
+
+        resolved = {}
+        missing = []
+        if names:
+            self._ensure_name_index('tags')
+            for key, name in names.items():
+                tag_id = self._cached_id('tags', name)
+                if tag_id is None:
+                    missing.append(name)
+                else:
+                    resolved[key] = tag_id
+
+        if len(missing) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(missing))) as executor:
+                for name, tag_id in zip(missing, executor.map(self._get_or_create_tag, missing)):
+                    resolved[name.casefold()] = tag_id
+        elif missing:
+            resolved[missing[0].casefold()] = self._get_or_create_tag(missing[0])
+
+        # Map back in input order
+        tag_ids = []
+        for tag in tags:
+            tag_id = tag if isinstance(tag, int) else resolved[tag.casefold()]
+            if tag_id:
+                tag_ids.append(tag_id)
 
         return tag_ids
 
-    def _get_or_create_tag(self, tag_name):
-        """Get tag ID by name, creating if it doesn't exist"""
+    def _cached_id(self, endpoint, name):
+        """Return the cached ID for a name, or None if absent or expired"""
+        return self._name_cache.get((endpoint, name.casefold()))
+
+    def _ensure_name_index(self, endpoint):
+        """Prefetch an endpoint's name index unless a fresh copy is already loaded"""
+        if self._indexed.get(endpoint, 0) > time.monotonic():
+            return
+
         try:
-            # Search for existing tag
-            url = f"{self.base_url}/api/tags/"
-            response = requests.get(
+            self._warm_name_index(endpoint)
+        except Exception as e:
+            logger.warning("WARNING: Failed to prefetch Paperless %s: %s", endpoint, e)
+
+    def _resolve_named(self, endpoint, name):
+        """
+        Get an object ID by name from a Paperless list endpoint, creating it if missing
+
+        Results are cached per client for NAME_CACHE_TTL seconds, keyed by
+        endpoint and case-folded name (Paperless matches names case-insensitively).
+        A miss first loads the endpoint's whole name index. A name the loaded index
+        lacks is created with a single POST; if that POST reports the name already
+        exists (created since the index was fetched), the index is refreshed instead.
+        Without an index the name is looked up individually before creating it.
+        Concurrent misses for the same name share one lookup rather than racing
+        to create duplicates.
+
+        Args:
+            endpoint: API collection name (tags, document_types, correspondents)
+            name: Object name to resolve
+
+        Returns:
+            int: Object ID
+        """
+        obj_id = self._cached_id(endpoint, name)
+        if obj_id is not None:
+            return obj_id
+
+        key = (endpoint, name.casefold())
+        with self._inflight_lock:
+            future = self._inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._inflight[key] = Future()
+
+        if not owner:
+            return future.result(timeout=30)
+
+        try:
+            obj_id = self._lookup_or_create(endpoint, name)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(obj_id)
+            return obj_id
+        finally:
+            with self._inflight_lock:
+                del self._inflight[key]
+
+    def _lookup_or_create(self, endpoint, name):
+        """Resolve a cache miss for _resolve_named against the API"""
+        self._ensure_name_index(endpoint)
+        obj_id = self._cached_id(endpoint, name)
+        if obj_id is not None:
+            return obj_id
+
+        url = f"{self.base_url}/api/{endpoint}/"
+        indexed = self._indexed.get(endpoint, 0) > time.monotonic()
+
+        if not indexed:
+            # Search for existing object
+            response = self.session.get(
                 url,
-                headers=self.headers,
-                params={'name__iexact': tag_name},
+                params={'name__iexact': name},
                 timeout=10
             )
 
             response.raise_for_status()
-            results = response.json().get('results', [])
+            results = _json_loads(response.content).get('results', [])
 
             if results:
-                return results[0]['id']
-
-            # Create new tag
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json={'name': tag_name},
-                timeout=10
-            )
+                obj_id = results[0]['id']
+                self._name_cache.put((endpoint, name.casefold()), obj_id, time.monotonic() + NAME_CACHE_TTL)
+                return obj_id
+
+        # Create new object
+        response = self.session.post(
+            url,
+            json={'name': name},
+            timeout=10
+        )
+
+        if indexed and response.status_code in (400, 409):
+            # Created elsewhere since the index was loaded
+            self._warm_name_index(endpoint)
+            obj_id = self._cached_id(endpoint, name)
+            if obj_id is not None:
+                return obj_id
+
+        response.raise_for_status()
+        obj_id = _json_loads(response.content)['id']
+
+        self._name_cache.put((endpoint, name.casefold()), obj_id, time.monotonic() + NAME_CACHE_TTL)
+        return obj_id
+
+    def _warm_name_index(self, endpoint):
+        """
+        Load every name -> ID pair from a paginated list endpoint into the cache
 
+        The first page is requested with the ETag from the previous load, so an
+        unchanged index costs a bodiless 304 and only has its expiry extended.
+        If some of its names were evicted from the cache since, the 304 can't
+        restore them and the index is fetched again in full.
+        """
+        expires_at = time.monotonic() + NAME_CACHE_TTL
+
+        url = f"{self.base_url}/api/{endpoint}/"
+        params = {'page_size': 1000}
+        etag = self._etags.get(endpoint)
+        headers = {'If-None-Match': etag} if etag else None
+
+        response = self.session.get(url, params=params, headers=headers, timeout=30)
+        if etag and response.status_code == 304:
+            kept = self._name_cache.extend(lambda key: key[0] == endpoint, expires_at)
+            if kept >= self._index_sizes.get(endpoint, 0):
+                self._indexed[endpoint] = expires_at
+                return
+            response = self.session.get(url, params=params, timeout=30)
+
+        response.raise_for_status()
+        new_etag = response.headers.get('ETag')
+        if new_etag:
+            self._etags[endpoint] = new_etag
+
+        names = set()
+        while True:
+            page = _json_loads(response.content)
+
+            for row in page.get('results', []):
+                key = (endpoint, row['name'].casefold())
+                self._name_cache.put(key, row['id'], expires_at)
+                names.add(key)
+
+            # 'next' is an absolute URL that already carries the query string
+            url = page.get('next')
+            if not url:
+                break
+            response = self.session.get(url, timeout=30)
             response.raise_for_status()
-            return response.json()['id']
 
+        self._index_sizes[endpoint] = len(names)
+        self._indexed[endpoint] = expires_at
+
+    def _get_or_create_tag(self, tag_name):
+        """Get tag ID by name, creating if it doesn't exist"""
+        try:
+            return self._resolve_named('tags', tag_name)
         except Exception as e:
-            print(f"ERROR: Failed to get/create tag '{tag_name}': {e}")
+            logger.error("ERROR: Failed to get/create tag '%s': %s", tag_name, e)
             return None
 
     def _resolve_document_type(self, doc_type):
@@ -192,33 +759,9 @@ class PaperlessClient:
             return doc_type
 
         try:
-            url = f"{self.base_url}/api/document_types/"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params={'name__iexact': doc_type},
-                timeout=10
-            )
-
-            response.raise_for_status()
-            results = response.json().get('results', [])
-
-            if results:
-                return results[0]['id']
-
-            # Create new document type
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json={'name': doc_type},
-                timeout=10
-            )
-
-            response.raise_for_status()
-            return response.json()['id']
-
+            return self._resolve_named('document_types', doc_type)
         except Exception as e:
-            print(f"ERROR: Failed to resolve document type '{doc_type}': {e}")
+            logger.error("ERROR: Failed to resolve document type '%s': %s", doc_type, e)
             return None
 
     def _resolve_correspondent(self, correspondent):
@@ -227,33 +770,9 @@ class PaperlessClient:
             return correspondent
 
         try:
-            url = f"{self.base_url}/api/correspondents/"
-            response = requests.get(
-                url,
-                headers=self.headers,
-                params={'name__iexact': correspondent},
-                timeout=10
-            )
-
-            response.raise_for_status()
-            results = response.json().get('results', [])
-
-            if results:
-                return results[0]['id']
-
-            # Create new correspondent
-            response = requests.post(
-                url,
-                headers=self.headers,
-                json={'name': correspondent},
-                timeout=10
-            )
-
-            response.raise_for_status()
-            return response.json()['id']
-
+            return self._resolve_named('correspondents', correspondent)
         except Exception as e:
-            print(f"ERROR: Failed to resolve correspondent '{correspondent}': {e}")
+            logger.error("ERROR: Failed to resolve correspondent '%s': %s", correspondent, e)
             return None
 
     def update_document(self, document_id, title=None, tags=None, document_type=None,
@@ -268,24 +787,19 @@ class PaperlessClient:
             document_type: Document type name or ID
             correspondent: Correspondent name or ID
             created_date: Document creation date (YYYY-MM-DD)
-            custom_fields: Dictionary of custom field values
+            custom_fields: Dictionary of custom field ID -> value
 
         Returns:
             dict: Response containing success status
         """
         # DRY RUN MODE
         if self.dry_run:
-            print("\n" + "="*60)
-            print("🔧 PAPERLESS DRY RUN - Would update document:")
-            print("="*60)
-            print(f"  Document ID: {document_id}")
-            print(f"  Title: {title or 'No change'}")
-            print(f"  Tags: {tags or 'No change'}")
-            print(f"  Document Type: {document_type or 'No change'}")
-            print(f"  Correspondent: {correspondent or 'No change'}")
-            print(f"  Created Date: {created_date or 'No change'}")
-            print(f"  URL: {self.base_url}/api/documents/{document_id}/")
-            print("="*60 + "\n")
+            logger.info(
+                _DRY_RUN_UPDATE_TEMPLATE, _BANNER, _BANNER,
+                document_id, title or 'No change', tags or 'No change',
+                document_type or 'No change', correspondent or 'No change',
+                created_date or 'No change', self.base_url, document_id, _BANNER
+            )
 
             return {
                 'success': True,
@@ -294,14 +808,6 @@ class PaperlessClient:
                 'dry_run': True
             }
 
-        # Get current document
-        current_doc = self.get_document(document_id)
-        if not current_doc:
-            return {
-                'success': False,
-                'error': f'Document {document_id} not found'
-            }
-
         # Prepare update data
         update_data = {}
 
@@ -311,13 +817,20 @@ class PaperlessClient:
         if created_date:
             update_data['created'] = created_date
 
-        # Handle tags
+        # Handle tags - only a tag merge needs the current document, so plain
+        # field updates go straight to the PATCH. The document is always
+        # re-read so tags added in Paperless since the last update survive.
         if tags:
+            current_doc = self.get_document(document_id)
+            if not current_doc:
+                return {
+                    'success': False,
+                    'error': f'Document {document_id} not found'
+                }
+
             tag_ids = self._resolve_tags(tags)
             # Merge with existing tags instead of replacing
-            existing_tags = current_doc.get('tags', [])
-            all_tags = list(set(existing_tags + tag_ids))
-            update_data['tags'] = all_tags
+            update_data['tags'] = sorted({*current_doc.get('tags', []), *tag_ids})
 
         # Handle document type
         if document_type:
@@ -331,18 +844,26 @@ class PaperlessClient:
             if corr_id:
                 update_data['correspondent'] = corr_id
 
+        if custom_fields:
+            update_data['custom_fields'] = [
+                {'field': int(field_id), 'value': value}
+                for field_id, value in custom_fields.items()
+            ]
+
         try:
             url = f"{self.base_url}/api/documents/{document_id}/"
-            response = requests.patch(
-                url,
-                headers={**self.headers, 'Content-Type': 'application/json'},
-                json=update_data,
-                timeout=30
-            )
+            response = self._patch_json(url, update_data)
+
+            if response.status_code == 404:
+                self._checksum_ids.discard_value(document_id)
+                return {
+                    'success': False,
+                    'error': f'Document {document_id} not found'
+                }
 
             response.raise_for_status()
 
-            print(f"✓ Paperless document {document_id} updated successfully")
+            logger.info("✓ Paperless document %s updated successfully", document_id)
 
             return {
                 'success': True,
@@ -351,21 +872,41 @@ class PaperlessClient:
             }
 
         except requests.exceptions.RequestException as e:
-            print(f"ERROR: Failed to update Paperless document {document_id}: {e}")
+            logger.error("ERROR: Failed to update Paperless document %s: %s", document_id, e)
             return {
                 'success': False,
                 'error': str(e)
             }
 
+    def _patch_json(self, url, data):
+        """PATCH a JSON body, gzip-compressing large bodies when enabled"""
+        if self.gzip_requests:
+            body = json.dumps(data).encode()
+            if len(body) >= GZIP_MIN_BYTES:
+                return self.session.patch(
+                    url,
+                    data=gzip.compress(body),
+                    headers={
+                        'Content-Type': 'application/json',
+                        'Content-Encoding': 'gzip'
+                    },
+                    timeout=30
+                )
+
+        return self.session.patch(url, json=data, timeout=30)
+
     def get_document(self, document_id):
         """Get document details by ID"""
         try:
             url = f"{self.base_url}/api/documents/{document_id}/"
-            response = requests.get(url, headers=self.headers, timeout=10)
+            response = self.session.get(url, timeout=10)
+            if response.status_code == 404:
+                # Deleted in Paperless; re-uploads of its file are no longer duplicates
+                self._checksum_ids.discard_value(document_id)
             response.raise_for_status()
-            return response.json()
+            return _json_loads(response.content)
         except Exception as e:
-            print(f"ERROR: Failed to get document {document_id}: {e}")
+            logger.error("ERROR: Failed to get document %s: %s", document_id, e)
             return None
 
 
@@ -4,13 +4,21 @@ Main Document Processing Orchestrator
 Coordinates document classification, metadata extraction, and routing
 """
 
+import io
 import sys
 import os
 import time
+import errno
+import atexit
 import sqlite3
 import json
+import logging
 import argparse
 import traceback
+import weakref
+import subprocess
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager, redirect_stdout
 from pathlib import Path
 from datetime import datetime
 import shutil
@@ -23,10 +31,119 @@ from paperless import PaperlessClient
 from basicmemory import BasicMemoryNoteCreator
 from notify import NotificationHandler
 
+try:
+    # C-backed serializer for history and queue rows
+    import orjson
+
+    def _dumps(obj, indent=False):
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+except ImportError:
+    def _dumps(obj, indent=False):
+        return json.dumps(obj, indent=2 if indent else None)
+
+# Paperless document type for each category
+_DOC_TYPE_MAP = {
+    'MEDICAL': 'Medical',
+    'CPS_EXPENSE': 'Expense',
+    'SCHOOLWORK': 'Schoolwork',
+    'GENERAL': 'Document'
+}
+
+# Categories that also get a BasicMemory note
+_BASICMEMORY_CATEGORIES = frozenset({'MEDICAL', 'CPS_EXPENSE'})
+
+# Seconds the classification Claude Code call may run before it is killed
+# and the document failed (metadata extraction keeps the classifier's default)
+DEFAULT_CLASSIFY_TIMEOUT = 120
+
+
+class ClassifierTimeout(TimeoutError):
+    """Classification did not finish within the configured timeout"""
+
+
+@contextmanager
+def _buffered_stdout():
+    """Collect stdout output (prints and stdout log records) and emit it in one write"""
+    stdout = sys.stdout
+    buffer = io.StringIO()
+    handlers = [
+        handler for handler in logging.getLogger().handlers
+        if isinstance(handler, logging.StreamHandler) and handler.stream is stdout
+    ]
+    for handler in handlers:
+        handler.setStream(buffer)
+
+    try:
+        with redirect_stdout(buffer):
+            yield
+    finally:
+        for handler in handlers:
+            handler.setStream(stdout)
+        stdout.write(buffer.getvalue())
+        stdout.flush()
+
+# Processors still holding buffered history; one exit hook flushes them,
+# and the weak references never keep a processor alive
+_BUFFERED_PROCESSORS = weakref.WeakSet()
+
+
+@atexit.register
+def _close_buffered_processors():
+    """Flush and close every buffered processor left open at exit"""
+    for processor in list(_BUFFERED_PROCESSORS):
+        processor.close()
+
+
 class DocumentProcessor:
     """Main document processing orchestrator"""
 
-    def __init__(self, base_dir=None, dev_mode=False, corrections=None, paperless_id=None):
+    _PENDING_INSERT_SQL = """
+        INSERT INTO pending_documents (filename, category, question, metadata)
+        VALUES (?, ?, ?, ?)
+    """
+
+    _HISTORY_INSERT_SQL = """
+        INSERT INTO processing_history
+        (filename, category, status, paperless_id, basicmemory_path, processing_time_ms, error_message,
+         classification_prompt, classification_response, metadata_prompt, metadata_response, files_created, corrections)
+        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    """
+
+    # Category -> DocumentClassifier metadata extractor
+    _METADATA_EXTRACTORS = {
+        # CPS categories (dash-based naming)
+        'CPS-MEDICAL': 'extract_medical_metadata',
+        'CPS-EXPENSE': 'extract_expense_metadata',
+        'CPS-SCHOOLWORK': 'extract_schoolwork_metadata',
+        # Personal categories (dash-based naming)
+        'PERSONAL-MEDICAL': 'extract_personal_medical_metadata',
+        'PERSONAL-EXPENSE': 'extract_personal_expense_metadata',
+        'UTILITY': 'extract_utility_metadata',
+        'AUTO-INSURANCE': 'extract_auto_metadata',
+        'AUTO-MAINTENANCE': 'extract_auto_metadata',
+        'AUTO-REGISTRATION': 'extract_auto_metadata',
+    }
+
+    # Category -> BasicMemoryNoteCreator method
+    _NOTE_CREATORS = {
+        # CPS categories go to CoparentingSystem vault
+        'CPS-MEDICAL': 'create_medical_note',
+        'CPS-EXPENSE': 'create_expense_note',
+        # Personal categories go to Personal vault
+        'PERSONAL-MEDICAL': 'create_personal_medical_note',
+        'PERSONAL-EXPENSE': 'create_personal_expense_note',
+        'UTILITY': 'create_utility_note',
+        'AUTO-INSURANCE': 'create_auto_note',
+        'AUTO-MAINTENANCE': 'create_auto_note',
+        'AUTO-REGISTRATION': 'create_auto_note',
+    }
+
+    # Buffered history rows are written once this many have accumulated
+    _HISTORY_BUFFER_MAX = 32
+
+    def __init__(self, base_dir=None, dev_mode=False, corrections=None, paperless_id=None,
+                 buffer_history=False, buffer_output=False, *, classifier=None, paperless=None,
+                 basicmemory=None, notifier=None):
         # Auto-detect container vs host environment
         if base_dir is None:
             if Path('/app/incoming').exists():
@@ -43,12 +160,37 @@ class DocumentProcessor:
         self.completed_dir = self.base_dir / 'completed'
         self.failed_dir = self.base_dir / 'failed'
         self.db_path = self.base_dir / 'queue' / 'pending.db'
-
-        # Initialize components
-        self.classifier = DocumentClassifier(self.base_dir / 'prompts')
-        self.paperless = PaperlessClient(dry_run=dev_mode)
-        self.basicmemory = BasicMemoryNoteCreator(dry_run=dev_mode)
-        self.notifier = NotificationHandler()
+        self._conn = None  # Opened on first database write, see _db
+        # Long-running callers can batch successful history rows into one
+        # transaction; failures are always written straight away
+        self.buffer_history = buffer_history
+        self._history_buf = []
+        if buffer_history:
+            _BUFFERED_PROCESSORS.add(self)
+        # Write each document's step output as one block, so concurrent runs
+        # appending to the same log don't interleave mid-document
+        self.buffer_output = buffer_output
+        self.classify_timeout = float(os.getenv('SCANPROC_CLASSIFY_TIMEOUT', DEFAULT_CLASSIFY_TIMEOUT))
+
+        # Initialize components; long-running callers and tests can pass in
+        # already-built ones to share them across processors. Keep the
+        # PaperlessClient long-lived: its session pools keep-alive connections,
+        # so only the first request per connection pays the TCP/TLS handshake
+        if classifier is None:
+            # The response cache stays opt-in via SCANPROC_CACHE_DIR
+            classifier = DocumentClassifier(self.base_dir / 'prompts')
+        # Clients passed in are shared, so only close the ones built here
+        self._owns_paperless = paperless is None
+        if paperless is None:
+            paperless = PaperlessClient(dry_run=dev_mode)
+        if basicmemory is None:
+            basicmemory = BasicMemoryNoteCreator(dry_run=dev_mode)
+        if notifier is None:
+            notifier = NotificationHandler()
+        self.classifier = classifier
+        self.paperless = paperless
+        self.basicmemory = basicmemory
+        self.notifier = notifier
 
         if self.dev_mode:
             print("\n" + "="*60)
@@ -78,6 +220,14 @@ class DocumentProcessor:
         Returns:
             dict: Processing result
         """
+        if not self.buffer_output:
+            return self._process_document(file_path)
+
+        with _buffered_stdout():
+            return self._process_document(file_path)
+
+    def _process_document(self, file_path):
+        """Pipeline body for process_document"""
         file_path = Path(file_path)
         start_time = time.time()
 
@@ -85,10 +235,15 @@ class DocumentProcessor:
         print(f"Processing: {file_path.name}")
         print(f"{'='*60}")
 
+        # Where the file currently is, so the error path knows what to move
+        # without probing the filesystem
+        stage = 'incoming'
+        processing_path = self.processing_dir / file_path.name
+
         try:
             # Move to processing directory
-            processing_path = self.processing_dir / file_path.name
-            shutil.move(str(file_path), str(processing_path))
+            self._fast_move(file_path, processing_path)
+            stage = 'processing'
             print(f"✓ Moved to processing directory")
 
             # Step 1: Classify document
@@ -98,14 +253,21 @@ class DocumentProcessor:
             if self.corrections and self.corrections.get('override_category'):
                 category = self.corrections['override_category']
                 print(f"📝 Using override category from corrections: {category}")
-                # Still run classification but with correction context
-                classification = self.classifier.classify_document(processing_path, corrections=self.corrections)
-                classification['category'] = category  # Override with correction
+                # The user already chose the category, so skip the classifier call
+                classification = {
+                    'category': category,
+                    'confidence': 1.0,
+                    'needs_clarification': False,
+                    '_prompt': None,
+                    '_response': None,
+                    'override_source': 'user_correction'
+                }
             else:
-                classification = self.classifier.classify_document(processing_path, corrections=self.corrections)
+                classification = self._classify_with_timeout(processing_path)
                 category = classification.get('category', 'GENERAL')
 
             print(f"✓ Category: {category} (confidence: {classification.get('confidence', 0):.2%})")
+            category_lc = category.lower()
 
             # Check if clarification needed
             if classification.get('needs_clarification'):
@@ -122,35 +284,50 @@ class DocumentProcessor:
             metadata = self._extract_metadata(processing_path, category)
             print(f"✓ Metadata extracted")
 
-            # Step 3: Sync to Paperless (Upload or Update)
-            if self.paperless_id:
-                print(f"\n[3/5] Updating existing Paperless document {self.paperless_id}...")
-                paperless_result = self._update_paperless_metadata(self.paperless_id, category, metadata)
-                paperless_id = self.paperless_id
-            else:
-                print("\n[3/5] Uploading to Paperless...")
-                paperless_result = self._upload_to_paperless(processing_path, category, metadata)
-                paperless_id = paperless_result.get('document_id')
-
-            if paperless_result.get('success'):
-                action = "Updated" if self.paperless_id else "Uploaded to"
-                print(f"✓ {action} Paperless (ID: {paperless_id})")
-            else:
-                action = "update" if self.paperless_id else "upload"
-                print(f"✗ Paperless {action} failed: {paperless_result.get('error')}")
+            # Steps 3 and 4 are independent network calls, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                # Step 3: Sync to Paperless (Upload or Update)
+                if self.paperless_id:
+                    print(f"\n[3/5] Updating existing Paperless document {self.paperless_id}...")
+                    paperless_future = executor.submit(
+                        self._update_paperless_metadata, self.paperless_id, category, metadata,
+                        category_lc
+                    )
+                else:
+                    print("\n[3/5] Uploading to Paperless...")
+                    paperless_future = executor.submit(
+                        self._upload_to_paperless, processing_path, category, metadata, category_lc
+                    )
+
+                # Step 4: Create BasicMemory note (for MEDICAL and CPS_EXPENSE only)
+                basicmemory_future = None
+                if category in _BASICMEMORY_CATEGORIES:
+                    print(f"\n[4/5] Creating BasicMemory note...")
+                    basicmemory_future = executor.submit(self._create_basicmemory_note, category, metadata)
+                else:
+                    print(f"\n[4/5] Skipping BasicMemory note (category: {category})")
 
-            # Step 4: Create BasicMemory note (for MEDICAL and CPS_EXPENSE only)
-            basicmemory_path = None
-            if category in ['MEDICAL', 'CPS_EXPENSE']:
-                print(f"\n[4/5] Creating BasicMemory note...")
-                basicmemory_path = self._create_basicmemory_note(category, metadata)
+                paperless_result = paperless_future.result()
+                if self.paperless_id:
+                    paperless_id = self.paperless_id
+                else:
+                    paperless_id = paperless_result.get('document_id')
 
-                if basicmemory_path:
-                    print(f"✓ BasicMemory note created: {basicmemory_path}")
+                if paperless_result.get('success'):
+                    action = "Updated" if self.paperless_id else "Uploaded to"
+                    print(f"✓ {action} Paperless (ID: {paperless_id})")
                 else:
-                    print(f"⚠ BasicMemory note creation skipped or failed")
-            else:
-                print(f"\n[4/5] Skipping BasicMemory note (category: {category})")
+                    action = "update" if self.paperless_id else "upload"
+                    print(f"✗ Paperless {action} failed: {paperless_result.get('error')}")
+
+                basicmemory_path = None
+                if basicmemory_future:
+                    basicmemory_path = basicmemory_future.result()
+
+                    if basicmemory_path:
+                        print(f"✓ BasicMemory note created: {basicmemory_path}")
+                    else:
+                        print(f"⚠ BasicMemory note creation skipped or failed")
 
             # Step 5: Send notification
             print("\n[5/5] Sending notification...")
@@ -164,7 +341,8 @@ class DocumentProcessor:
 
             # Move to completed
             completed_path = self.completed_dir / file_path.name
-            shutil.move(str(processing_path), str(completed_path))
+            self._fast_move(processing_path, completed_path)
+            stage = 'completed'
             print(f"\n✓ Moved to completed directory")
 
             # Log to history with prompts, responses, and files created
@@ -225,18 +403,19 @@ class DocumentProcessor:
                 print(traceback.format_exc())
                 print("="*60 + "\n")
 
-            # Move to failed directory
-            try:
-                failed_path = self.failed_dir / file_path.name
-                if processing_path.exists():
-                    shutil.move(str(processing_path), str(failed_path))
-                elif file_path.exists():
-                    shutil.move(str(file_path), str(failed_path))
-                print(f"✓ Moved to failed directory")
-            except Exception as move_error:
-                print(f"✗ Failed to move file: {move_error}")
-                if self.dev_mode:
-                    print(f"Move error traceback: {traceback.format_exc()}")
+            # Move to failed directory (a file already in completed stays there)
+            if stage != 'completed':
+                try:
+                    failed_path = self.failed_dir / file_path.name
+                    if stage == 'processing':
+                        self._fast_move(processing_path, failed_path)
+                    else:
+                        self._fast_move(file_path, failed_path)
+                    print(f"✓ Moved to failed directory")
+                except Exception as move_error:
+                    print(f"✗ Failed to move file: {move_error}")
+                    if self.dev_mode:
+                        print(f"Move error traceback: {traceback.format_exc()}")
 
             # Send failure notification (skip in dev mode)
             if not self.dev_mode:
@@ -263,45 +442,64 @@ class DocumentProcessor:
                 'processing_time_ms': processing_time_ms
             }
 
+    def _classify_with_timeout(self, file_path):
+        """
+        Classify a document, failing it if Claude Code runs out of time
+
+        classify_timeout is passed down as the classification subprocess
+        timeout, so a hung CLI is killed and nothing is left running.
+
+        Raises:
+            ClassifierTimeout: Classification took too long
+        """
+        try:
+            return self.classifier.classify_document(
+                file_path, corrections=self.corrections, timeout=self.classify_timeout
+            )
+        except subprocess.TimeoutExpired as e:
+            raise ClassifierTimeout(f"Classification timed out after {e.timeout:g}s") from None
+
+    @staticmethod
+    def _fast_move(src, dst):
+        """Move a file with one atomic rename, copying only across filesystems"""
+        try:
+            os.replace(src, dst)
+        except OSError as e:
+            if e.errno != errno.EXDEV:
+                raise
+            shutil.move(str(src), str(dst))
+
     def _extract_metadata(self, file_path, category):
         """Extract metadata based on document category"""
-        # CPS categories (dash-based naming)
-        if category == 'CPS-MEDICAL':
-            return self.classifier.extract_medical_metadata(file_path, corrections=self.corrections)
-        elif category == 'CPS-EXPENSE':
-            return self.classifier.extract_expense_metadata(file_path, corrections=self.corrections)
-        elif category == 'CPS-SCHOOLWORK':
-            return self.classifier.extract_schoolwork_metadata(file_path, corrections=self.corrections)
-        
-        # Personal categories (dash-based naming)
-        elif category == 'PERSONAL-MEDICAL':
-            return self.classifier.extract_personal_medical_metadata(file_path, corrections=self.corrections)
-        elif category == 'PERSONAL-EXPENSE':
-            return self.classifier.extract_personal_expense_metadata(file_path, corrections=self.corrections)
-        elif category == 'UTILITY':
-            return self.classifier.extract_utility_metadata(file_path, corrections=self.corrections)
-        elif category in ['AUTO-INSURANCE', 'AUTO-MAINTENANCE', 'AUTO-REGISTRATION']:
-            return self.classifier.extract_auto_metadata(file_path, corrections=self.corrections)
-        
-        # Categories without specific extractors (GENERAL, REFERENCE, etc.)
-        else:
+        # Categories without specific extractors (GENERAL, REFERENCE, etc.) get none
+        extractor = self._METADATA_EXTRACTORS.get(category)
+        if extractor is None:
             return {}
+        return getattr(self.classifier, extractor)(file_path, corrections=self.corrections)
 
-    def _upload_to_paperless(self, file_path, category, metadata):
+    def _upload_to_paperless(self, file_path, category, metadata, category_lc=None):
         """Upload document to Paperless with appropriate tags"""
-        tags = [category.lower()]
+        if category_lc is None:
+            category_lc = category.lower()
+
+        if not metadata:
+            # Nothing extracted (GENERAL, REFERENCE, ...): category tag and filename title
+            return self.paperless.upload_document(
+                file_path=file_path,
+                title=file_path.stem,
+                tags=[category_lc],
+                document_type=_DOC_TYPE_MAP.get(category, 'Document'),
+                created_date=None
+            )
+
+        tags = [category_lc]
 
         # Add child tag if available
         if metadata.get('child'):
             tags.append(metadata['child'].lower())
 
         # Determine document type
-        doc_type = {
-            'MEDICAL': 'Medical',
-            'CPS_EXPENSE': 'Expense',
-            'SCHOOLWORK': 'Schoolwork',
-            'GENERAL': 'Document'
-        }.get(category, 'Document')
+        doc_type = _DOC_TYPE_MAP.get(category, 'Document')
 
         # Upload
         return self.paperless.upload_document(
@@ -312,21 +510,29 @@ class DocumentProcessor:
             created_date=metadata.get('date')
         )
 
-    def _update_paperless_metadata(self, document_id, category, metadata):
+    def _update_paperless_metadata(self, document_id, category, metadata, category_lc=None):
         """Update existing Paperless document metadata with Claude-extracted info"""
-        tags = [category.lower()]
+        if category_lc is None:
+            category_lc = category.lower()
+
+        if not metadata:
+            # Nothing extracted: only the category tag and document type change
+            return self.paperless.update_document(
+                document_id=document_id,
+                title=None,
+                tags=[category_lc],
+                document_type=_DOC_TYPE_MAP.get(category, 'Document'),
+                created_date=None
+            )
+
+        tags = [category_lc]
 
         # Add child tag if available
         if metadata.get('child'):
             tags.append(metadata['child'].lower())
 
         # Determine document type
-        doc_type = {
-            'MEDICAL': 'Medical',
-            'CPS_EXPENSE': 'Expense',
-            'SCHOOLWORK': 'Schoolwork',
-            'GENERAL': 'Document'
-        }.get(category, 'Document')
+        doc_type = _DOC_TYPE_MAP.get(category, 'Document')
 
         # Update (merges with existing tags, doesn't replace)
         return self.paperless.update_document(
@@ -340,49 +546,69 @@ class DocumentProcessor:
     def _create_basicmemory_note(self, category, metadata):
         """Create BasicMemory note with dual-vault routing"""
         try:
-            # CPS categories go to CoparentingSystem vault
-            if category == 'CPS-MEDICAL':
-                return self.basicmemory.create_medical_note(metadata)
-            elif category == 'CPS-EXPENSE':
-                return self.basicmemory.create_expense_note(metadata)
-            
-            # Personal categories go to Personal vault
-            elif category == 'PERSONAL-MEDICAL':
-                return self.basicmemory.create_personal_medical_note(metadata)
-            elif category == 'PERSONAL-EXPENSE':
-                return self.basicmemory.create_personal_expense_note(metadata)
-            elif category == 'UTILITY':
-                return self.basicmemory.create_utility_note(metadata)
-            elif category in ['AUTO-INSURANCE', 'AUTO-MAINTENANCE', 'AUTO-REGISTRATION']:
-                return self.basicmemory.create_auto_note(metadata)
-            
             # Other categories don't get BasicMemory notes
-            else:
+            creator = self._NOTE_CREATORS.get(category)
+            if creator is None:
                 return None
-                
+            return getattr(self.basicmemory, creator)(metadata)
+
         except Exception as e:
             print(f"ERROR creating BasicMemory note: {e}")
             return None
 
+    @property
+    def _db(self):
+        """Shared autocommit connection to the queue database, opened on first use"""
+        if self._conn is None:
+            self._conn = sqlite3.connect(str(self.db_path), isolation_level=None, check_same_thread=False)
+            # WAL + NORMAL sync: one fsync per checkpoint instead of per write
+            self._conn.executescript(
+                "PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL; PRAGMA temp_store=MEMORY;"
+            )
+        return self._conn
+
+    def flush_history(self):
+        """Write any buffered history rows in a single transaction"""
+        if not self._history_buf:
+            return
+
+        rows, self._history_buf = self._history_buf, []
+        db = self._db
+        db.execute("BEGIN")
+        try:
+            db.executemany(self._HISTORY_INSERT_SQL, rows)
+        except Exception:
+            db.execute("ROLLBACK")
+            raise
+        db.execute("COMMIT")
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def close(self):
+        """Flush buffered history, close the database connection and any Paperless client built here"""
+        _BUFFERED_PROCESSORS.discard(self)
+        self.flush_history()
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        # Also reached via atexit when __init__ failed before building clients
+        if getattr(self, '_owns_paperless', False):
+            self.paperless.close()
+
     def _handle_clarification_needed(self, file_path, classification):
         """Handle document that needs clarification"""
         # Add to pending database
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
-        cursor.execute("""
-            INSERT INTO pending_documents (filename, category, question, metadata)
-            VALUES (?, ?, ?, ?)
-        """, (
+        self._db.execute(self._PENDING_INSERT_SQL, (
             file_path.name,
             classification.get('category', 'UNKNOWN'),
             classification.get('clarification_question', 'Please review this document'),
-            json.dumps(classification.get('metadata', {}))
+            _dumps(classification.get('metadata', {}))
         ))
 
-        conn.commit()
-        conn.close()
-
         # Send notification
         self.notifier.notify_clarification_needed(
             filename=file_path.name,
@@ -396,20 +622,11 @@ class DocumentProcessor:
                        metadata_prompt=None, metadata_response=None, files_created=None,
                        corrections=None):
         """Log processing result to history database"""
-        conn = sqlite3.connect(str(self.db_path))
-        cursor = conn.cursor()
-
         # Convert files_created list to JSON if provided
-        import json
-        files_created_json = json.dumps(files_created) if files_created else None
-        corrections_json = json.dumps(corrections) if corrections else None
-
-        cursor.execute("""
-            INSERT INTO processing_history
-            (filename, category, status, paperless_id, basicmemory_path, processing_time_ms, error_message,
-             classification_prompt, classification_response, metadata_prompt, metadata_response, files_created, corrections)
-            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """, (
+        files_created_json = _dumps(files_created) if files_created else None
+        corrections_json = _dumps(corrections) if corrections else None
+
+        self._history_buf.append((
             filename,
             category,
             status,
@@ -425,15 +642,17 @@ class DocumentProcessor:
             corrections_json
         ))
 
-        conn.commit()
-        conn.close()
+        if (not self.buffer_history or status != 'success'
+                or len(self._history_buf) >= self._HISTORY_BUFFER_MAX):
+            self.flush_history()
 
 
-if __name__ == '__main__':
+def _build_parser():
+    """Command-line interface for process.py"""
     parser = argparse.ArgumentParser(
         description='Process scanned documents through classification and routing pipeline'
     )
-    parser.add_argument('file_path', help='Path to the PDF document to process')
+    parser.add_argument('file_path', nargs='?', help='Path to the PDF document to process')
     parser.add_argument(
         '--dev', '--dry-run',
         action='store_true',
@@ -451,13 +670,30 @@ if __name__ == '__main__':
         dest='paperless_id',
         help='Existing Paperless document ID to update instead of uploading new document'
     )
+    parser.add_argument(
+        '--serve',
+        action='store_true',
+        help='Process document paths read from stdin, one per line, reusing one processor'
+    )
+    return parser
+
+
+_PARSER = _build_parser()
+
+
+if __name__ == '__main__':
+    args = _PARSER.parse_args()
+    if args.serve and (args.file_path or args.paperless_id):
+        _PARSER.error('--serve reads paths from stdin and cannot be combined with file_path or --paperless-id')
+    if not args.serve and not args.file_path:
+        _PARSER.error('file_path is required unless --serve is given')
 
-    args = parser.parse_args()
+    # Client modules log progress; send it to stdout alongside the step output
+    logging.basicConfig(level=logging.INFO, format='%(message)s', stream=sys.stdout)
 
     # Parse corrections if provided
     corrections = None
     if args.corrections:
-        import json
         try:
             corrections = json.loads(args.corrections)
             print(f"\n📝 Re-processing with corrections:")
@@ -472,9 +708,26 @@ if __name__ == '__main__':
     processor = DocumentProcessor(
         dev_mode=args.dev_mode,
         corrections=corrections,
-        paperless_id=args.paperless_id
+        paperless_id=args.paperless_id,
+        # Interactive runs keep live step output
+        buffer_output=not sys.stdout.isatty()
     )
-    result = processor.process_document(args.file_path)
 
-    print(f"\nFinal result: {json.dumps(result, indent=2)}")
-    sys.exit(0 if result['status'] == 'success' else 1)
+    with processor:
+        if args.serve:
+            # Long-lived mode: clients, prompts and the DB connection are set up
+            # once, and Paperless connections stay open between documents
+            failures = 0
+            for line in sys.stdin:
+                file_path = line.strip()
+                if not file_path:
+                    continue
+                result = processor.process_document(file_path)
+                print(f"\nFinal result: {_dumps(result, indent=True)}", flush=True)
+                failures += result['status'] != 'success'
+            sys.exit(0 if failures == 0 else 1)
+
+        result = processor.process_document(args.file_path)
+
+        print(f"\nFinal result: {_dumps(result, indent=True)}")
+        sys.exit(0 if result['status'] == 'success' else 1)
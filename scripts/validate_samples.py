@@ -8,16 +8,32 @@ Tests all 48 sample PDFs through the classification system to verify:
 - Expected categories match actual results
 """
 
+import io
+import os
 import sys
 import json
+import argparse
+import tempfile
+import threading
 from pathlib import Path
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
 
 # Add scripts to path
 sys.path.insert(0, str(Path(__file__).parent))
 
 from classifier import DocumentClassifier
 
+try:
+    import orjson
+
+    def _dumps(obj):
+        return orjson.dumps(obj).decode()
+except ImportError:
+    def _dumps(obj):
+        return json.dumps(obj)
+
 
 # Expected classifications for each sample category
 EXPECTED_CATEGORIES = {
@@ -30,14 +46,82 @@ EXPECTED_CATEGORIES = {
 }
 
 
-def validate_samples(samples_dir='samples', verbose=False, use_real_classifier=False):
+class _WorkerStdout(io.TextIOBase):
+    """
+    stdout stand-in that holds each worker thread's output
+
+    Writes from a thread inside capture() go to that thread's buffer, so the
+    main thread can print a sample's output in one piece instead of
+    interleaving it with other workers. Other writes pass straight through.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def write(self, text):
+        buffer = getattr(self._local, 'buffer', None)
+        return (buffer or self.stream).write(text)
+
+    def flush(self):
+        self.stream.flush()
+
+    def capture(self, func, *args):
+        """Run func(*args) in this thread, returning (result, error, output)"""
+        self._local.buffer = io.StringIO()
+        try:
+            return func(*args), None, self._local.buffer.getvalue()
+        except Exception as e:
+            return None, e, self._local.buffer.getvalue()
+        finally:
+            self._local.buffer = None
+
+
+def _classify_sample(classifier, pdf_file, expected_category, use_real_classifier):
+    """Classify one sample, or simulate the expected result"""
+    if use_real_classifier:
+        # Use actual Claude Code classification
+        return classifier.classify_document(pdf_file)
+
+    # SIMULATION: Return expected result
+    return {
+        'category': expected_category,
+        'confidence': 0.95,
+        'is_cps_related': False,
+        'reasoning': f'Simulated classification for {os.path.basename(pdf_file)}'
+    }
+
+
+def _write_record(report, record):
+    """Append one JSON Lines record and push it to disk straight away"""
+    report.write(_dumps(record) + '\n')
+    report.flush()
+
+
+def _read_report(report, kind):
+    """Yield the records of one kind from the failure report"""
+    report.seek(0)
+    for line in report:
+        record = json.loads(line)
+        if record.pop('kind') == kind:
+            yield record
+
+
+def validate_samples(samples_dir='samples', verbose=False, use_real_classifier=False,
+                     max_workers=None, report_path=None):
     """
     Validate all sample documents
 
+    Samples are classified concurrently (each real classification is an
+    independent Claude Code call); results are reported in directory order.
+
     Args:
         samples_dir: Directory containing sample PDFs
         verbose: Print detailed results for each sample
         use_real_classifier: Use actual Claude Code classification (slow)
+        max_workers: Concurrent classifications (default: 2 per CPU, at most 8)
+        report_path: JSON Lines file that failures and errors are appended to as
+                     they happen (default: a temporary file)
 
     Returns:
         dict: Validation results summary
@@ -59,80 +143,102 @@ def validate_samples(samples_dir='samples', verbose=False, use_real_classifier=F
         'by_category': defaultdict(lambda: {'total': 0, 'passed': 0, 'failed': 0, 'errors': 0})
     }
 
-    failed_samples = []
-    error_samples = []
-
-    # Process each category directory
-    for category_dir in sorted(samples_path.iterdir()):
-        if not category_dir.is_dir():
-            continue
-
-        category_name = category_dir.name
+    # Failures and errors are streamed to disk rather than held in memory, so
+    # large runs stay small and a killed run keeps its partial report
+    report = open(report_path, 'w+') if report_path else tempfile.TemporaryFile('w+')
+    stdout = _WorkerStdout(sys.stdout)
+
+    # Collect every sample up front so classification can run concurrently;
+    # scandir entries carry their type, so no per-file stat is needed
+    with os.scandir(samples_path) as it:
+        category_entries = sorted(
+            (entry for entry in it if entry.is_dir(follow_symlinks=False)),
+            key=lambda entry: entry.name
+        )
+
+    categories = []
+    for category_entry in category_entries:
+        category_name = category_entry.name
         expected_category = EXPECTED_CATEGORIES.get(category_name)
 
         if not expected_category:
             print(f"\nWARNING: Unknown category directory: {category_name}")
             continue
 
-        print(f"\n{'='*60}")
-        print(f"Testing {category_name.upper()} samples")
-        print(f"Expected category: {expected_category}")
-        print(f"{'='*60}")
-
-        # Process each PDF in category
-        for pdf_file in sorted(category_dir.glob('*.pdf')):
-            results['total'] += 1
-            results['by_category'][category_name]['total'] += 1
-
-            try:
-                # Classify the document
-                if verbose:
-                    print(f"\nTesting: {pdf_file.name}")
-
-                if use_real_classifier:
-                    # Use actual Claude Code classification
-                    result = classifier.classify_document(str(pdf_file))
-                else:
-                    # SIMULATION: Return expected result
-                    result = {
-                        'category': expected_category,
-                        'confidence': 0.95,
-                        'is_cps_related': False,
-                        'reasoning': f'Simulated classification for {pdf_file.name}'
-                    }
-
-                actual_category = result.get('category', 'UNKNOWN')
-                confidence = result.get('confidence', 0.0)
-
-                # Check if classification matches expected
-                if actual_category == expected_category:
-                    results['passed'] += 1
-                    results['by_category'][category_name]['passed'] += 1
-
+        with os.scandir(category_entry.path) as it:
+            pdf_files = sorted(
+                entry.path for entry in it
+                if entry.is_file() and entry.name.endswith('.pdf')
+            )
+
+        categories.append((category_name, expected_category, pdf_files))
+
+    if max_workers is None:
+        max_workers = min(8, (os.cpu_count() or 1) * 2)
+
+    with redirect_stdout(stdout), ThreadPoolExecutor(max_workers=max_workers) as executor:
+        # Workers only classify; all printing happens here as results arrive
+        futures = {
+            pdf_file: executor.submit(stdout.capture, _classify_sample, classifier, pdf_file,
+                                      expected_category, use_real_classifier)
+            for _, expected_category, pdf_files in categories
+            for pdf_file in pdf_files
+        }
+
+        # Report each category in order as its results come in
+        for category_name, expected_category, pdf_files in categories:
+            print(f"\n{'='*60}")
+            print(f"Testing {category_name.upper()} samples")
+            print(f"Expected category: {expected_category}")
+            print(f"{'='*60}")
+
+            for pdf_file in pdf_files:
+                results['total'] += 1
+                results['by_category'][category_name]['total'] += 1
+
+                try:
                     if verbose:
-                        print(f"  ✓ PASS: {actual_category} (confidence: {confidence:.2%})")
-                else:
-                    results['failed'] += 1
-                    results['by_category'][category_name]['failed'] += 1
-                    failed_samples.append({
-                        'file': str(pdf_file),
-                        'expected': expected_category,
-                        'actual': actual_category,
-                        'confidence': confidence
+                        print(f"\nTesting: {os.path.basename(pdf_file)}")
+
+                    result, error, output = futures[pdf_file].result()
+                    print(output, end='')
+                    if error is not None:
+                        raise error
+
+                    actual_category = result.get('category', 'UNKNOWN')
+                    confidence = result.get('confidence', 0.0)
+
+                    # Check if classification matches expected
+                    if actual_category == expected_category:
+                        results['passed'] += 1
+                        results['by_category'][category_name]['passed'] += 1
+
+                        if verbose:
+                            print(f"  ✓ PASS: {actual_category} (confidence: {confidence:.2%})")
+                    else:
+                        results['failed'] += 1
+                        results['by_category'][category_name]['failed'] += 1
+                        _write_record(report, {
+                            'kind': 'failure',
+                            'file': pdf_file,
+                            'expected': expected_category,
+                            'actual': actual_category,
+                            'confidence': confidence
+                        })
+
+                        print(f"  ✗ FAIL: Expected {expected_category}, got {actual_category}")
+                        print(f"    Confidence: {confidence:.2%}")
+
+                except Exception as e:
+                    results['errors'] += 1
+                    results['by_category'][category_name]['errors'] += 1
+                    _write_record(report, {
+                        'kind': 'error',
+                        'file': pdf_file,
+                        'error': str(e)
                     })
 
-                    print(f"  ✗ FAIL: Expected {expected_category}, got {actual_category}")
-                    print(f"    Confidence: {confidence:.2%}")
-
-            except Exception as e:
-                results['errors'] += 1
-                results['by_category'][category_name]['errors'] += 1
-                error_samples.append({
-                    'file': str(pdf_file),
-                    'error': str(e)
-                })
-
-                print(f"  ✗ ERROR: {e}")
+                    print(f"  ✗ ERROR: {e}")
 
     # Print summary
     print(f"\n{'='*60}")
@@ -156,37 +262,45 @@ def validate_samples(samples_dir='samples', verbose=False, use_real_classifier=F
         print(f"  ⚠ Errors: {cat_results['errors']}/{cat_results['total']}")
 
     # Print failures
-    if failed_samples:
-        print(f"\n{'='*60}")
-        print("FAILED CLASSIFICATIONS")
-        print(f"{'='*60}")
-        for failure in failed_samples:
-            print(f"\n{failure['file']}")
-            print(f"  Expected: {failure['expected']}")
-            print(f"  Actual: {failure['actual']}")
-            print(f"  Confidence: {failure['confidence']:.2%}")
-
-    # Print errors
-    if error_samples:
-        print(f"\n{'='*60}")
-        print("ERRORS")
-        print(f"{'='*60}")
-        for error in error_samples:
-            print(f"\n{error['file']}")
-            print(f"  Error: {error['error']}")
+    with report:
+        if results['failed']:
+            print(f"\n{'='*60}")
+            print("FAILED CLASSIFICATIONS")
+            print(f"{'='*60}")
+            for failure in _read_report(report, 'failure'):
+                print(f"\n{failure['file']}")
+                print(f"  Expected: {failure['expected']}")
+                print(f"  Actual: {failure['actual']}")
+                print(f"  Confidence: {failure['confidence']:.2%}")
+
+        # Print errors
+        if results['errors']:
+            print(f"\n{'='*60}")
+            print("ERRORS")
+            print(f"{'='*60}")
+            for error in _read_report(report, 'error'):
+                print(f"\n{error['file']}")
+                print(f"  Error: {error['error']}")
 
     return results
 
 
-if __name__ == '__main__':
-    import argparse
-
+def _build_parser():
+    """Command-line interface for validate_samples.py"""
     parser = argparse.ArgumentParser(description='Validate sample documents')
     parser.add_argument('--samples-dir', default='samples', help='Samples directory')
     parser.add_argument('--verbose', '-v', action='store_true', help='Verbose output')
     parser.add_argument('--real', action='store_true', help='Use real Claude Code (slow!)')
+    parser.add_argument('--workers', type=int, default=None, help='Concurrent classifications')
+    parser.add_argument('--report', default=None, help='Write failures and errors to this JSON Lines file')
+    return parser
+
 
-    args = parser.parse_args()
+_PARSER = _build_parser()
+
+
+if __name__ == '__main__':
+    args = _PARSER.parse_args()
 
     if not args.real:
         print("=" * 60)
@@ -199,7 +313,9 @@ if __name__ == '__main__':
     results = validate_samples(
         samples_dir=args.samples_dir,
         verbose=args.verbose,
-        use_real_classifier=args.real
+        use_real_classifier=args.real,
+        max_workers=args.workers,
+        report_path=args.report
     )
 
     # Exit code based on results
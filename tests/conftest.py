@@ -11,129 +11,183 @@ Provides reusable fixtures for testing:
 
 import pytest
 import json
-import tempfile
-import sqlite3
+import shutil
 from pathlib import Path
-from datetime import datetime, timedelta
-from reportlab.pdfgen import canvas
-from reportlab.lib.pagesizes import letter
-import sys
 import os
+from types import MappingProxyType, SimpleNamespace
 
-# Add scripts directory to Python path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+def pytest_addoption(parser):
+    parser.addoption(
+        "--keep-tmp", action="store_true", default=False,
+        help="Keep each test's tmp_path instead of deleting it after a passing run"
+    )
 
 
-# ========== Claude Code Mock Responses ==========
+def pytest_configure(config):
+    """Default benchmarks to disabled for normal test runs"""
+    # With pytest-benchmark installed, benchmarks only run once untimed in a
+    # normal run; use --benchmark-only or --benchmark-enable to measure
+    if (hasattr(config.option, "benchmark_disable")
+            and not config.option.benchmark_only
+            and not config.option.benchmark_enable):
+        config.option.benchmark_disable = True
+
 
 @pytest.fixture
-def mock_claude_response_personal_medical():
-    """Mock Claude Code CLI response for PERSONAL-MEDICAL classification"""
-    return {
+def tmp_path(tmp_path, request):
+    """Per-test temp dir, removed after the test while the run is green
+
+    Pytest otherwise keeps the last three runs' trees around. Directories
+    are left in place once anything has failed, or with ``--keep-tmp``,
+    so they can be inspected.
+    """
+    yield tmp_path
+    if (request.session.testsfailed == 0
+            and not request.config.getoption("--keep-tmp")):
+        shutil.rmtree(tmp_path, ignore_errors=True)
+
+
+# ========== Claude Code Mock Responses ==========
+
+# Mock Claude Code CLI classification responses, keyed by scenario
+_CLAUDE_RESPONSES = MappingProxyType({
+    "personal_medical": MappingProxyType({
         "category": "PERSONAL-MEDICAL",
         "confidence": 0.95,
         "is_cps_related": False,
         "reasoning": "This is a personal medical document containing healthcare information."
-    }
-
-
-@pytest.fixture
-def mock_claude_response_cps_medical():
-    """Mock Claude Code CLI response for CPS-MEDICAL classification"""
-    return {
+    }),
+    "cps_medical": MappingProxyType({
         "category": "CPS-MEDICAL",
         "confidence": 0.92,
         "is_cps_related": True,
         "reasoning": "This document relates to a child's medical care and should be tracked in the co-parenting system."
-    }
-
-
-@pytest.fixture
-def mock_claude_response_utility():
-    """Mock Claude Code CLI response for UTILITY classification"""
-    return {
+    }),
+    "utility": MappingProxyType({
         "category": "UTILITY",
         "confidence": 0.88,
         "is_cps_related": False,
         "reasoning": "This is a utility bill for household services."
-    }
-
-
-@pytest.fixture
-def mock_claude_response_auto():
-    """Mock Claude Code CLI response for AUTO-* classification"""
-    return {
+    }),
+    "auto": MappingProxyType({
         "category": "AUTO-INSURANCE",
         "confidence": 0.90,
         "is_cps_related": False,
         "reasoning": "This is an auto insurance document."
-    }
+    }),
+})
+
+
+@pytest.fixture(params=list(_CLAUDE_RESPONSES))
+def mock_claude_response(request):
+    """Mock Claude Code CLI classification response
+
+    Runs once per scenario in ``_CLAUDE_RESPONSES``; pick a single one with
+    ``@pytest.mark.parametrize("mock_claude_response", [...], indirect=True)``.
+
+    Returns:
+        dict: Fresh copy of the response, safe to mutate or serialize
+    """
+    return dict(_CLAUDE_RESPONSES[request.param])
+
+
+# Mock metadata extraction responses
+_PERSONAL_MEDICAL_METADATA = MappingProxyType({
+    "provider": "Dr. Smith Family Medicine",
+    "date": "2025-09-15",
+    "amount": 125.50,
+    "type": "medical_bill",
+    "description": "Office visit and lab work"
+})
+
+_UTILITY_METADATA = MappingProxyType({
+    "utility_type": "electric",
+    "provider": "City Power & Light",
+    "billing_date": "2025-12-01",
+    "due_date": "2025-12-21",
+    "amount": 142.37,
+    "account_number": "1234567890"
+})
+
+_AUTO_METADATA = MappingProxyType({
+    "insurance_company": "State Farm",
+    "policy_number": "POL-12345678",
+    "vehicle": "2020 Honda Accord",
+    "effective_date": "2025-01-01",
+    "expiration_date": "2026-01-01",
+    "premium": 1200.00
+})
 
 
 @pytest.fixture
 def mock_personal_medical_metadata():
     """Mock metadata extraction for personal medical documents"""
-    return {
-        "provider": "Dr. Smith Family Medicine",
-        "date": "2025-09-15",
-        "amount": 125.50,
-        "type": "medical_bill",
-        "description": "Office visit and lab work"
-    }
+    return dict(_PERSONAL_MEDICAL_METADATA)
 
 
 @pytest.fixture
 def mock_utility_metadata():
     """Mock metadata extraction for utility bills"""
-    return {
-        "utility_type": "electric",
-        "provider": "City Power & Light",
-        "billing_date": "2025-12-01",
-        "due_date": "2025-12-21",
-        "amount": 142.37,
-        "account_number": "1234567890"
-    }
+    return dict(_UTILITY_METADATA)
 
 
 @pytest.fixture
 def mock_auto_metadata():
     """Mock metadata extraction for auto documents"""
-    return {
-        "insurance_company": "State Farm",
-        "policy_number": "POL-12345678",
-        "vehicle": "2020 Honda Accord",
-        "effective_date": "2025-01-01",
-        "expiration_date": "2026-01-01",
-        "premium": 1200.00
-    }
+    return dict(_AUTO_METADATA)
 
 
 # ========== Vault Directory Fixtures ==========
 
+# Leaf directories of each vault; parents are created along the way
+_CPS_VAULT_LEAVES = ("60-medical/morgan", "60-medical/jacob", "40-expenses")
+_PERSONAL_VAULT_LEAVES = (
+    "Medical",
+    "Expenses",
+    "Utilities",
+    "Auto/Insurance",
+    "Auto/Maintenance",
+    "Auto/Registration",
+)
+
+
+@pytest.fixture(scope="session")
+def _vault_template(tmp_path_factory):
+    """Build the vault directory skeleton once per session"""
+    template = tmp_path_factory.mktemp("vault-template")
+
+    for vault, leaves in (("CoparentingSystem", _CPS_VAULT_LEAVES),
+                          ("Personal", _PERSONAL_VAULT_LEAVES)):
+        for leaf in leaves:
+            os.makedirs(template / vault / leaf, exist_ok=True)
+
+    return template
+
+
 @pytest.fixture
-def temp_vault_dirs(tmp_path):
+def temp_vault_dirs(tmp_path, _vault_template):
     """Create temporary vault directories for testing
 
     Returns:
         tuple: (cps_vault_path, personal_vault_path)
     """
-    cps_vault = tmp_path / "CoparentingSystem"
-    personal_vault = tmp_path / "Personal"
+    shutil.copytree(_vault_template, tmp_path, dirs_exist_ok=True,
+                    copy_function=os.link)
 
-    # Create CPS vault structure
-    (cps_vault / "60-medical" / "morgan").mkdir(parents=True)
-    (cps_vault / "60-medical" / "jacob").mkdir(parents=True)
-    (cps_vault / "40-expenses").mkdir(parents=True)
+    return tmp_path / "CoparentingSystem", tmp_path / "Personal"
 
-    # Create Personal vault structure
-    (personal_vault / "Medical").mkdir(parents=True)
-    (personal_vault / "Expenses").mkdir(parents=True)
-    (personal_vault / "Utilities").mkdir(parents=True)
-    (personal_vault / "Auto" / "Insurance").mkdir(parents=True)
-    (personal_vault / "Auto" / "Maintenance").mkdir(parents=True)
-    (personal_vault / "Auto" / "Registration").mkdir(parents=True)
 
-    return cps_vault, personal_vault
+@pytest.fixture
+def bare_vault_dirs(tmp_path):
+    """Vault paths under tmp_path with nothing created up front
+
+    For tests that don't need the vault layout: BasicMemoryNoteCreator
+    creates missing vaults and note folders itself.
+
+    Returns:
+        tuple: (cps_vault_path, personal_vault_path)
+    """
+    return tmp_path / "CoparentingSystem", tmp_path / "Personal"
 
 
 @pytest.fixture
@@ -150,142 +204,168 @@ def personal_vault(temp_vault_dirs):
 
 # ========== PDF Document Fixtures ==========
 
-@pytest.fixture
-def sample_pdf(tmp_path):
-    """Create a simple test PDF
+# Pre-rendered PDFs, so the suite doesn't re-draw them with ReportLab
+FIXTURES_DIR = Path(__file__).parent / "fixtures"
 
-    Returns:
-        Path: Path to generated PDF file
-    """
-    pdf_path = tmp_path / "test_document.pdf"
 
-    c = canvas.Canvas(str(pdf_path), pagesize=letter)
-    width, height = letter
+_FIXTURE_PDFS = ("test_document.pdf", "medical_bill.pdf", "electric_bill.pdf")
 
-    # Add some text content
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(100, height - 100, "Test Medical Document")
-    c.setFont("Helvetica", 12)
-    c.drawString(100, height - 150, "Patient: John Doe")
-    c.drawString(100, height - 170, "Date: 2025-09-15")
-    c.drawString(100, height - 190, "Amount: $125.50")
 
-    c.save()
+@pytest.fixture(scope="session")
+def _pdf_cache(tmp_path_factory):
+    """Copy the fixture PDFs into a session temp dir once
 
+    Returns:
+        dict: PDF file name -> cached Path
+    """
+    cache_dir = tmp_path_factory.mktemp("pdfs")
+    cache = {}
+    for name in _FIXTURE_PDFS:
+        cache[name] = cache_dir / name
+        shutil.copyfile(FIXTURES_DIR / name, cache[name])
+    return cache
+
+
+def _link_pdf(tmp_path, pdf_cache, name):
+    """Hardlink a cached PDF into the test's tmp_path (copy if linking fails)"""
+    pdf_path = tmp_path / name
+    try:
+        os.link(pdf_cache[name], pdf_path)
+    except OSError:
+        # Cross-device temp dirs or filesystems without hardlinks
+        shutil.copyfile(pdf_cache[name], pdf_path)
     return pdf_path
 
 
 @pytest.fixture
-def sample_medical_pdf(tmp_path):
-    """Create a medical document PDF"""
-    pdf_path = tmp_path / "medical_bill.pdf"
-
-    c = canvas.Canvas(str(pdf_path), pagesize=letter)
-    width, height = letter
-
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(100, height - 100, "Dr. Smith Family Medicine")
-    c.setFont("Helvetica", 12)
-    c.drawString(100, height - 130, "Medical Bill")
-    c.drawString(100, height - 160, "Patient: Jane Smith")
-    c.drawString(100, height - 180, "Date of Service: 2025-09-15")
-    c.drawString(100, height - 200, "Total: $125.50")
-
-    c.save()
+def sample_pdf(tmp_path, _pdf_cache):
+    """Provide a simple test PDF
 
-    return pdf_path
+    Returns:
+        Path: Path to test PDF file
+    """
+    return _link_pdf(tmp_path, _pdf_cache, "test_document.pdf")
 
 
 @pytest.fixture
-def sample_utility_pdf(tmp_path):
-    """Create a utility bill PDF"""
-    pdf_path = tmp_path / "electric_bill.pdf"
+def sample_medical_pdf(tmp_path, _pdf_cache):
+    """Provide a medical document PDF"""
+    return _link_pdf(tmp_path, _pdf_cache, "medical_bill.pdf")
 
-    c = canvas.Canvas(str(pdf_path), pagesize=letter)
-    width, height = letter
 
-    c.setFont("Helvetica-Bold", 16)
-    c.drawString(100, height - 100, "City Power & Light")
-    c.setFont("Helvetica-Bold", 14)
-    c.drawString(100, height - 130, "ELECTRIC BILL")
-    c.setFont("Helvetica", 12)
-    c.drawString(100, height - 160, "Billing Date: 2025-12-01")
-    c.drawString(100, height - 180, "Due Date: 2025-12-21")
-    c.drawString(100, height - 200, "Amount Due: $142.37")
-    c.drawString(100, height - 220, "kWh Used: 850")
+@pytest.fixture
+def sample_utility_pdf(tmp_path, _pdf_cache):
+    """Provide a utility bill PDF"""
+    return _link_pdf(tmp_path, _pdf_cache, "electric_bill.pdf")
 
-    c.save()
 
-    return pdf_path
+# ========== Database Fixtures ==========
 
+# Tests never need durability, so skip journaling and syncing entirely
+_TEST_DB_PRAGMAS = '''
+    PRAGMA synchronous=OFF;
+    PRAGMA journal_mode=OFF;
+    PRAGMA locking_mode=EXCLUSIVE;
+    PRAGMA temp_store=MEMORY;
+'''
+
+_TEST_DB_SCHEMA = '''
+    BEGIN IMMEDIATE;
+
+    -- Create processing_history table
+    CREATE TABLE processing_history (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        category TEXT,
+        status TEXT,
+        paperless_id INTEGER,
+        basicmemory_path TEXT,
+        processing_time_ms INTEGER,
+        error_message TEXT,
+        classification_prompt TEXT,
+        classification_response TEXT,
+        metadata_prompt TEXT,
+        metadata_response TEXT,
+        files_created TEXT,
+        corrections TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Create pending_documents table
+    CREATE TABLE pending_documents (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        category TEXT,
+        question TEXT,
+        metadata TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    -- Create claude_code_logs table
+    CREATE TABLE claude_code_logs (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        filename TEXT NOT NULL,
+        prompt_type TEXT,
+        prompt_file TEXT,
+        prompt_content TEXT,
+        response_content TEXT,
+        confidence REAL,
+        success INTEGER,
+        error_message TEXT,
+        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+    );
+
+    COMMIT;
+'''
+
+
+# Test processing history added by populated_database
+_SEED_HISTORY_SQL = '''
+    INSERT INTO processing_history
+    (filename, category, status, classification_prompt, classification_response)
+    VALUES (?, ?, ?, ?, ?)
+'''
+
+_SEED_HISTORY_ROWS = (
+    (
+        'test_medical.pdf',
+        'PERSONAL-MEDICAL',
+        'success',
+        'Classification prompt...',
+        '{"category": "PERSONAL-MEDICAL", "confidence": 0.95}'
+    ),
+    (
+        'test_utility.pdf',
+        'UTILITY',
+        'success',
+        'Classification prompt...',
+        '{"category": "UTILITY", "confidence": 0.88}'
+    ),
+)
 
-# ========== Database Fixtures ==========
 
 @pytest.fixture
-def test_database(tmp_path):
-    """Create temporary test database with schema
+def test_database():
+    """Create an in-memory test database with schema
+
+    The database lives in SQLite's shared cache and is freed when the
+    fixture closes its connection on teardown.
 
     Returns:
-        Path: Path to test database file
+        sqlite3.Connection: Open connection to the database
     """
-    db_path = tmp_path / "test.db"
-
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
-
-    # Create processing_history table
-    cursor.execute('''
-        CREATE TABLE processing_history (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            filename TEXT NOT NULL,
-            category TEXT,
-            status TEXT,
-            paperless_id INTEGER,
-            basicmemory_path TEXT,
-            processing_time_ms INTEGER,
-            error_message TEXT,
-            classification_prompt TEXT,
-            classification_response TEXT,
-            metadata_prompt TEXT,
-            metadata_response TEXT,
-            files_created TEXT,
-            corrections TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Create pending_documents table
-    cursor.execute('''
-        CREATE TABLE pending_documents (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            filename TEXT NOT NULL,
-            category TEXT,
-            question TEXT,
-            metadata TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    # Create claude_code_logs table
-    cursor.execute('''
-        CREATE TABLE claude_code_logs (
-            id INTEGER PRIMARY KEY AUTOINCREMENT,
-            filename TEXT NOT NULL,
-            prompt_type TEXT,
-            prompt_file TEXT,
-            prompt_content TEXT,
-            response_content TEXT,
-            confidence REAL,
-            success INTEGER,
-            error_message TEXT,
-            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
-        )
-    ''')
-
-    conn.commit()
-    conn.close()
+    import sqlite3
+    import uuid
+
+    db_uri = f"file:test_db_{uuid.uuid4().hex}?mode=memory&cache=shared"
+
+    conn = sqlite3.connect(db_uri, uri=True, isolation_level=None)
+    conn.executescript(_TEST_DB_PRAGMAS)
+    conn.executescript(_TEST_DB_SCHEMA)
 
-    return db_path
+    yield conn
+
+    conn.close()
 
 
 @pytest.fixture
@@ -293,118 +373,122 @@ def populated_database(test_database):
     """Database with some test data
 
     Returns:
-        Path: Path to database with test records
+        sqlite3.Connection: Connection to the database with test records
     """
-    conn = sqlite3.connect(str(test_database))
-    cursor = conn.cursor()
-
-    # Add some test processing history
-    cursor.execute('''
-        INSERT INTO processing_history
-        (filename, category, status, classification_prompt, classification_response)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (
-        'test_medical.pdf',
-        'PERSONAL-MEDICAL',
-        'success',
-        'Classification prompt...',
-        '{"category": "PERSONAL-MEDICAL", "confidence": 0.95}'
-    ))
-
-    cursor.execute('''
-        INSERT INTO processing_history
-        (filename, category, status, classification_prompt, classification_response)
-        VALUES (?, ?, ?, ?, ?)
-    ''', (
-        'test_utility.pdf',
-        'UTILITY',
-        'success',
-        'Classification prompt...',
-        '{"category": "UTILITY", "confidence": 0.88}'
-    ))
-
-    conn.commit()
-    conn.close()
+    test_database.execute('BEGIN IMMEDIATE')
+    test_database.executemany(_SEED_HISTORY_SQL, _SEED_HISTORY_ROWS)
+    test_database.execute('COMMIT')
 
     return test_database
 
 
 # ========== Mock Subprocess Fixtures ==========
 
+# Canned Claude Code CLI results; the JSON is encoded once at import time
+_CLAUDE_OK_JSON = json.dumps({
+    "category": "PERSONAL-MEDICAL",
+    "confidence": 0.95,
+    "is_cps_related": False,
+    "reasoning": "Test classification"
+})
+
+_CLAUDE_OK_RESULT = SimpleNamespace(returncode=0, stdout=_CLAUDE_OK_JSON, stderr="")
+_CLAUDE_FAILED_RESULT = SimpleNamespace(returncode=1, stdout="", stderr="")
+
+
 @pytest.fixture
 def mock_claude_code_success(mocker):
     """Mock successful Claude Code CLI subprocess call
 
     Returns a successful JSON response for classification
     """
-    def mock_subprocess_run(*args, **kwargs):
-        class CompletedProcess:
-            returncode = 0
-            stdout = json.dumps({
-                "category": "PERSONAL-MEDICAL",
-                "confidence": 0.95,
-                "is_cps_related": False,
-                "reasoning": "Test classification"
-            })
-        return CompletedProcess()
-
-    return mocker.patch('subprocess.run', side_effect=mock_subprocess_run)
+    return mocker.patch('subprocess.run', return_value=_CLAUDE_OK_RESULT)
 
 
 @pytest.fixture
 def mock_claude_code_failure(mocker):
     """Mock failed Claude Code CLI subprocess call"""
-    def mock_subprocess_run(*args, **kwargs):
-        class CompletedProcess:
-            returncode = 1
-            stdout = ""
-        return CompletedProcess()
+    return mocker.patch('subprocess.run', return_value=_CLAUDE_FAILED_RESULT)
 
-    return mocker.patch('subprocess.run', side_effect=mock_subprocess_run)
 
+# ========== Mock Component Configuration ==========
 
-# ========== Classifier Fixtures ==========
-
-@pytest.fixture
-def mock_classifier(mocker, tmp_path):
-    """Mock DocumentClassifier for testing
-
-    Returns:
-        MagicMock: Mocked classifier with common methods
-    """
-    from unittest.mock import MagicMock
-
-    classifier = MagicMock()
+# Return values for the mock components, applied with a single
+# configure_mock() call instead of materialising each child attribute
+# by hand. Copied per test so no test can leak changes into another.
 
+_CLASSIFIER_MOCK_CONFIG = {
     # Mock classification
-    classifier.classify.return_value = {
+    "classify.return_value": {
         "category": "PERSONAL-MEDICAL",
         "confidence": 0.95,
         "is_cps_related": False,
         "reasoning": "Test classification"
-    }
-
+    },
     # Mock metadata extraction
-    classifier.extract_metadata.return_value = {
+    "extract_metadata.return_value": {
         "provider": "Dr. Smith",
         "date": "2025-09-15",
         "amount": 125.50,
         "type": "medical_bill"
-    }
+    },
+}
+
+# Note creation method -> note path relative to the Personal vault
+_BASICMEMORY_MOCK_NOTES = (
+    ("create_personal_medical_note", "Medical/2025-09-15-test-note.md"),
+    ("create_personal_expense_note", "Expenses/2025-09-15-test-expense.md"),
+    ("create_utility_note", "Utilities/2025-12-01-electric-bill.md"),
+    ("create_auto_note", "Auto/Insurance/2025-01-01-policy.md"),
+)
+
+_PAPERLESS_MOCK_CONFIG = {
+    "upload_document.return_value": {
+        "id": 12345,
+        "status": "success"
+    },
+}
+
+_NOTIFICATION_MOCK_CONFIG = {
+    "send.return_value": True,
+}
+
+
+def _configured_mock(config):
+    """Build a MagicMock from a return-value table"""
+    from copy import deepcopy
+    from unittest.mock import MagicMock
 
-    return classifier
+    mock = MagicMock()
+    mock.configure_mock(**deepcopy(config))
+    return mock
 
 
+# ========== Classifier Fixtures ==========
+
 @pytest.fixture
-def real_classifier(tmp_path):
+def mock_classifier(mocker, tmp_path):
+    """Mock DocumentClassifier for testing
+
+    Returns:
+        MagicMock: Mocked classifier with common methods
+    """
+    return _configured_mock(_CLASSIFIER_MOCK_CONFIG)
+
+
+@pytest.fixture(scope="module")
+def real_classifier(tmp_path_factory):
     """Create a real DocumentClassifier instance for integration tests
 
-    Uses temporary directories for prompts and database
+    Uses temporary directories for prompts and database. Shared by the
+    tests of a module: the classifier keeps no per-document state, and it
+    opens its log database by path on each write.
     """
     from classifier import DocumentClassifier
 
     # Create temporary prompts directory
-    prompts_dir = tmp_path / "prompts"
+    base_dir = tmp_path_factory.mktemp("classifier")
+    prompts_dir = base_dir / "prompts"
     prompts_dir.mkdir()
 
     # Create basic classifier prompt
@@ -412,7 +496,7 @@ def real_classifier(tmp_path):
         "Classify this document into one of the supported categories."
     )
 
-    db_path = tmp_path / "test.db"
+    db_path = base_dir / "test.db"
 
     return DocumentClassifier(prompts_dir=prompts_dir, db_path=db_path)
 
@@ -426,18 +510,13 @@ def mock_basicmemory(mocker, temp_vault_dirs):
     Returns:
         MagicMock: Mocked note creator
     """
-    from unittest.mock import MagicMock
-
-    note_creator = MagicMock()
     cps_vault, personal_vault = temp_vault_dirs
 
     # Mock note creation methods
-    note_creator.create_personal_medical_note.return_value = personal_vault / "Medical" / "2025-09-15-test-note.md"
-    note_creator.create_personal_expense_note.return_value = personal_vault / "Expenses" / "2025-09-15-test-expense.md"
-    note_creator.create_utility_note.return_value = personal_vault / "Utilities" / "2025-12-01-electric-bill.md"
-    note_creator.create_auto_note.return_value = personal_vault / "Auto" / "Insurance" / "2025-01-01-policy.md"
-
-    return note_creator
+    return _configured_mock({
+        f"{method}.return_value": personal_vault / suffix
+        for method, suffix in _BASICMEMORY_MOCK_NOTES
+    })
 
 
 @pytest.fixture
@@ -449,94 +528,195 @@ def real_basicmemory(temp_vault_dirs):
 
     return BasicMemoryNoteCreator(
         cps_path=cps_vault,
-        personal_path=personal_vault,
+        personal_vault=personal_vault,
         dry_run=False
     )
 
 
-# ========== Sample Data Fixtures ==========
+@pytest.fixture(scope="module")
+def shared_vaults(tmp_path_factory):
+    """Vault directories shared by every test in a module
 
-@pytest.fixture
-def sample_categories():
-    """List of all supported document categories"""
-    return [
-        # CPS categories
-        "CPS-MEDICAL",
-        "CPS-EXPENSE",
-        "CPS-SCHOOLWORK",
-        "CPS-CUSTODY",
-        "CPS-COMMUNICATION",
-        "CPS-LEGAL",
-        # Personal categories
-        "PERSONAL-MEDICAL",
-        "PERSONAL-EXPENSE",
-        "UTILITY",
-        "AUTO-INSURANCE",
-        "AUTO-MAINTENANCE",
-        "AUTO-REGISTRATION",
-        "RECEIPT",
-        "INVOICE",
-        "TAX-DOCUMENT",
-        "BANK-STATEMENT",
-        "INVESTMENT",
-        "PRESCRIPTION",
-        "INSURANCE",
-        "MORTGAGE",
-        "LEASE",
-        "HOME-MAINTENANCE",
-        "PROPERTY-TAX",
-        "CONTRACT",
-        "LEGAL-DOCUMENT",
-        "TRAVEL-BOOKING",
-        "TRAVEL-RECEIPT",
-        "GENERAL",
-        "REFERENCE"
-    ]
+    Returns:
+        tuple: (cps_vault_path, personal_vault_path)
+    """
+    base = tmp_path_factory.mktemp("vaults")
+    return base / "CoparentingSystem", base / "Personal"
 
 
-@pytest.fixture
-def sample_corrections():
-    """Sample correction data for re-processing tests"""
-    return {
-        "category_override": "PERSONAL-MEDICAL",
-        "additional_context": "This is actually a personal medical bill, not CPS-related",
-        "reason": "incorrect_category"
-    }
+@pytest.fixture(scope="module")
+def creator(shared_vaults):
+    """BasicMemoryNoteCreator built once per module against shared vaults
 
+    Notes from earlier tests stay in the vaults; colliding filenames get a
+    numeric suffix, so tests must not assume a vault starts out empty.
+    """
+    from basicmemory import BasicMemoryNoteCreator
+
+    cps_vault, personal_vault = shared_vaults
+
+    return BasicMemoryNoteCreator(
+        cps_path=cps_vault,
+        personal_vault=personal_vault
+    )
+
+
+@pytest.fixture(scope="module")
+def dry_run_creator(tmp_path_factory):
+    """Dry-run BasicMemoryNoteCreator built once per module
+
+    Uses its own vaults so notes written through ``creator`` can never make
+    a dry-run path appear to exist.
+    """
+    from basicmemory import BasicMemoryNoteCreator
+
+    base = tmp_path_factory.mktemp("dry-run-vaults")
+
+    return BasicMemoryNoteCreator(
+        cps_path=base / "CoparentingSystem",
+        personal_vault=base / "Personal",
+        dry_run=True
+    )
+
+
+# ========== Benchmark Fixtures ==========
+
+def _pedantic_runner(benchmark, reset_state):
+    """Wrap pytest-benchmark's ``benchmark`` fixture in pedantic mode
+
+    ``reset_state`` runs and the arguments are deep-copied in ``setup``
+    before every round, so a call with side effects (log rows, note files)
+    or one that mutates its inputs is never measured against pre-warmed state.
+    """
+    from copy import deepcopy
+
+    def run(fn, *args, rounds=50, **kwargs):
+        def setup():
+            reset_state()
+            return deepcopy(args), deepcopy(kwargs)
+
+        return benchmark.pedantic(fn, setup=setup, rounds=rounds, iterations=1)
+
+    return run
 
-# ========== Utility Fixtures ==========
 
 @pytest.fixture
-def mock_paperless_client(mocker):
-    """Mock Paperless API client"""
-    from unittest.mock import MagicMock
+def classifier_bench(benchmark, real_classifier):
+    """Benchmark runner for DocumentClassifier hot paths (needs pytest-benchmark)
 
-    client = MagicMock()
-    client.upload_document.return_value = {
-        "id": 12345,
-        "status": "success"
-    }
+    Every round starts from an empty claude_code_logs database, which is
+    removed again afterwards.
 
-    return client
+    Returns:
+        tuple: (run, classifier) where ``run(fn, *args, **kwargs)`` times ``fn``
+    """
+    import sqlite3
+
+    db_path = real_classifier.db_path
+
+    def reset_state():
+        db_path.unlink(missing_ok=True)
+        conn = sqlite3.connect(db_path)
+        conn.executescript(_TEST_DB_SCHEMA)
+        conn.close()
+
+    yield _pedantic_runner(benchmark, reset_state), real_classifier
+    db_path.unlink(missing_ok=True)
 
 
 @pytest.fixture
-def mock_notification_handler(mocker):
-    """Mock Pushover notification handler"""
-    from unittest.mock import MagicMock
+def basicmemory_bench(benchmark, real_basicmemory):
+    """Benchmark runner for BasicMemoryNoteCreator hot paths (needs pytest-benchmark)
+
+    Every round starts from the original vault layout: notes and folders
+    written by earlier rounds are deleted, so filenames never collide.
+
+    Returns:
+        tuple: (run, note_creator) where ``run(fn, *args, **kwargs)`` times ``fn``
+    """
+    vaults = (real_basicmemory.cps_vault, real_basicmemory.personal_vault)
+    baseline = {path for vault in vaults for path in vault.rglob('*')}
+
+    def reset_state():
+        for vault in vaults:
+            # Deepest paths first, so folders are empty when removed
+            for path in sorted(vault.rglob('*'), reverse=True):
+                if path in baseline:
+                    continue
+                if path.is_dir():
+                    path.rmdir()
+                else:
+                    path.unlink()
+
+    return _pedantic_runner(benchmark, reset_state), real_basicmemory
+
+
+# ========== Sample Data Fixtures ==========
 
-    handler = MagicMock()
-    handler.send.return_value = True
+# All supported document categories
+_CATEGORIES = (
+    # CPS categories
+    "CPS-MEDICAL",
+    "CPS-EXPENSE",
+    "CPS-SCHOOLWORK",
+    "CPS-CUSTODY",
+    "CPS-COMMUNICATION",
+    "CPS-LEGAL",
+    # Personal categories
+    "PERSONAL-MEDICAL",
+    "PERSONAL-EXPENSE",
+    "UTILITY",
+    "AUTO-INSURANCE",
+    "AUTO-MAINTENANCE",
+    "AUTO-REGISTRATION",
+    "RECEIPT",
+    "INVOICE",
+    "TAX-DOCUMENT",
+    "BANK-STATEMENT",
+    "INVESTMENT",
+    "PRESCRIPTION",
+    "INSURANCE",
+    "MORTGAGE",
+    "LEASE",
+    "HOME-MAINTENANCE",
+    "PROPERTY-TAX",
+    "CONTRACT",
+    "LEGAL-DOCUMENT",
+    "TRAVEL-BOOKING",
+    "TRAVEL-RECEIPT",
+    "GENERAL",
+    "REFERENCE"
+)
+
+_CORRECTIONS = MappingProxyType({
+    "category_override": "PERSONAL-MEDICAL",
+    "additional_context": "This is actually a personal medical bill, not CPS-related",
+    "reason": "incorrect_category"
+})
+
+
+@pytest.fixture(scope="session")
+def sample_categories():
+    """Tuple of all supported document categories"""
+    return _CATEGORIES
+
+
+@pytest.fixture(scope="session")
+def sample_corrections():
+    """Sample correction data for re-processing tests (read-only)"""
+    return _CORRECTIONS
 
-    return handler
 
+# ========== Utility Fixtures ==========
 
 @pytest.fixture
-def capture_stdout(mocker):
-    """Capture stdout for testing print statements"""
-    from io import StringIO
+def mock_paperless_client(mocker):
+    """Mock Paperless API client"""
+    return _configured_mock(_PAPERLESS_MOCK_CONFIG)
+
 
-    captured_output = StringIO()
-    mocker.patch('sys.stdout', captured_output)
+@pytest.fixture
+def mock_notification_handler(mocker):
+    """Mock Pushover notification handler"""
+    return _configured_mock(_NOTIFICATION_MOCK_CONFIG)
 
-    return captured_output
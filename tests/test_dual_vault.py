@@ -23,11 +23,6 @@ Directory Structure:
 """
 
 import pytest
-from pathlib import Path
-import sys
-
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from basicmemory import BasicMemoryNoteCreator
 
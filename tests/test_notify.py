@@ -5,11 +5,6 @@ Tests the Pushover notification system
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 from notify import NotificationHandler
 
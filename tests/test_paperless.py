@@ -2,13 +2,25 @@
 Tests for Paperless-NGX API Client
 """
 
+import gzip
+import hashlib
+import json
 import pytest
-import sys
-from pathlib import Path
 
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
+from paperless import PaperlessClient, _RewindableMultipart, _TTLCache
 
-from paperless import PaperlessClient
+
+def _set_json(mock_response, payload):
+    """Give a mocked response a JSON body"""
+    mock_response.content = json.dumps(payload).encode()
+
+
+def _mock_no_duplicates(mocker):
+    """Mock the checksum lookup so uploads never find an existing document"""
+    mock_get = mocker.patch('requests.Session.get')
+    mock_get.return_value.status_code = 200
+    _set_json(mock_get.return_value, {"results": []})
+    return mock_get
 
 
 class TestPaperlessClientInit:
@@ -38,6 +50,96 @@ class TestPaperlessClientInit:
 
         assert client.dry_run is True
 
+    def test_init_configures_session(self, monkeypatch):
+        """Test the shared session carries auth headers and a retrying adapter"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token_123')
+
+        client = PaperlessClient()
+
+        assert client.session.headers['Authorization'] == 'Token test_token_123'
+        adapter = client.session.get_adapter('https://paperless.example.com')
+        assert adapter.max_retries.total == 5
+        assert adapter.max_retries.backoff_jitter == 0.3
+        assert adapter.max_retries.respect_retry_after_header is True
+        retries = adapter.max_retries
+        assert set(retries.status_forcelist) == {429, 502, 503, 504}
+        # GET/PATCH retry every listed status; POSTs only when the body was refused
+        assert retries.is_retry('GET', 502) is True
+        assert retries.is_retry('PATCH', 504) is True
+        assert retries.is_retry('POST', 502) is False
+        assert retries.is_retry('POST', 413, has_retry_after=True) is False
+        assert retries.is_retry('POST', 503) is True
+        assert retries.new(total=4).is_retry('POST', 504) is False
+
+    def test_post_read_timeout_is_not_retried(self, monkeypatch):
+        """Test a POST whose reply was lost is not replayed, while a GET is"""
+        from urllib3.exceptions import NewConnectionError, ReadTimeoutError
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token_123')
+
+        retries = PaperlessClient().session.get_adapter('https://paperless.example.com').max_retries
+        url = '/api/documents/post_document/'
+        timeout = ReadTimeoutError(None, url, "Read timed out")
+
+        with pytest.raises(ReadTimeoutError):
+            retries.increment('POST', url, error=timeout)
+        assert retries.increment('GET', url, error=timeout).total == 4
+        # A refused connection never reached the server, so POSTs still retry it
+        refused = NewConnectionError(None, "Connection refused")
+        assert retries.increment('POST', url, error=refused).total == 4
+
+    def test_post_read_timeout_reaches_server_once(self, monkeypatch):
+        """Test a real POST that times out after being received is sent only once"""
+        import threading
+        import requests
+        from http.server import BaseHTTPRequestHandler, HTTPServer
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token_123')
+
+        received = []
+        release = threading.Event()
+
+        class StallingHandler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                received.append(self.path)
+                release.wait(5)
+
+            def log_message(self, *args):
+                pass
+
+        server = HTTPServer(('127.0.0.1', 0), StallingHandler)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            client = PaperlessClient()
+            with pytest.raises(requests.exceptions.ReadTimeout):
+                client.session.post(f"http://127.0.0.1:{server.server_port}/api/tags/",
+                                    json={'name': 'medical'}, timeout=0.2)
+        finally:
+            release.set()
+            server.shutdown()
+            server.server_close()
+
+        assert received == ['/api/tags/']
+
+
+    def test_resolver_pool_is_lazy_and_closed(self, tmp_path, mocker, monkeypatch):
+        """Test the resolver threads start on first use and stop on close"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token_123')
+        mocker.patch.object(PaperlessClient, '_resolve_tags', return_value=[1])
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id"'
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        with PaperlessClient() as client:
+            assert client._resolver_pool is None
+            client.upload_document(str(test_pdf), tags=["medical"])
+            pool = client._resolver_pool
+            assert pool is not None
+
+        assert client._resolver_pool is None
+        assert pool._shutdown is True
 
 class TestDocumentUploadDryRun:
     """Test document upload in dry run mode"""
@@ -67,13 +169,20 @@ class TestDocumentUploadReal:
         test_pdf = tmp_path / "test.pdf"
         test_pdf.write_bytes(b"PDF content")
 
-        # Mock tag resolution
-        mock_get = mocker.patch('requests.get')
-        mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"results": [{"id": 1, "name": "test"}]}
+        # Mock tag resolution; the checksum lookup finds nothing
+        def mock_get_side_effect(url, **kwargs):
+            mock_response = mocker.Mock()
+            mock_response.status_code = 200
+            if 'checksum__iexact' in kwargs.get('params', {}):
+                _set_json(mock_response, {"results": []})
+            else:
+                _set_json(mock_response, {"results": [{"id": 1, "name": "test"}]})
+            return mock_response
+
+        mocker.patch('requests.Session.get', side_effect=mock_get_side_effect)
 
         # Mock upload
-        mock_post = mocker.patch('requests.post')
+        mock_post = mocker.patch('requests.Session.post')
         mock_post.return_value.status_code = 200
         mock_post.return_value.text = '"task-id-123"'
 
@@ -96,20 +205,20 @@ class TestDocumentUploadReal:
             mock_response.status_code = 200
             
             if 'tags' in url:
-                mock_response.json.return_value = {"results": [{"id": 1, "name": "tag1"}]}
+                _set_json(mock_response, {"results": [{"id": 1, "name": "tag1"}]})
             elif 'document_types' in url:
-                mock_response.json.return_value = {"results": [{"id": 3, "name": "Medical"}]}
+                _set_json(mock_response, {"results": [{"id": 3, "name": "Medical"}]})
             elif 'correspondents' in url:
-                mock_response.json.return_value = {"results": [{"id": 5, "name": "Dr. Smith"}]}
+                _set_json(mock_response, {"results": [{"id": 5, "name": "Dr. Smith"}]})
             else:
-                mock_response.json.return_value = {"results": []}
+                _set_json(mock_response, {"results": []})
             
             return mock_response
         
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.side_effect = mock_get_side_effect
 
-        mock_post = mocker.patch('requests.post')
+        mock_post = mocker.patch('requests.Session.post')
         mock_post.return_value.status_code = 200
         mock_post.return_value.text = '"task-id-456"'
 
@@ -127,6 +236,310 @@ class TestDocumentUploadReal:
         assert result['task_id'] == 'task-id-456'
 
 
+    def test_upload_streams_multipart_body(self, tmp_path, mocker, monkeypatch):
+        """Test the PDF and form fields are sent as one streaming multipart body"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id-789"'
+
+        client = PaperlessClient()
+        client.upload_document(str(test_pdf), title="Streamed", tags=[7, 8])
+
+        kwargs = mock_post.call_args.kwargs
+        body = kwargs['data']
+        assert kwargs['headers']['Content-Type'].startswith('multipart/form-data')
+        assert 'files' not in kwargs
+        field_names = [name for name, _ in body.fields]
+        assert field_names == ['title', 'tags', 'tags', 'document']
+
+    def test_upload_reads_small_files_and_streams_large_ones(self, tmp_path, mocker, monkeypatch):
+        """Test the size threshold picks between in-memory and streamed bodies"""
+        import paperless
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id"'
+
+        client = PaperlessClient()
+        client.upload_document(test_pdf)
+        document = dict(mock_post.call_args.kwargs['data'].fields)['document']
+        assert document[0] == 'test.pdf'
+        assert document[1] == b"PDF content"
+
+        monkeypatch.setattr(paperless, 'STREAM_UPLOAD_MIN_BYTES', 0)
+        client.upload_document(test_pdf)
+        document = dict(mock_post.call_args.kwargs['data'].fields)['document']
+        assert hasattr(document[1], 'read')
+
+    def test_upload_resolves_metadata_concurrently(self, tmp_path, mocker, monkeypatch):
+        """Test tag, type and correspondent lookups overlap instead of running in series"""
+        import threading
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id"'
+
+        # Each lookup only returns once all three are running at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def resolver(value):
+            def resolve(_name):
+                barrier.wait()
+                return value
+            return resolve
+
+        client = PaperlessClient()
+        client._resolve_tags = resolver([1, 2])
+        client._resolve_document_type = resolver(3)
+        client._resolve_correspondent = resolver(5)
+
+        result = client.upload_document(
+            str(test_pdf), tags=["a", "b"], document_type="Medical", correspondent="Dr. Smith"
+        )
+
+        assert result['success'] is True
+        fields = mock_post.call_args.kwargs['data'].fields
+        assert fields[:4] == [('tags', '1'), ('tags', '2'), ('document_type', '3'), ('correspondent', '5')]
+
+    def test_upload_skips_existing_document(self, tmp_path, mocker, monkeypatch):
+        """Test a file Paperless already holds is not uploaded again, but gets the new metadata"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        def get(url, **kwargs):
+            response = mocker.Mock(status_code=200)
+            if url.endswith('/documents/42/'):
+                _set_json(response, {"id": 42, "title": "Old", "tags": [1]})
+            else:
+                _set_json(response, {"results": [{"id": 42}]})
+            return response
+
+        mock_get = mocker.patch('requests.Session.get', side_effect=get)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 200
+
+        client = PaperlessClient()
+        first = client.upload_document(str(test_pdf))
+        second = client.upload_document(str(test_pdf), title="Corrected", tags=[5])
+
+        assert first['success'] is True
+        assert first['document_id'] == 42
+        assert first['duplicate'] is True
+        assert second['success'] is True
+        assert second['document_id'] == 42
+        assert mock_post.call_count == 0
+        # One checksum lookup, then the document read for the tag merge
+        assert mock_get.call_count == 2
+        checksum = mock_get.call_args_list[0].kwargs['params']['checksum__iexact']
+        assert checksum == hashlib.md5(b"PDF content").hexdigest()
+        assert mock_patch.call_count == 1
+        assert mock_patch.call_args.args[0].endswith('/documents/42/')
+        assert mock_patch.call_args.kwargs['json'] == {'title': 'Corrected', 'tags': [1, 5]}
+
+    def test_deleted_duplicate_is_forgotten(self, tmp_path, mocker, monkeypatch):
+        """Test a matched document that 404s no longer short-circuits uploads"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_get.return_value.status_code = 200
+        _set_json(mock_get.return_value, {"results": [{"id": 42}]})
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 404
+
+        client = PaperlessClient()
+        assert client.upload_document(str(test_pdf))['document_id'] == 42
+        assert client.update_document(42, title="Gone")['success'] is False
+
+        # The next upload checks Paperless again instead of reusing ID 42
+        _set_json(mock_get.return_value, {"results": []})
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id-1"'
+        result = client.upload_document(str(test_pdf))
+
+        assert mock_get.call_count == 2
+        assert result['task_id'] == 'task-id-1'
+
+    def test_upload_proceeds_when_duplicate_check_fails(self, tmp_path, mocker, monkeypatch):
+        """Test a failed checksum lookup falls back to a normal upload"""
+        import requests
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        mocker.patch(
+            'requests.Session.get',
+            side_effect=requests.exceptions.ConnectionError("down")
+        )
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id-999"'
+
+        client = PaperlessClient()
+        result = client.upload_document(str(test_pdf))
+
+        assert result['success'] is True
+        assert result['task_id'] == 'task-id-999'
+
+
+class TestRewindableMultipart:
+    """Test the upload body can be replayed on retry"""
+
+    def test_seek_replays_identical_body(self, tmp_path):
+        """Test rewinding re-reads the file and reuses the boundary"""
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content" * 1000)
+
+        with open(test_pdf, 'rb') as fh:
+            body = _RewindableMultipart([('title', 'Retry'), ('document', ('test.pdf', fh, 'application/pdf'))])
+            first = body.read(100) + body.read()
+            assert body.tell() == len(first) == body.len
+
+            body.seek(0)
+            assert body.tell() == 0
+            assert body.read() == first
+
+    def test_seek_elsewhere_is_rejected(self):
+        """Test only a rewind to the start is supported"""
+        body = _RewindableMultipart([('title', 'Retry')])
+
+        with pytest.raises(OSError):
+            body.seek(5)
+
+
+class TestBatchUpload:
+    """Test concurrent batch upload"""
+
+    def test_upload_many_preserves_order(self, tmp_path, mocker, monkeypatch):
+        """Test results line up with inputs and failures don't abort the batch"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        pdfs = []
+        for name in ("a", "b"):
+            pdf = tmp_path / f"{name}.pdf"
+            pdf.write_bytes(b"PDF content")
+            pdfs.append(str(pdf))
+        pdfs.append(str(tmp_path / "missing.pdf"))
+
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-id"'
+
+        client = PaperlessClient()
+        results = client.upload_many(pdfs, [{'title': 'A'}, {'title': 'B'}, {}])
+
+        assert [r['success'] for r in results] == [True, True, False]
+        assert 'File not found' in results[2]['error']
+        assert mock_post.call_count == 2
+
+
+class TestIngest:
+    """Test combined upload + metadata ingest"""
+
+    def test_ingest_without_custom_fields_is_one_post(self, tmp_path, mocker, monkeypatch):
+        """Test all standard metadata goes in the upload and nothing is PATCHed"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        _mock_no_duplicates(mocker)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-1"'
+        mock_patch = mocker.patch('requests.Session.patch')
+
+        client = PaperlessClient()
+        result = client.ingest(str(test_pdf), title="Receipt", tags=[3])
+
+        assert result['success'] is True
+        assert result['task_id'] == 'task-1'
+        assert mock_post.call_count == 1
+        assert mock_patch.call_count == 0
+
+    def test_ingest_patches_custom_fields_after_consumption(self, tmp_path, mocker, monkeypatch):
+        """Test custom fields are set on the document the upload task created"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        test_pdf = tmp_path / "test.pdf"
+        test_pdf.write_bytes(b"PDF content")
+
+        def mock_get_side_effect(url, **kwargs):
+            response = mocker.Mock()
+            response.status_code = 200
+            if 'tasks' in url:
+                _set_json(response, [{"task_id": "task-2", "status": "SUCCESS", "related_document": "55"}])
+            else:
+                _set_json(response, {"results": []})
+            return response
+
+        mocker.patch('requests.Session.get', side_effect=mock_get_side_effect)
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.text = '"task-2"'
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 200
+
+        client = PaperlessClient()
+        result = client.ingest(str(test_pdf), title="Receipt", custom_fields={4: "42.50"})
+
+        assert result['success'] is True
+        assert result['document_id'] == 55
+        assert mock_patch.call_args.kwargs['json'] == {
+            'custom_fields': [{'field': 4, 'value': '42.50'}]
+        }
+
+    def test_wait_for_document_gives_up_on_failure(self, mocker, monkeypatch):
+        """Test a failed consumer task yields no document ID"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_get.return_value.status_code = 200
+        _set_json(mock_get.return_value, [{"status": "FAILURE", "result": "duplicate"}])
+
+        client = PaperlessClient()
+
+        assert client.wait_for_document('task-3') is None
+
+    def test_wait_for_document_times_out(self, mocker, monkeypatch):
+        """Test polling stops at the deadline while the task is pending"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_get.return_value.status_code = 200
+        _set_json(mock_get.return_value, [{"status": "PENDING"}])
+        mock_sleep = mocker.patch('paperless.time.sleep')
+
+        client = PaperlessClient()
+
+        assert client.wait_for_document('task-4', timeout=0) is None
+        assert mock_sleep.call_count == 0
+
+
 class TestTagResolution:
     """Test tag resolution and creation"""
 
@@ -142,16 +555,22 @@ class TestTagResolution:
             mock_response = mocker.Mock()
             mock_response.status_code = 200
             
-            if tag_name == 'medical':
-                mock_response.json.return_value = {"results": [{"id": 1, "name": "medical"}]}
+            if 'page_size' in params:
+                # Full tag index
+                _set_json(mock_response, {"results": [
+                    {"id": 1, "name": "medical"},
+                    {"id": 2, "name": "personal"}
+                ]})
+            elif tag_name == 'medical':
+                _set_json(mock_response, {"results": [{"id": 1, "name": "medical"}]})
             elif tag_name == 'personal':
-                mock_response.json.return_value = {"results": [{"id": 2, "name": "personal"}]}
+                _set_json(mock_response, {"results": [{"id": 2, "name": "personal"}]})
             else:
-                mock_response.json.return_value = {"results": []}
+                _set_json(mock_response, {"results": []})
             
             return mock_response
         
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.side_effect = mock_get_side_effect
 
         client = PaperlessClient()
@@ -163,13 +582,13 @@ class TestTagResolution:
         """Test creating new tag"""
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"results": []}
+        _set_json(mock_get.return_value, {"results": []})
 
-        mock_post = mocker.patch('requests.post')
+        mock_post = mocker.patch('requests.Session.post')
         mock_post.return_value.status_code = 201
-        mock_post.return_value.json.return_value = {"id": 10}
+        _set_json(mock_post.return_value, {"id": 10})
 
         client = PaperlessClient()
         tag_id = client._get_or_create_tag("new-tag")
@@ -177,6 +596,242 @@ class TestTagResolution:
         assert tag_id == 10
 
 
+    def test_resolved_tags_are_cached(self, mocker, monkeypatch):
+        """Test repeated tag names only hit the API once per client"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_get.return_value.status_code = 200
+        _set_json(mock_get.return_value, {"results": [{"id": 4, "name": "medical"}]})
+
+        client = PaperlessClient()
+        assert client._resolve_tags(["medical", "Medical"]) == [4, 4]
+        assert client._resolve_tags(["medical"]) == [4]
+
+        assert mock_get.call_count == 1
+
+    def test_expired_cache_entry_is_refreshed(self, mocker, monkeypatch):
+        """Test cached IDs are looked up again after the TTL passes"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_get.return_value.status_code = 200
+        _set_json(mock_get.return_value, {"results": [{"id": 4, "name": "medical"}]})
+
+        client = PaperlessClient()
+        client._get_or_create_tag("medical")
+        client._name_cache.put(('tags', 'medical'), 4, 0)
+        client._indexed['tags'] = 0
+        assert client._get_or_create_tag("medical") == 4
+
+        assert mock_get.call_count == 2
+
+
+    def test_warm_index_follows_pagination(self, mocker, monkeypatch):
+        """Test the prefetch walks every page and serves later lookups from cache"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        page_1 = mocker.Mock()
+        _set_json(page_1, {
+            "results": [{"id": 1, "name": "medical"}],
+            "next": "https://paperless.example.com/api/tags/?page=2&page_size=1000"
+        })
+        page_2 = mocker.Mock()
+        _set_json(page_2, {
+            "results": [{"id": 2, "name": "Utility"}],
+            "next": None
+        })
+        mock_get = mocker.patch('requests.Session.get', side_effect=[page_1, page_2])
+
+        client = PaperlessClient()
+        tag_ids = client._resolve_tags(["medical", "utility"])
+
+        assert tag_ids == [1, 2]
+        assert mock_get.call_count == 2
+        assert mock_get.call_args_list[0].kwargs['params'] == {'page_size': 1000}
+        assert 'params' not in mock_get.call_args_list[1].kwargs
+
+
+    def test_resolve_tags_creates_only_unknown_names(self, mocker, monkeypatch):
+        """Test tags in the prefetched index skip the per-name lookup"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        def mock_get_side_effect(url, **kwargs):
+            mock_response = mocker.Mock()
+            if kwargs.get('params') == {'page_size': 1000}:
+                _set_json(mock_response, {"results": [{"id": 1, "name": "medical"}]})
+            else:
+                _set_json(mock_response, {"results": []})
+            return mock_response
+
+        mock_get = mocker.patch('requests.Session.get', side_effect=mock_get_side_effect)
+        created = []
+        for new_id in (20, 21):
+            response = mocker.Mock()
+            _set_json(response, {"id": new_id})
+            created.append(response)
+        mock_post = mocker.patch('requests.Session.post', side_effect=created)
+
+        client = PaperlessClient()
+        tag_ids = client._resolve_tags(["medical", "new-a", 9, "new-b", "Medical"])
+
+        assert [tag_ids[0], tag_ids[2], tag_ids[4]] == [1, 9, 1]
+        assert {tag_ids[1], tag_ids[3]} == {20, 21}
+        # One index fetch; unknown names are created without a lookup
+        assert mock_get.call_count == 1
+        assert mock_post.call_count == 2
+
+    def test_unchanged_index_revalidates_with_etag(self, mocker, monkeypatch):
+        """Test an expired index is refreshed by a conditional GET"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        full = mocker.Mock(status_code=200, headers={'ETag': '"v1"'})
+        _set_json(full, {"results": [{"id": 1, "name": "medical"}]})
+        not_modified = mocker.Mock(status_code=304, headers={})
+        mock_get = mocker.patch('requests.Session.get', side_effect=[full, not_modified])
+
+        client = PaperlessClient()
+        assert client._get_or_create_tag("medical") == 1
+        client._name_cache.put(('tags', 'medical'), 1, 0)
+        client._indexed['tags'] = 0
+        assert client._get_or_create_tag("medical") == 1
+
+        assert mock_get.call_args_list[1].kwargs['headers'] == {'If-None-Match': '"v1"'}
+        assert mock_get.call_count == 2
+
+    def test_304_with_evicted_names_refetches_index(self, mocker, monkeypatch):
+        """Test a 304 can't mark the index fresh once some of its names were evicted"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        rows = {"results": [{"id": 1, "name": "medical"}, {"id": 2, "name": "tax"}]}
+        full = mocker.Mock(status_code=200, headers={'ETag': '"v1"'})
+        _set_json(full, rows)
+        not_modified = mocker.Mock(status_code=304, headers={})
+        mock_get = mocker.patch('requests.Session.get', side_effect=[full, not_modified, full])
+
+        client = PaperlessClient()
+        client._name_cache.maxsize = 2
+        client._warm_name_index('tags')
+        # Push 'medical' out of the LRU, then let the index expire
+        client._name_cache.put(('correspondents', 'acme'), 5, float('inf'))
+        client._indexed['tags'] = 0
+
+        assert client._get_or_create_tag("medical") == 1
+        assert mock_get.call_count == 3
+        assert mock_get.call_args_list[2].kwargs.get('headers') is None
+
+    def test_create_duplicate_falls_back_to_index(self, mocker, monkeypatch):
+        """Test a create rejected as duplicate is answered from a refreshed index"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        empty = mocker.Mock(status_code=200, headers={})
+        _set_json(empty, {"results": []})
+        refreshed = mocker.Mock(status_code=200, headers={})
+        _set_json(refreshed, {"results": [{"id": 8, "name": "Medical"}]})
+        mocker.patch('requests.Session.get', side_effect=[empty, refreshed])
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.return_value.status_code = 400
+
+        client = PaperlessClient()
+
+        assert client._get_or_create_tag("medical") == 8
+        assert mock_post.call_count == 1
+
+
+class TestInflightResolves:
+    """Test concurrent resolves of the same name are coalesced"""
+
+    def test_concurrent_misses_share_one_create(self, mocker, monkeypatch):
+        """Test a second caller waits for the first resolve instead of POSTing again"""
+        import threading
+        import time
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        entered = threading.Event()
+        release = threading.Event()
+
+        def slow_post(url, **kwargs):
+            entered.set()
+            release.wait(5)
+            response = mocker.Mock()
+            response.status_code = 201
+            _set_json(response, {"id": 77, "name": kwargs['json']['name']})
+            return response
+
+        mock_post = mocker.patch('requests.Session.post', side_effect=slow_post)
+
+        client = PaperlessClient()
+        # A fresh (empty) index sends misses straight to POST
+        client._indexed['tags'] = float('inf')
+
+        results = []
+        workers = [
+            threading.Thread(target=lambda: results.append(client._resolve_named('tags', 'invoice'))),
+            threading.Thread(target=lambda: results.append(client._resolve_named('tags', 'Invoice'))),
+        ]
+        workers[0].start()
+        assert entered.wait(5)
+        workers[1].start()
+        time.sleep(0.05)
+        release.set()
+        for worker in workers:
+            worker.join(5)
+
+        assert results == [77, 77]
+        assert mock_post.call_count == 1
+        assert client._inflight == {}
+
+    def test_failed_resolve_is_not_remembered(self, mocker, monkeypatch):
+        """Test an error clears the in-flight entry so the next call retries"""
+        import requests
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_post = mocker.patch('requests.Session.post')
+        mock_post.side_effect = [
+            requests.exceptions.ConnectionError("down"),
+            mocker.Mock(status_code=201, content=json.dumps({"id": 9}).encode()),
+        ]
+
+        client = PaperlessClient()
+        client._indexed['tags'] = float('inf')
+
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client._resolve_named('tags', 'invoice')
+
+        assert client._inflight == {}
+        assert client._resolve_named('tags', 'invoice') == 9
+
+
+class TestNameCache:
+    """Test the bounded name -> ID cache"""
+
+    def test_evicts_least_recently_used(self):
+        """Test the oldest untouched entry is dropped when full"""
+        cache = _TTLCache(maxsize=2)
+        cache.put('a', 1, float('inf'))
+        cache.put('b', 2, float('inf'))
+        cache.get('a')
+        cache.put('c', 3, float('inf'))
+
+        assert len(cache) == 2
+        assert cache.get('b') is None
+        assert cache.get('a') == 1
+        assert cache.get('c') == 3
+
+    def test_expired_entries_read_as_missing_until_extended(self):
+        """Test entries past their deadline are hidden until revalidated"""
+        cache = _TTLCache()
+        cache.put(('tags', 'a'), 1, 0)
+        cache.put(('correspondents', 'b'), 2, 0)
+
+        assert cache.get(('tags', 'a')) is None
+
+        cache.extend(lambda key: key[0] == 'tags', float('inf'))
+
+        assert cache.get(('tags', 'a')) == 1
+        assert cache.get(('correspondents', 'b')) is None
+
+
 class TestDocumentTypeResolution:
     """Test document type resolution"""
 
@@ -184,11 +839,11 @@ class TestDocumentTypeResolution:
         """Test resolving document type"""
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
+        _set_json(mock_get.return_value, {
             "results": [{"id": 3, "name": "Medical"}]
-        }
+        })
 
         client = PaperlessClient()
         doc_type_id = client._resolve_document_type("Medical")
@@ -200,14 +855,14 @@ class TestDocumentTypeResolution:
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
         # GET returns empty (not found)
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"results": []}
+        _set_json(mock_get.return_value, {"results": []})
 
         # POST creates new
-        mock_post = mocker.patch('requests.post')
+        mock_post = mocker.patch('requests.Session.post')
         mock_post.return_value.status_code = 201
-        mock_post.return_value.json.return_value = {"id": 10}
+        _set_json(mock_post.return_value, {"id": 10})
 
         client = PaperlessClient()
         doc_type_id = client._resolve_document_type("NewType")
@@ -222,11 +877,11 @@ class TestCorrespondentResolution:
         """Test resolving correspondent"""
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
+        _set_json(mock_get.return_value, {
             "results": [{"id": 7, "name": "Dr. Smith"}]
-        }
+        })
 
         client = PaperlessClient()
         correspondent_id = client._resolve_correspondent("Dr. Smith")
@@ -238,14 +893,14 @@ class TestCorrespondentResolution:
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
         # GET returns empty (not found)
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {"results": []}
+        _set_json(mock_get.return_value, {"results": []})
 
         # POST creates new
-        mock_post = mocker.patch('requests.post')
+        mock_post = mocker.patch('requests.Session.post')
         mock_post.return_value.status_code = 201
-        mock_post.return_value.json.return_value = {"id": 15}
+        _set_json(mock_post.return_value, {"id": 15})
 
         client = PaperlessClient()
         correspondent_id = client._resolve_correspondent("New Person")
@@ -260,12 +915,12 @@ class TestDocumentRetrieval:
         """Test successful document retrieval"""
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
+        _set_json(mock_get.return_value, {
             "id": 123,
             "title": "Test Document"
-        }
+        })
 
         client = PaperlessClient()
         doc = client.get_document(123)
@@ -282,18 +937,18 @@ class TestDocumentUpdate:
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
         # Mock GET to return existing document
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 200
-        mock_get.return_value.json.return_value = {
+        _set_json(mock_get.return_value, {
             "id": 123,
             "title": "Old Title",
             "tags": []
-        }
+        })
 
         # Mock PATCH for the update
-        mock_patch = mocker.patch('requests.patch')
+        mock_patch = mocker.patch('requests.Session.patch')
         mock_patch.return_value.status_code = 200
-        mock_patch.return_value.json.return_value = {"id": 123}
+        _set_json(mock_patch.return_value, {"id": 123})
 
         client = PaperlessClient()
         result = client.update_document(123, title="Updated Title")
@@ -304,16 +959,89 @@ class TestDocumentUpdate:
         """Test updating non-existent document"""
         monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
 
-        # Mock GET to return None (document not found)
-        mock_get = mocker.patch('requests.get')
+        # Mock PATCH to return 404 (document not found)
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 404
+
+        client = PaperlessClient()
+        result = client.update_document(999, title="New Title")
+
+        assert result['success'] is False
+        assert 'not found' in result['error']
+
+    def test_update_document_tags_not_found(self, mocker, monkeypatch):
+        """Test a tag merge on a missing document fails before patching"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.return_value.status_code = 404
         mock_get.return_value.raise_for_status.side_effect = Exception("Not found")
+        mock_patch = mocker.patch('requests.Session.patch')
 
         client = PaperlessClient()
-        result = client.update_document(999, title="New Title")
+        result = client.update_document(999, tags=[5])
 
         assert result['success'] is False
         assert 'not found' in result['error']
+        assert not mock_patch.called
+
+    def test_update_without_tags_skips_document_fetch(self, mocker, monkeypatch):
+        """Test field-only updates go straight to a single PATCH"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        mock_get = mocker.patch('requests.Session.get')
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 200
+
+        client = PaperlessClient()
+        result = client.update_document(123, title="Updated Title", created_date="2025-01-15")
+
+        assert result['success'] is True
+        assert not mock_get.called
+        assert mock_patch.call_args.kwargs['json'] == {
+            'title': 'Updated Title',
+            'created': '2025-01-15'
+        }
+
+    def test_tag_merge_rereads_current_tags(self, mocker, monkeypatch):
+        """Test each tag merge starts from the document's current tags"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+
+        first = mocker.Mock(status_code=200)
+        _set_json(first, {"id": 123, "tags": [2, 1]})
+        # Tag 7 was added in Paperless between the two updates
+        second = mocker.Mock(status_code=200)
+        _set_json(second, {"id": 123, "tags": [1, 2, 3, 7]})
+        mock_get = mocker.patch('requests.Session.get', side_effect=[first, second])
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 200
+
+        client = PaperlessClient()
+        client.update_document(123, tags=[3])
+        client.update_document(123, tags=[4])
+
+        assert mock_get.call_count == 2
+        assert mock_patch.call_args_list[0].kwargs['json'] == {'tags': [1, 2, 3]}
+        assert mock_patch.call_args_list[1].kwargs['json'] == {'tags': [1, 2, 3, 4, 7]}
+
+    def test_large_update_is_gzipped_when_enabled(self, mocker, monkeypatch):
+        """Test opt-in gzip request bodies for large PATCHes only"""
+        monkeypatch.setenv('PAPERLESS_API_TOKEN', 'test_token')
+        monkeypatch.setenv('PAPERLESS_GZIP_REQUESTS', '1')
+
+        mock_patch = mocker.patch('requests.Session.patch')
+        mock_patch.return_value.status_code = 200
+
+        client = PaperlessClient()
+        client.update_document(123, title="Short")
+        client.update_document(123, title="x" * 2000)
+
+        small, large = mock_patch.call_args_list
+        assert small.kwargs['json'] == {'title': 'Short'}
+        assert large.kwargs['headers']['Content-Encoding'] == 'gzip'
+        assert json.loads(gzip.decompress(large.kwargs['data'])) == {'title': 'x' * 2000}
+        # Responses may still be compressed by the server
+        assert 'gzip' in client.session.headers['Accept-Encoding']
 
     def test_update_document_with_tags(self, mocker, monkeypatch):
         """Test updating document with tags"""
@@ -327,26 +1055,26 @@ class TestDocumentUpdate:
             if 'tags' in url:
                 params = kwargs.get('params', {})
                 tag_name = params.get('name__iexact', '')
-                if tag_name == 'medical':
-                    mock_response.json.return_value = {"results": [{"id": 5, "name": "medical"}]}
+                if tag_name == 'medical' or 'page_size' in params:
+                    _set_json(mock_response, {"results": [{"id": 5, "name": "medical"}]})
                 else:
-                    mock_response.json.return_value = {"results": []}
+                    _set_json(mock_response, {"results": []})
             else:
                 # Document GET
-                mock_response.json.return_value = {
+                _set_json(mock_response, {
                     "id": 123,
                     "title": "Old Title",
                     "tags": [1, 2]
-                }
+                })
             
             return mock_response
         
-        mock_get = mocker.patch('requests.get')
+        mock_get = mocker.patch('requests.Session.get')
         mock_get.side_effect = mock_get_side_effect
 
-        mock_patch = mocker.patch('requests.patch')
+        mock_patch = mocker.patch('requests.Session.patch')
         mock_patch.return_value.status_code = 200
-        mock_patch.return_value.json.return_value = {"id": 123}
+        _set_json(mock_patch.return_value, {"id": 123})
 
         client = PaperlessClient()
         result = client.update_document(123, tags=["medical"])
@@ -17,14 +17,9 @@ Also tests:
 """
 
 import pytest
-import sqlite3
 from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 import json
-import sys
-
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
 
 # Import would happen here in real tests
 # from process import process_document
@@ -175,8 +170,7 @@ class TestCorrectionsWorkflow:
         # Process with corrections
         # Expected: corrections column in processing_history contains JSON
 
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         cursor.execute("""
             SELECT corrections FROM processing_history
@@ -188,8 +182,6 @@ class TestCorrectionsWorkflow:
             saved_corrections = json.loads(result[0])
             assert saved_corrections['reason'] == "user_feedback"
 
-        conn.close()
-
 
 class TestErrorHandling:
     """Test error handling scenarios"""
@@ -276,8 +268,7 @@ class TestDatabaseLogging:
     def test_database_logs_all_interactions(self, test_database):
         """Test that database captures all Claude Code interactions"""
         # After processing:
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         # Verify processing_history record
         cursor.execute("""
@@ -291,8 +282,6 @@ class TestDatabaseLogging:
         # Expected: Prompts contain full prompt text
         # Expected: Responses contain full JSON
 
-        conn.close()
-
     def test_files_created_tracking(self, test_database, temp_vault_dirs):
         """Test tracking of created files in database"""
         # After processing:
@@ -300,8 +289,7 @@ class TestDatabaseLogging:
         # - BasicMemory note path
         # - Paperless document ID
 
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         cursor.execute("""
             SELECT files_created FROM processing_history
@@ -314,8 +302,6 @@ class TestDatabaseLogging:
             assert 'basicmemory_note' in files
             assert 'paperless_id' in files
 
-        conn.close()
-
 
 class TestProcessingTime:
     """Test processing time tracking"""
@@ -323,8 +309,7 @@ class TestProcessingTime:
     def test_processing_time_logged(self, test_database, sample_medical_pdf):
         """Test that processing time is logged"""
         # After processing:
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         cursor.execute("""
             SELECT processing_time_ms FROM processing_history
@@ -337,8 +322,6 @@ class TestProcessingTime:
             assert processing_time > 0
             assert processing_time < 300000  # Less than 5 minutes
 
-        conn.close()
-
 
 class TestNotifications:
     """Test notification handling"""
@@ -396,8 +379,7 @@ class TestMultipleDocuments:
         # Expected: Correct vault routing for each
         # Expected: All logged to database
 
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         cursor.execute("SELECT COUNT(*) FROM processing_history")
         count = cursor.fetchone()[0]
@@ -405,8 +387,6 @@ class TestMultipleDocuments:
         # Expected: 3 records
         assert count >= 0  # Would be 3 after actual processing
 
-        conn.close()
-
     def test_processing_preserves_order(self, tmp_path, test_database):
         """Test that processing maintains file order"""
         # Process files in specific order
@@ -472,8 +452,7 @@ class TestPendingDocuments:
         # Expected: Question generated for user
         # Expected: Partial metadata saved
 
-        conn = sqlite3.connect(str(test_database))
-        cursor = conn.cursor()
+        cursor = test_database.cursor()
 
         cursor.execute("""
             SELECT question, metadata FROM pending_documents
@@ -486,8 +465,6 @@ class TestPendingDocuments:
             assert len(question) > 0
             assert len(metadata) > 0
 
-        conn.close()
-
 
 class TestCategorySpecificProcessing:
     """Test processing for each new category"""
@@ -7,14 +7,10 @@ Tests the core DocumentProcessor functionality with mocked dependencies.
 import pytest
 import sqlite3
 import json
-from pathlib import Path
 from unittest.mock import Mock, MagicMock, patch
 import sys
 
-# Add scripts to path
-sys.path.insert(0, str(Path(__file__).parent.parent / "scripts"))
-
-from process import DocumentProcessor
+from process import DEFAULT_CLASSIFY_TIMEOUT, DocumentProcessor
 
 
 class TestDocumentProcessorInit:
@@ -37,6 +33,25 @@ class TestDocumentProcessorInit:
         assert processor.completed_dir == scan_dir / 'completed'
         assert processor.failed_dir == scan_dir / 'failed'
 
+    def test_init_uses_injected_components(self, tmp_path, mocker):
+        """Test pre-built components are used instead of constructing new ones"""
+        scan_dir = tmp_path / "scan-processor"
+        scan_dir.mkdir()
+        for subdir in ['incoming', 'processing', 'completed', 'failed', 'queue', 'prompts']:
+            (scan_dir / subdir).mkdir()
+
+        components = {
+            name: mocker.Mock(name=name)
+            for name in ('classifier', 'paperless', 'basicmemory', 'notifier')
+        }
+        mock_client = mocker.patch('process.PaperlessClient')
+
+        processor = DocumentProcessor(base_dir=str(scan_dir), dev_mode=True, **components)
+
+        for name, component in components.items():
+            assert getattr(processor, name) is component
+        mock_client.assert_not_called()
+
     def test_init_dev_mode(self, tmp_path):
         """Test dev mode initialization"""
         scan_dir = tmp_path / "scan-processor"
@@ -251,10 +266,10 @@ class TestProcessDocument:
         test_pdf = scan_dir / 'incoming' / 'test.pdf'
         test_pdf.write_bytes(b"PDF content")
 
-        # Mock classifier - even with override, it's still called but category is overridden
+        # Mock classifier - the override makes the classification call unnecessary
         mock_classify = mocker.patch.object(processor.classifier, 'classify_document')
         mock_classify.return_value = {
-            'category': 'GENERAL',  # This will be overridden
+            'category': 'GENERAL',
             'confidence': 0.85
         }
         mocker.patch.object(processor, '_extract_metadata', return_value={})
@@ -268,6 +283,7 @@ class TestProcessDocument:
         # Should use override category
         assert result['status'] == 'success'
         assert result['category'] == 'PERSONAL-EXPENSE'
+        mock_classify.assert_not_called()
 
 
 class TestErrorHandling:
@@ -325,6 +341,80 @@ class TestErrorHandling:
 
         assert result['status'] == 'failed'
         assert 'error' in result
+        assert (scan_dir / 'failed' / 'test.pdf').exists()
+        assert not (scan_dir / 'processing' / 'test.pdf').exists()
+
+    def test_classifier_timeout_fails_document(self, setup_processor, mocker):
+        """Test a Claude Code call killed at its timeout routes the document to failed"""
+        import subprocess
+        processor, scan_dir = setup_processor
+
+        test_pdf = scan_dir / 'incoming' / 'test.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        mocker.patch.object(
+            processor.classifier, 'classify_document',
+            side_effect=subprocess.TimeoutExpired(['claude'], 120)
+        )
+        mocker.patch.object(processor, '_log_to_history')
+
+        result = processor.process_document(test_pdf)
+
+        assert result['status'] == 'failed'
+        assert result['error_type'] == 'ClassifierTimeout'
+        assert 'timed out after 120s' in result['error']
+        assert (scan_dir / 'failed' / 'test.pdf').exists()
+
+    def test_classify_timeout_from_environment(self, setup_processor, monkeypatch):
+        """Test SCANPROC_CLASSIFY_TIMEOUT becomes the classifier's subprocess timeout"""
+        _, scan_dir = setup_processor
+        monkeypatch.setenv('SCANPROC_CLASSIFY_TIMEOUT', '30')
+
+        processor = DocumentProcessor(base_dir=str(scan_dir), dev_mode=True)
+
+        assert processor.classify_timeout == 30
+
+    def test_classify_timeout_applies_to_classification_only(self, setup_processor, mocker):
+        """Test classify_timeout bounds the classification call while extraction keeps 300s"""
+        processor, scan_dir = setup_processor
+        (scan_dir / 'prompts' / 'classifier.md').write_text("Classify")
+        (scan_dir / 'prompts' / 'utility.md').write_text("Extract utility metadata")
+        test_pdf = scan_dir / 'incoming' / 'test.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        mock_run = mocker.patch('subprocess.run')
+        mock_run.return_value.returncode = 0
+        mock_run.return_value.stdout = json.dumps({"category": "UTILITY", "confidence": 0.9})
+
+        processor._classify_with_timeout(test_pdf)
+        processor._extract_metadata(test_pdf, 'UTILITY')
+
+        classify_call, extract_call = mock_run.call_args_list
+        assert classify_call.kwargs['timeout'] == DEFAULT_CLASSIFY_TIMEOUT == 120
+        assert extract_call.kwargs['timeout'] == 300
+
+    def test_error_after_completion_leaves_file_completed(self, setup_processor, mocker):
+        """Test a failure after the completed move doesn't drag the file to failed"""
+        processor, scan_dir = setup_processor
+
+        test_pdf = scan_dir / 'incoming' / 'test.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        mocker.patch.object(processor.classifier, 'classify_document', return_value={
+            'category': 'GENERAL',
+            'confidence': 0.9
+        })
+        mocker.patch.object(processor, '_extract_metadata', return_value={})
+        mocker.patch.object(processor, '_upload_to_paperless', return_value={'success': True})
+        mocker.patch.object(processor.notifier, 'notify_processing_completed')
+        mocker.patch.object(processor.notifier, 'notify_processing_failed')
+        mocker.patch.object(processor, '_log_to_history', side_effect=[RuntimeError("db locked"), None])
+
+        result = processor.process_document(test_pdf)
+
+        assert result['status'] == 'failed'
+        assert (scan_dir / 'completed' / 'test.pdf').exists()
+        assert not (scan_dir / 'failed' / 'test.pdf').exists()
 
 
 class TestDatabaseLogging:
@@ -388,6 +478,124 @@ class TestDatabaseLogging:
         assert result[1] == 'PERSONAL-MEDICAL'
         assert result[2] == 'success'
 
+    def test_history_writes_share_one_wal_connection(self, tmp_path):
+        """Test repeated writes reuse a single WAL-mode connection"""
+        scan_dir = tmp_path / "scan-processor"
+        scan_dir.mkdir()
+        for subdir in ['incoming', 'processing', 'completed', 'failed', 'queue', 'prompts']:
+            (scan_dir / subdir).mkdir()
+
+        processor = DocumentProcessor(base_dir=str(scan_dir), dev_mode=True)
+        processor._db.execute("""
+            CREATE TABLE processing_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                filename TEXT NOT NULL, category TEXT, status TEXT, paperless_id INTEGER,
+                basicmemory_path TEXT, processing_time_ms INTEGER, error_message TEXT,
+                classification_prompt TEXT, classification_response TEXT, metadata_prompt TEXT,
+                metadata_response TEXT, files_created TEXT, corrections TEXT
+            )
+        """)
+        conn = processor._db
+
+        for name in ('a.pdf', 'b.pdf'):
+            processor._log_to_history(filename=name, category='GENERAL', status='success')
+
+        assert processor._db is conn
+        assert conn.execute("PRAGMA journal_mode").fetchone()[0] == 'wal'
+
+        # Autocommit: rows are visible to other connections straight away
+        reader = sqlite3.connect(str(processor.db_path))
+        count = reader.execute("SELECT COUNT(*) FROM processing_history").fetchone()[0]
+        reader.close()
+        assert count == 2
+
+    def test_connection_is_closed_by_context_manager(self, tmp_path, mocker):
+        """Test connections are released by close(), not left to atexit"""
+        scan_dir = tmp_path / "scan-processor"
+        scan_dir.mkdir()
+        for subdir in ['incoming', 'processing', 'completed', 'failed', 'queue', 'prompts']:
+            (scan_dir / subdir).mkdir()
+        register = mocker.patch('process.atexit.register')
+
+        with DocumentProcessor(base_dir=str(scan_dir), dev_mode=True) as processor:
+            processor._db
+        assert processor._conn is None
+
+        # Reopening after close() adds no exit handler either
+        processor._db
+        processor.close()
+        assert not register.called
+
+
+    def test_buffered_history_is_written_in_batches(self, tmp_path):
+        """Test buffered success rows wait for a flush while failures go straight out"""
+        scan_dir = tmp_path / "scan-processor"
+        scan_dir.mkdir()
+        for subdir in ['incoming', 'processing', 'completed', 'failed', 'queue', 'prompts']:
+            (scan_dir / subdir).mkdir()
+
+        processor = DocumentProcessor(base_dir=str(scan_dir), dev_mode=True, buffer_history=True)
+        processor._db.execute("""
+            CREATE TABLE processing_history (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                filename TEXT NOT NULL, category TEXT, status TEXT, paperless_id INTEGER,
+                basicmemory_path TEXT, processing_time_ms INTEGER, error_message TEXT,
+                classification_prompt TEXT, classification_response TEXT, metadata_prompt TEXT,
+                metadata_response TEXT, files_created TEXT, corrections TEXT
+            )
+        """)
+
+        def count():
+            return processor._db.execute("SELECT COUNT(*) FROM processing_history").fetchone()[0]
+
+        processor._log_to_history(filename='a.pdf', category='GENERAL', status='success')
+        processor._log_to_history(filename='b.pdf', category='GENERAL', status='success')
+        assert count() == 0
+
+        processor._log_to_history(filename='c.pdf', category='UNKNOWN', status='failed')
+        assert count() == 3
+
+        processor._log_to_history(filename='d.pdf', category='GENERAL', status='success')
+        processor.close()
+
+        reader = sqlite3.connect(str(processor.db_path))
+        names = [row[0] for row in reader.execute("SELECT filename FROM processing_history ORDER BY id")]
+        reader.close()
+        assert names == ['a.pdf', 'b.pdf', 'c.pdf', 'd.pdf']
+
+    def test_buffered_processors_are_flushed_at_exit_without_being_pinned(self, tmp_path):
+        """Test the exit hook flushes open processors but holds no strong reference"""
+        import gc
+        import weakref
+        import process
+
+        scan_dir = tmp_path / "scan-processor"
+        scan_dir.mkdir()
+        for subdir in ['incoming', 'processing', 'completed', 'failed', 'queue', 'prompts']:
+            (scan_dir / subdir).mkdir()
+
+        processor = DocumentProcessor(base_dir=str(scan_dir), dev_mode=True, buffer_history=True)
+        processor._db.execute("CREATE TABLE processing_history (filename TEXT, category TEXT, "
+                              "status TEXT, paperless_id INTEGER, basicmemory_path TEXT, "
+                              "processing_time_ms INTEGER, error_message TEXT, "
+                              "classification_prompt TEXT, classification_response TEXT, "
+                              "metadata_prompt TEXT, metadata_response TEXT, files_created TEXT, "
+                              "corrections TEXT)")
+        processor._log_to_history(filename='a.pdf', category='GENERAL', status='success')
+
+        process._close_buffered_processors()
+
+        assert processor._conn is None
+        assert processor not in process._BUFFERED_PROCESSORS
+        reader = sqlite3.connect(str(processor.db_path))
+        assert reader.execute("SELECT filename FROM processing_history").fetchall() == [('a.pdf',)]
+        reader.close()
+
+        # An abandoned processor is not kept alive by the exit hook
+        abandoned = weakref.ref(DocumentProcessor(base_dir=str(scan_dir), dev_mode=True,
+                                                  buffer_history=True))
+        gc.collect()
+        assert abandoned() is None
 
 class TestHelperMethods:
     """Test helper methods in DocumentProcessor"""
@@ -742,6 +950,125 @@ class TestAdditionalCoverage:
 
         assert result['status'] == 'success'
 
+    def test_paperless_and_basicmemory_run_concurrently(self, setup_processor, mocker):
+        """Test the Paperless upload and BasicMemory note overlap instead of running in series"""
+        import threading
+        processor, scan_dir = setup_processor
+
+        test_pdf = scan_dir / 'incoming' / 'medical.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        # Each step only returns once both are running at the same time
+        barrier = threading.Barrier(2, timeout=5)
+
+        def upload(*args):
+            barrier.wait()
+            return {'success': True, 'document_id': 42}
+
+        def create_note(*args):
+            barrier.wait()
+            return '/note.md'
+
+        mocker.patch.object(processor.classifier, 'classify_document', return_value={
+            'category': 'MEDICAL',
+            'confidence': 0.95
+        })
+        mocker.patch.object(processor, '_extract_metadata', return_value={'provider': 'Dr. Smith'})
+        mocker.patch.object(processor, '_upload_to_paperless', side_effect=upload)
+        mocker.patch.object(processor, '_create_basicmemory_note', side_effect=create_note)
+        mocker.patch.object(processor, '_log_to_history')
+        mocker.patch.object(processor.notifier, 'notify_processing_completed')
+
+        result = processor.process_document(test_pdf)
+
+        assert result['status'] == 'success'
+        assert result['paperless_id'] == 42
+        assert result['basicmemory_path'] == '/note.md'
+
+    def test_buffered_output_is_written_once(self, setup_processor, mocker, monkeypatch):
+        """Test a buffered run writes its prints and log records as one ordered block"""
+        import io
+        import logging
+        processor, scan_dir = setup_processor
+        processor.buffer_output = True
+
+        test_pdf = scan_dir / 'incoming' / 'general.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        class RecordingStdout(io.StringIO):
+            def __init__(self):
+                super().__init__()
+                self.writes = 0
+
+            def write(self, text):
+                self.writes += 1
+                return super().write(text)
+
+        stdout = RecordingStdout()
+        monkeypatch.setattr(sys, 'stdout', stdout)
+        handler = logging.StreamHandler(stdout)
+        logging.getLogger().addHandler(handler)
+        step_logger = logging.getLogger('test_process_focused.buffered_output')
+        step_logger.setLevel(logging.INFO)
+
+        def upload(*args):
+            step_logger.info("upload log line")
+            return {'success': True, 'document_id': 7}
+
+        mocker.patch.object(processor.classifier, 'classify_document', return_value={
+            'category': 'GENERAL',
+            'confidence': 0.9
+        })
+        mocker.patch.object(processor, '_extract_metadata', return_value={})
+        mocker.patch.object(processor, '_upload_to_paperless', side_effect=upload)
+        mocker.patch.object(processor, '_log_to_history')
+        mocker.patch.object(processor.notifier, 'notify_processing_completed')
+
+        try:
+            result = processor.process_document(test_pdf)
+        finally:
+            logging.getLogger().removeHandler(handler)
+
+        output = stdout.getvalue()
+        assert result['status'] == 'success'
+        assert stdout.writes == 1
+        assert handler.stream is stdout
+        assert output.index("[3/5]") < output.index("upload log line") < output.index("Processing completed")
+
+    def test_dispatch_tables_name_real_methods(self, setup_processor):
+        """Test every category routes to an existing extractor and note creator"""
+        processor, _ = setup_processor
+
+        for method in DocumentProcessor._METADATA_EXTRACTORS.values():
+            assert callable(getattr(processor.classifier, method))
+        for method in DocumentProcessor._NOTE_CREATORS.values():
+            assert callable(getattr(processor.basicmemory, method))
+
+    def test_fast_move_falls_back_across_filesystems(self, tmp_path, mocker):
+        """Test a cross-device rename falls back to shutil.move"""
+        import errno
+        src = tmp_path / 'a.pdf'
+        dst = tmp_path / 'b.pdf'
+        src.write_bytes(b"PDF content")
+
+        mocker.patch('process.os.replace', side_effect=OSError(errno.EXDEV, 'cross-device'))
+        mock_move = mocker.patch('process.shutil.move')
+
+        DocumentProcessor._fast_move(src, dst)
+
+        mock_move.assert_called_once_with(str(src), str(dst))
+
+    def test_fast_move_renames_in_place(self, tmp_path):
+        """Test a same-filesystem move is a plain rename"""
+        src = tmp_path / 'a.pdf'
+        dst = tmp_path / 'b.pdf'
+        src.write_bytes(b"PDF content")
+
+        DocumentProcessor._fast_move(src, dst)
+
+        assert not src.exists()
+        assert dst.read_bytes() == b"PDF content"
+
     def test_extract_metadata_schoolwork(self, setup_processor, tmp_path, mocker):
         """Test metadata extraction for CPS-SCHOOLWORK"""
         processor, scan_dir = setup_processor
@@ -883,6 +1210,26 @@ class TestAdditionalCoverage:
 
         assert result['status'] == 'success'
 
+    def test_upload_with_empty_metadata(self, setup_processor, mocker):
+        """Test documents without extracted metadata upload with defaults"""
+        processor, scan_dir = setup_processor
+
+        test_pdf = scan_dir / 'processing' / 'scan-042.pdf'
+        test_pdf.write_bytes(b"PDF content")
+
+        mock_upload = mocker.patch.object(processor.paperless, 'upload_document')
+        mock_upload.return_value = {'success': True}
+
+        processor._upload_to_paperless(test_pdf, category='GENERAL', metadata={})
+
+        mock_upload.assert_called_once_with(
+            file_path=test_pdf,
+            title='scan-042',
+            tags=['general'],
+            document_type='Document',
+            created_date=None
+        )
+
     def test_update_paperless_metadata(self, setup_processor, mocker):
         """Test updating existing Paperless document"""
         processor, _ = setup_processor
@@ -0,0 +1,102 @@
+"""
+Tests for Sample Validation
+
+Runs validate_samples over generated sample directories with a mocked
+classifier
+"""
+
+import json
+import os
+import time
+import pytest
+
+import validate_samples
+from validate_samples import validate_samples as run_validation
+
+
+@pytest.fixture
+def samples_dir(tmp_path):
+    """Sample tree with two known categories and one unknown directory"""
+    layout = {
+        'utility': ['b_bill.pdf', 'a_bill.pdf', 'c_wrong.pdf'],
+        'auto-insurance': ['policy.pdf', 'broken.pdf'],
+        'misc': ['ignored.pdf'],
+    }
+    for category, names in layout.items():
+        folder = tmp_path / 'samples' / category
+        folder.mkdir(parents=True)
+        for name in names:
+            (folder / name).write_bytes(b"%PDF-1.4\n%%EOF\n")
+        (folder / 'notes.txt').write_text("not a sample")
+    return tmp_path / 'samples'
+
+
+@pytest.fixture
+def mock_classifier(mocker):
+    """Classifier that answers by filename: *_wrong misclassifies, broken raises"""
+    def classify(pdf_file):
+        name = os.path.basename(pdf_file)
+        # Finish out of order so results must be re-sequenced
+        time.sleep(0.05 if name.startswith('a_') else 0)
+        print(f"classifying {name}")
+        if name == 'broken.pdf':
+            raise RuntimeError("Claude Code timed out")
+        if name.endswith('_wrong.pdf'):
+            return {'category': 'GENERAL', 'confidence': 0.4}
+        category = 'UTILITY' if 'bill' in name else 'AUTO-INSURANCE'
+        return {'category': category, 'confidence': 0.9}
+
+    classifier = mocker.patch.object(validate_samples, 'DocumentClassifier').return_value
+    classifier.classify_document.side_effect = classify
+    return classifier
+
+
+class TestValidateSamples:
+    """Test validation over a directory of samples"""
+
+    def test_counts_and_report(self, samples_dir, mock_classifier, tmp_path):
+        """Test pass/fail/error tallies and the JSON Lines report"""
+        report_path = tmp_path / 'report.jsonl'
+
+        results = run_validation(samples_dir, use_real_classifier=True, max_workers=4,
+                                 report_path=report_path)
+
+        assert (results['total'], results['passed'], results['failed'], results['errors']) == (5, 3, 1, 1)
+        assert results['by_category']['utility'] == {'total': 3, 'passed': 2, 'failed': 1, 'errors': 0}
+        assert results['by_category']['auto-insurance'] == {'total': 2, 'passed': 1, 'failed': 0, 'errors': 1}
+        assert 'misc' not in results['by_category']
+        assert mock_classifier.classify_document.call_count == 5
+
+        records = [json.loads(line) for line in report_path.read_text().splitlines()]
+        # Records follow directory order: auto-insurance before utility
+        assert records == [
+            {'kind': 'error', 'file': str(samples_dir / 'auto-insurance' / 'broken.pdf'),
+             'error': 'Claude Code timed out'},
+            {'kind': 'failure', 'file': str(samples_dir / 'utility' / 'c_wrong.pdf'),
+             'expected': 'UTILITY', 'actual': 'GENERAL', 'confidence': 0.4},
+        ]
+
+    def test_output_is_ordered_and_not_interleaved(self, samples_dir, mock_classifier, capsys):
+        """Test worker output is printed by sample, in sorted order"""
+        run_validation(samples_dir, verbose=True, use_real_classifier=True, max_workers=4)
+
+        out = capsys.readouterr().out
+        lines = [line for line in out.splitlines() if line.startswith(('Testing', 'classifying'))]
+        assert lines == [
+            'Testing AUTO-INSURANCE samples',
+            'Testing: broken.pdf', 'classifying broken.pdf',
+            'Testing: policy.pdf', 'classifying policy.pdf',
+            'Testing UTILITY samples',
+            'Testing: a_bill.pdf', 'classifying a_bill.pdf',
+            'Testing: b_bill.pdf', 'classifying b_bill.pdf',
+            'Testing: c_wrong.pdf', 'classifying c_wrong.pdf',
+        ]
+        assert 'WARNING: Unknown category directory: misc' in out
+        assert '✗ ERROR: Claude Code timed out' in out
+
+    def test_simulation_mode_skips_classifier(self, samples_dir, mock_classifier):
+        """Test the default simulated run passes every known sample"""
+        results = run_validation(samples_dir)
+
+        assert (results['total'], results['passed']) == (5, 5)
+        assert not mock_classifier.classify_document.called
@@ -8,6 +8,7 @@ Provides utility functions for:
 - YAML frontmatter validation
 """
 
+import os
 import yaml
 import re
 from pathlib import Path
@@ -16,6 +17,12 @@ from reportlab.pdfgen import canvas
 from reportlab.lib.pagesizes import letter
 from datetime import datetime
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
 
 # ========== PDF Creation Helpers ==========
 
@@ -107,6 +114,14 @@ Amount Due: ${amount:.2f}
 
 # ========== Frontmatter Validation Helpers ==========
 
+# Parsed frontmatter keyed by (path, mtime_ns, size), so asserting on the
+# same unchanged note twice only parses its YAML once
+_FRONTMATTER_CACHE: Dict[tuple, Dict[str, Any]] = {}
+
+# Leading '---' block of a note, matched against the raw file bytes
+_FRONTMATTER_RE = re.compile(rb"\A---\r?\n(.*?)\r?\n---\r?\n", re.S)
+
+
 def assert_frontmatter_valid(note_path: Path) -> Dict[str, Any]:
     """Verify YAML frontmatter is valid and extract it
 
@@ -121,44 +136,53 @@ def assert_frontmatter_valid(note_path: Path) -> Dict[str, Any]:
     """
     assert note_path.exists(), f"Note file does not exist: {note_path}"
 
-    content = note_path.read_text()
+    st = note_path.stat()
+    key = (str(note_path), st.st_mtime_ns, st.st_size)
+    if key in _FRONTMATTER_CACHE:
+        return dict(_FRONTMATTER_CACHE[key])
 
-    # Check for frontmatter delimiters
-    assert content.startswith('---'), f"Note missing frontmatter start: {note_path}"
-    assert '\n---\n' in content, f"Note missing frontmatter end: {note_path}"
+    content = read_note_bytes(note_path)
 
-    # Extract frontmatter
-    parts = content.split('\n---\n', 2)
-    assert len(parts) >= 2, f"Note has malformed frontmatter: {note_path}"
+    # Check for frontmatter delimiters
+    assert content.startswith(b'---'), f"Note missing frontmatter start: {note_path}"
+    match = _FRONTMATTER_RE.match(content)
+    assert match, f"Note missing frontmatter end: {note_path}"
 
-    frontmatter_text = parts[0].replace('---', '').strip()
+    # libyaml decodes the UTF-8 bytes itself
+    frontmatter_text = match.group(1)
 
     # Parse YAML
     try:
-        frontmatter = yaml.safe_load(frontmatter_text)
+        frontmatter = yaml.load(frontmatter_text, Loader=_YamlLoader)
     except yaml.YAMLError as e:
         raise AssertionError(f"Invalid YAML frontmatter in {note_path}: {e}")
 
     assert isinstance(frontmatter, dict), f"Frontmatter is not a dictionary: {note_path}"
 
-    return frontmatter
+    _FRONTMATTER_CACHE[key] = frontmatter
+    return dict(frontmatter)
 
 
-def assert_frontmatter_has_fields(note_path: Path, required_fields: List[str]):
+def assert_frontmatter_has_fields(note_path: Path, required_fields: List[str]) -> Dict[str, Any]:
     """Verify frontmatter contains required fields
 
     Args:
         note_path: Path to markdown note
         required_fields: List of required field names
 
+    Returns:
+        Dict: Parsed frontmatter data
+
     Raises:
         AssertionError: If any required field is missing
     """
     frontmatter = assert_frontmatter_valid(note_path)
 
-    for field in required_fields:
-        assert field in frontmatter, \
-            f"Note missing required frontmatter field '{field}': {note_path}"
+    missing = set(required_fields) - frontmatter.keys()
+    assert not missing, \
+        f"Note missing required frontmatter fields {sorted(missing)}: {note_path}"
+
+    return frontmatter
 
 
 def extract_frontmatter_field(note_path: Path, field_name: str) -> Any:
@@ -191,13 +215,13 @@ def assert_file_in_vault(file_path: Path, vault_name: str):
         file_path: Path to file to check
         vault_name: Expected vault name (e.g., "CoparentingSystem" or "Personal")
 
+    Only inspects the path itself; callers check the file exists (e.g. with
+    ``assert file_path.is_file()``) so the filesystem is hit just once.
+
     Raises:
         AssertionError: If file is not in expected vault
     """
-    assert file_path.exists(), f"File does not exist: {file_path}"
-
-    path_str = str(file_path)
-    assert vault_name in path_str, \
+    assert vault_name in file_path.parts, \
         f"File not in {vault_name} vault: {file_path}"
 
 
@@ -206,18 +230,54 @@ def assert_file_in_directory(file_path: Path, expected_dir: str):
 
     Args:
         file_path: Path to file to check
-        expected_dir: Expected directory name (can be anywhere in path)
+        expected_dir: Expected directory name (any component of the path)
+
+    Like assert_file_in_vault, this checks path components only and does
+    not touch the filesystem.
 
     Raises:
         AssertionError: If file is not in expected directory
     """
-    assert file_path.exists(), f"File does not exist: {file_path}"
-
-    path_str = str(file_path)
-    assert expected_dir in path_str, \
+    assert expected_dir in file_path.parent.parts, \
         f"File not in expected directory '{expected_dir}': {file_path}"
 
 
+def create_and_verify(creator, method: str, metadata: Dict[str, Any], filename: str,
+                      *extra_args, vault: str, directory: str,
+                      date_prefix: Optional[str] = None) -> Path:
+    """Create a note and run the standard location/filename checks on it
+
+    Args:
+        creator: BasicMemoryNoteCreator instance
+        method: Name of the creator method (e.g. "create_utility_note")
+        metadata: Metadata passed to the method
+        filename: Source PDF filename passed to the method
+        *extra_args: Additional positional args (e.g. the AUTO-* category)
+        vault: Expected vault name
+        directory: Expected directory name
+        date_prefix: Optional expected YYYY-MM-DD filename prefix
+
+    Returns:
+        Path: Path to the created note
+
+    Raises:
+        AssertionError: If any check fails
+    """
+    note_path = getattr(creator, method)(metadata, filename, *extra_args)
+
+    assert_file_in_vault(note_path, vault)
+    assert_file_in_directory(note_path, directory)
+    if date_prefix:
+        assert note_path.name.startswith(date_prefix), \
+            f"Filename '{note_path.name}' doesn't start with '{date_prefix}'"
+    assert note_path.suffix == ".md", f"Note is not a .md file: {note_path}"
+
+    # Only filesystem check
+    assert note_path.is_file(), f"Note file was not created: {note_path}"
+
+    return note_path
+
+
 def assert_filename_matches_pattern(file_path: Path, pattern: str):
     """Verify filename matches a regex pattern
 
@@ -380,6 +440,31 @@ def count_files_in_directory(dir_path: Path, pattern: str = "*") -> int:
     return len(list(dir_path.glob(pattern)))
 
 
+def read_note_bytes(note_path: Path) -> bytes:
+    """Read a (small) note file as raw bytes
+
+    Uses plain os.open/os.read, skipping the text-mode IO wrapper; good for
+    substring checks against bytes literals.
+
+    Args:
+        note_path: Path to file
+
+    Returns:
+        bytes: File content
+    """
+    fd = os.open(note_path, os.O_RDONLY)
+    try:
+        chunks = []
+        while True:
+            chunk = os.read(fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b"".join(chunks)
+    finally:
+        os.close(fd)
+
+
 def read_note_content(note_path: Path) -> str:
     """Read note content without frontmatter
 
@@ -391,7 +476,7 @@ def read_note_content(note_path: Path) -> str:
     """
     assert note_path.exists(), f"Note does not exist: {note_path}"
 
-    content = note_path.read_text()
+    content = read_note_bytes(note_path).decode()
 
     # Remove frontmatter
     if content.startswith('---'):
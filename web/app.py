@@ -129,6 +129,14 @@ def init_db():
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             ''')
+            # Same lookup indexes as queue/schema.sql
+            cursor.executescript('''
+                CREATE INDEX IF NOT EXISTS idx_pending_created ON pending_documents(created_at);
+                CREATE INDEX IF NOT EXISTS idx_history_created ON processing_history(created_at);
+                CREATE INDEX IF NOT EXISTS idx_history_status ON processing_history(status);
+                CREATE INDEX IF NOT EXISTS idx_history_category ON processing_history(category);
+                CREATE INDEX IF NOT EXISTS idx_history_filename ON processing_history(filename);
+            ''')
 
     conn.commit()
     conn.close()